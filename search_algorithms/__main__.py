@@ -12,22 +12,87 @@ Usage:
 Commands:
     /start        - Start the interactive program (default)
     /end          - Exit the program
-    /history      - Show search history
+    /history      - Show search history (--limit, --offset, --tail,
+                    --method, --question, --found)
     /clearresult  - Clear the last search result
+    /stats        - Step statistics per question and method (--by,
+                    --method, --question, --found)
+    /batch KEY    - Look up many targets in one question (--targets, --targets-file)
+    /bench        - Benchmark the algorithms (--sizes, --distributions, --json)
+    /convert      - Convert questions.json to the memory-mapped binary format
+    /compare-all  - Run every algorithm on every question in parallel (--targets)
+    /replay ID    - Replay the recorded step trace of a result (--speed, --last)
+    /run          - Answer one query without prompts (--question, --algo,
+                    --target, --json), or NDJSON requests from --stdin
+    /serve        - Local HTTP query service (--host, --port)
+    /file PATH    - Search a data file without loading it (--target), or
+                    write it as a sorted .i64 file for binary search (--sort-to)
+    --bloom [P]   - Bloom-filter each list (false-positive rate P, default 0.01)
+                    so targets that are definitely absent skip the search
+    --result-cache MODE
+                  - Replay repeated queries in /start from a result cache:
+                    memory (default), disk (kept between sessions) or off
+    --profile     - Time every phase (sort, build, search, render, persist)
+                    and print the breakdown and cProfile output at exit
     -h, --help    - Show help message
     -v, --version - Show version
 """
 
 import sys
+import json
+import time
 import argparse
+import importlib
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from search_algorithms.utils import load_questions, show_history, clear_last_result
-from search_algorithms.cli.commands import process_main_menu
 from search_algorithms import __version__
+from search_algorithms.config import QUESTIONS_FILE as DEFAULT_QUESTIONS_FILE
+
+# (label, seconds) for every timed startup phase, shown by --profile-startup
+_startup_timings = []
+
+
+def _timed(label, func, *args):
+    """Call func(*args), recording how long it took under label."""
+    start = time.perf_counter()
+    result = func(*args)
+    _startup_timings.append((label, time.perf_counter() - start))
+    return result
+
+
+def _import(module):
+    """Import a module on demand, timing it for --profile-startup."""
+    return _timed(f"import {module}", importlib.import_module, module)
+
+
+def _print_startup_profile():
+    """Print the startup phase timings collected so far."""
+    print("\n" + "-"*60)
+    print(" STARTUP PROFILE")
+    print("-"*60)
+    total = 0.0
+    for label, seconds in _startup_timings:
+        total += seconds
+        print(f"  {label:<44} {seconds * 1000:>9.2f} ms")
+    print(f"  {'total':<44} {total * 1000:>9.2f} ms")
+    print("-"*60)
+
+
+def _load_questions_or_exit(questions_file=None):
+    """Load the questions file (JSON or binary), exiting with an error message if it is unusable."""
+    utils = _import("search_algorithms.utils")
+    questions_file = questions_file or DEFAULT_QUESTIONS_FILE
+    questions = _timed("load questions (key index)", utils.load_questions, str(questions_file))
+    
+    if not questions:
+        print(f"\n❌ Error: Could not load {Path(questions_file).name}")
+        print(f"   Expected file at: {questions_file}")
+        sys.exit(1)
+    
+    return questions
 
 
 def main():
@@ -42,7 +107,29 @@ Examples:
   %(prog)s                    # Start interactive mode
   %(prog)s /start             # Start interactive mode
   %(prog)s /history           # Show search history
+  %(prog)s /history --tail 20 --method binary --found no
   %(prog)s /clearresult       # Clear last search result
+  %(prog)s /stats --question Q11 --method binary
+  %(prog)s /stats --by method
+  %(prog)s /batch Q5 --targets 100,175,300
+  %(prog)s /batch Q5 --targets-file targets.txt   # or --targets-file - for stdin
+  %(prog)s /bench --sizes 10,1000,100000 --json bench.json
+  %(prog)s /convert           # data/questions.json -> data/questions.bin
+  %(prog)s --questions data/questions.bin   # Start with the binary dataset
+  %(prog)s /compare-all --targets 7,42,1000 --workers 4
+  %(prog)s /compare-all --targets 5,500 --generate 200 --size 10000
+  %(prog)s /replay 3f9a1c2b7e --speed 4 --last 10
+  %(prog)s /run --question Q3 --algo binary --target 9 --json
+  %(prog)s /run --stdin < queries.ndjson   # {"question": "Q3", "algo": "auto", "target": 9}
+  %(prog)s /serve --port 8765  # then: curl 'localhost:8765/search?question=Q3&target=9'
+  %(prog)s /file data.csv --target 42        # Stream through a text/CSV file
+  %(prog)s /file data.csv --sort-to data.i64  # Sort once on disk, then:
+  %(prog)s /file data.i64 --target 42        # Binary search the file via mmap
+  %(prog)s --profile-startup  # Show import and load timings
+  %(prog)s /bench --profile   # Per-phase breakdown and cProfile output at exit
+  %(prog)s /run --stdin --bloom 0.001 < queries.ndjson   # Misses skip the search
+  %(prog)s /start --profile-memory   # Also record peak memory in each result
+  %(prog)s /start --result-cache disk  # Keep repeated-query results between sessions
   %(prog)s -v                 # Show version
         """
     )
@@ -51,9 +138,133 @@ Examples:
         'command',
         nargs='?',
         default='/start',
-        help='Command: /start (default), /end, /history, /clearresult'
+        help='Command: /start (default), /end, /history, /clearresult, /stats, /batch, /bench, /convert, /compare-all, /replay, /run, /serve, /file'
     )
     
+    parser.add_argument(
+        'params',
+        nargs='*',
+        help='Command arguments (e.g. the question key for /batch)'
+    )
+    
+    parser.add_argument(
+        '--profile-startup',
+        action='store_true',
+        help='Report import and question-loading timings'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print a per-phase timing breakdown and cProfile output at exit'
+    )
+    
+    parser.add_argument(
+        '--profile-memory',
+        action='store_true',
+        help='Trace allocations so results record peak memory (implies --profile)'
+    )
+    
+    parser.add_argument(
+        '--bloom',
+        nargs='?',
+        type=float,
+        const=0.01,
+        default=None,
+        metavar='FP_RATE',
+        help='Check a per-list Bloom filter before every search (default rate: 0.01)'
+    )
+    
+    parser.add_argument(
+        '--result-cache',
+        choices=('memory', 'disk', 'off'),
+        default='memory',
+        help='Replay repeated queries from a cache: memory (default), disk or off'
+    )
+    
+    parser.add_argument(
+        '--questions',
+        default=None,
+        help='Questions file: JSON or binary dataset (default: data/questions.json)'
+    )
+    
+    batch = parser.add_argument_group("batch options (/batch)")
+    batch.add_argument('--targets', default=None,
+                       help='Comma or space separated targets')
+    batch.add_argument('--targets-file', default=None,
+                       help='File with targets, or - to read stdin')
+    
+    compare = parser.add_argument_group("compare-all options (/compare-all, uses --targets)")
+    compare.add_argument('--workers', type=int, default=None,
+                         help='Worker processes (default: CPU count)')
+    compare.add_argument('--chunksize', type=int, default=None,
+                         help='Questions per task submitted to the pool')
+    compare.add_argument('--generate', type=int, default=None,
+                         help='Use N generated arrays instead of the questions file')
+    compare.add_argument('--size', type=int, default=1000,
+                         help='Size of each generated array (default: 1000)')
+    compare.add_argument('--distribution', default='uniform',
+                         help='Distribution of generated arrays (default: uniform)')
+    
+    replay = parser.add_argument_group("replay options (/replay)")
+    replay.add_argument('--speed', type=float, default=None,
+                        help='Steps per second (default: instant)')
+    replay.add_argument('--last', type=int, default=None,
+                        help='Replay only the last K steps')
+    
+    bench = parser.add_argument_group("benchmark options (/bench)")
+    bench.add_argument('--sizes', default='10,1000,100000',
+                       help='Comma separated array sizes (default: 10,1000,100000)')
+    bench.add_argument('--distributions', default='uniform,skewed,duplicates,sorted,reverse',
+                       help='Comma separated distributions')
+    bench.add_argument('--repeat', type=int, default=5,
+                       help='Timed passes over the targets (default: 5)')
+    bench.add_argument('--warmup', type=int, default=1,
+                       help='Untimed warmup passes (default: 1)')
+    bench.add_argument('--queries', type=int, default=100,
+                       help='Targets per dataset (default: 100)')
+    bench.add_argument('--seed', type=int, default=0,
+                       help='Random seed (default: 0)')
+    bench.add_argument('--json', dest='json_path', nargs='?', const='-', default=None,
+                       help='Also write results as JSON to this file (no file: JSON '
+                            'to stdout; for /run: print the result as JSON)')
+    
+    run = parser.add_argument_group("run options (/run, uses --question and --json)")
+    run.add_argument('--algo', default='auto',
+                     help='Algorithm key or name, or auto (default: auto)')
+    run.add_argument('--target', type=int, default=None,
+                     help='Value to search for')
+    run.add_argument('--stdin', action='store_true',
+                     help='Read newline-delimited JSON requests from stdin')
+    run.add_argument('--no-log', action='store_true',
+                     help='Do not write results to the history log')
+    
+    serve = parser.add_argument_group("server options (/serve)")
+    serve.add_argument('--host', default='127.0.0.1',
+                       help='Interface to bind (default: 127.0.0.1)')
+    serve.add_argument('--port', type=int, default=8765,
+                       help='TCP port (default: 8765)')
+    
+    files = parser.add_argument_group("file options (/file, uses --target)")
+    files.add_argument('--sort-to', default=None,
+                       help='Write the file\'s integers, sorted, to this .i64 file')
+    
+    history = parser.add_argument_group("history options (/history, /stats)")
+    history.add_argument('--limit', type=int, default=None,
+                         help='Show at most N entries')
+    history.add_argument('--offset', type=int, default=0,
+                         help='Skip the first N matching entries')
+    history.add_argument('--tail', type=int, default=None,
+                         help='Show only the last N matching entries')
+    history.add_argument('--method', default=None,
+                         help='Filter by method (e.g. "binary")')
+    history.add_argument('--question', default=None,
+                         help='Filter by question label (e.g. Q3)')
+    history.add_argument('--found', choices=['yes', 'no'], default=None,
+                         help='Filter by search result')
+    history.add_argument('--by', choices=['question', 'method', 'both'], default='both',
+                         help='Grouping for /stats (default: both)')
+    
     parser.add_argument(
         '-v', '--version',
         action='version',
@@ -63,6 +274,16 @@ Examples:
     args = parser.parse_args()
     command = args.command.lower()
     
+    if args.profile or args.profile_memory:
+        _import("search_algorithms.utils.profiling").start_profiling(memory=args.profile_memory)
+    
+    if args.bloom is not None:
+        try:
+            _import("search_algorithms.core.bloom").enable_bloom(args.bloom)
+        except ValueError as e:
+            print(f"\n❌ {e}")
+            sys.exit(1)
+    
     # Handle commands
     if command == '/start':
         print("\n" + "="*60)
@@ -71,16 +292,15 @@ Examples:
         print(" Interactive Mode Started")
         print("="*60)
         
-        # Load questions from data directory
-        questions_file = Path(__file__).parent.parent / "data" / "questions.json"
-        questions = load_questions(str(questions_file))
-        
-        if not questions:
-            print("\n❌ Error: Could not load questions.json")
-            print(f"   Expected file at: {questions_file}")
-            sys.exit(1)
-        
-        process_main_menu(questions)
+        # Load questions from data directory (arrays are parsed on selection)
+        questions = _load_questions_or_exit(args.questions)
+        # Cached results are dropped whenever the questions file changes
+        _import("search_algorithms.core.result_cache").configure_result_cache(
+            args.result_cache, str(args.questions or DEFAULT_QUESTIONS_FILE))
+        commands = _import("search_algorithms.cli.commands")
+        if args.profile_startup:
+            _print_startup_profile()
+        commands.process_main_menu(questions)
         
     elif command == '/end':
         print("\n" + "="*60)
@@ -89,10 +309,198 @@ Examples:
         sys.exit(0)
         
     elif command == '/history':
-        show_history()
+        _import("search_algorithms.utils").show_history(
+            limit=args.limit,
+            offset=args.offset,
+            tail=args.tail,
+            method=args.method,
+            question=args.question,
+            found=args.found,
+        )
         
     elif command == '/clearresult':
-        clear_last_result()
+        _import("search_algorithms.utils").clear_last_result()
+        
+    elif command == '/stats':
+        _import("search_algorithms.utils").show_stats(
+            by=args.by,
+            method=args.method,
+            question=args.question,
+            found=args.found,
+        )
+        
+    elif command == '/batch':
+        if len(args.params) != 1:
+            print("\n❌ Usage: /batch KEY --targets 1,2,3  (or --targets-file FILE)")
+            sys.exit(1)
+        
+        utils = _import("search_algorithms.utils")
+        if args.targets is not None:
+            targets = utils.convert_num(args.targets)
+        elif args.targets_file is not None:
+            try:
+                targets = utils.read_targets(args.targets_file)
+            except OSError as e:
+                print(f"\n❌ Could not read {args.targets_file}: {e.strerror or e}")
+                sys.exit(1)
+        else:
+            targets = None
+        
+        if not targets:
+            print("\n❌ Provide integer targets with --targets or --targets-file")
+            sys.exit(1)
+        
+        key = args.params[0]
+        questions = _load_questions_or_exit(args.questions)
+        if key not in questions:
+            print(f"\n❌ Invalid key: {key}")
+            sys.exit(1)
+        
+        _import("search_algorithms.cli.commands").run_batch(questions[key], key, targets)
+        
+    elif command == '/bench':
+        from search_algorithms.bench import run_benchmark, print_report, write_json
+        from search_algorithms.utils import convert_num
+        
+        sizes = convert_num(args.sizes)
+        distributions = [d for d in args.distributions.replace(",", " ").split()]
+        if not sizes or not distributions:
+            print("\n❌ Provide --sizes and --distributions as comma separated lists")
+            sys.exit(1)
+        
+        settings = dict(
+            sizes=sizes,
+            distributions=distributions,
+            repeat=args.repeat,
+            warmup=args.warmup,
+            queries=args.queries,
+            seed=args.seed,
+        )
+        try:
+            rows = run_benchmark(**settings)
+        except ValueError as e:
+            print(f"\n❌ {e}")
+            sys.exit(1)
+        
+        if args.json_path != '-':
+            print_report(rows)
+        if args.json_path == '-':
+            write_json(rows, '-', **settings)
+        elif args.json_path:
+            write_json(rows, args.json_path, **settings)
+            print(f"\nResults written to {args.json_path}")
+        
+    elif command == '/convert':
+        from search_algorithms.utils import convert_json_to_binary
+        
+        if len(args.params) > 2:
+            print("\n❌ Usage: /convert [SOURCE.json] [DEST.bin]")
+            sys.exit(1)
+        
+        source = args.params[0] if args.params else str(DEFAULT_QUESTIONS_FILE)
+        destination = args.params[1] if len(args.params) > 1 else None
+        try:
+            destination, count = convert_json_to_binary(source, destination)
+        except (OSError, ValueError) as e:
+            print(f"\n❌ Conversion failed: {e}")
+            sys.exit(1)
+        
+        print(f"\n✓ Wrote {count} questions to {destination}")
+        print(f"  Use it with: --questions {destination}")
+        
+    elif command == '/compare-all':
+        utils = _import("search_algorithms.utils")
+        targets = utils.convert_num(args.targets) if args.targets else None
+        if not targets:
+            print("\n❌ Provide integer targets with --targets")
+            sys.exit(1)
+        
+        if args.generate:
+            import random
+            from search_algorithms.bench import generate_array
+            
+            rng = random.Random(args.seed)
+            try:
+                questions = {
+                    f"G{i + 1}": generate_array(args.size, args.distribution, rng)
+                    for i in range(args.generate)
+                }
+            except ValueError as e:
+                print(f"\n❌ {e}")
+                sys.exit(1)
+        else:
+            questions = _load_questions_or_exit(args.questions)
+        
+        _import("search_algorithms.cli.commands").run_compare_all(
+            questions, targets, workers=args.workers, chunksize=args.chunksize
+        )
+        
+    elif command == '/replay':
+        if len(args.params) != 1:
+            print("\n❌ Usage: /replay ID [--speed N] [--last K]")
+            sys.exit(1)
+        
+        commands = _import("search_algorithms.cli.commands")
+        if not commands.run_replay(args.params[0], speed=args.speed, last=args.last):
+            sys.exit(1)
+        
+    elif command in ('/run', 'run'):
+        runner_module = _import("search_algorithms.cli.runner")
+        questions = _load_questions_or_exit(args.questions)
+        runner = runner_module.QueryRunner(questions, log=not args.no_log)
+        
+        if args.stdin:
+            _, failed = runner.run_stream(sys.stdin)
+            sys.exit(1 if failed else 0)
+        
+        if args.question is None or args.target is None:
+            print("\n❌ Usage: /run --question KEY --target N [--algo NAME] [--json]"
+                  "  (or /run --stdin)")
+            sys.exit(1)
+        
+        try:
+            result = runner.run({"question": args.question, "algo": args.algo,
+                                 "target": args.target})
+        except runner_module.QueryError as e:
+            if args.json_path is not None:
+                print(json.dumps({"error": str(e)}))
+            else:
+                print(f"\n❌ {e}")
+            sys.exit(1)
+        finally:
+            runner.flush()
+        
+        if args.json_path is not None:
+            print(json.dumps(result))
+        else:
+            print(runner_module.format_result(result))
+        
+    elif command == '/serve':
+        server = _import("search_algorithms.cli.server")
+        questions = _load_questions_or_exit(args.questions)
+        if args.profile_startup:
+            _print_startup_profile()
+        server.run_server(questions, host=args.host, port=args.port)
+        
+    elif command == '/file':
+        if len(args.params) != 1 or (args.target is None) == (args.sort_to is None):
+            print("\n❌ Usage: /file PATH --target N   or   /file PATH --sort-to OUT.i64")
+            sys.exit(1)
+        
+        if args.sort_to:
+            from search_algorithms.core.external import sort_to_fixed_width
+            
+            try:
+                count = sort_to_fixed_width(args.params[0], args.sort_to)
+            except (OSError, ValueError) as e:
+                print(f"\n❌ Sorting failed: {e}")
+                sys.exit(1)
+            print(f"\n✓ Wrote {count:,} sorted values to {args.sort_to}")
+            print(f"  Search it with: /file {args.sort_to} --target N")
+        else:
+            commands = _import("search_algorithms.cli.commands")
+            if commands.run_file_search(args.params[0], args.target) is None:
+                sys.exit(1)
         
     else:
         print(f"\n❌ Unknown command: {command}")
@@ -101,8 +509,20 @@ Examples:
         print("  /end          - Exit the program")
         print("  /history      - Show search history")
         print("  /clearresult  - Clear the last search result")
+        print("  /stats        - Step statistics per question and method")
+        print("  /batch KEY    - Look up many targets in one question")
+        print("  /bench        - Benchmark the algorithms")
+        print("  /convert      - Convert questions.json to the binary format")
+        print("  /compare-all  - Run every algorithm on every question in parallel")
+        print("  /replay ID    - Replay the recorded trace of a result")
+        print("  /run          - Answer queries without prompts (JSON output)")
+        print("  /serve        - Local HTTP query service")
+        print("  /file PATH    - Search a data file without loading it")
         print("\nUse -h or --help for more information")
         sys.exit(1)
+    
+    if args.profile_startup and command not in ('/start', '/serve'):
+        _print_startup_profile()
 
 
 if __name__ == "__main__":
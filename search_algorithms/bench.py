@@ -0,0 +1,305 @@
+"""
+Benchmark suite for the search algorithms.
+
+Generates arrays of configurable size and distribution, runs every algorithm
+silently (no step tracing) with warmup and repeated timing, and reports wall
+time, throughput, step counts and latency percentiles.
+
+Usage:
+    >>> from search_algorithms.bench import run_benchmark, print_report
+    >>> results = run_benchmark(sizes=[1000], distributions=["uniform"])
+    >>> print_report(results)
+
+or from the command line:
+
+    search-algorithms /bench --sizes 10,1000,100000 --json bench.json
+"""
+
+import json
+import platform
+import random
+import sys
+import time
+
+from .core.registry import list_algorithms, run_algorithm
+from .core.sorted_index import SortedIndex
+from .core.hash_index import HashIndex
+from .core.numpy_engine import HAVE_NUMPY, NumpyDataset
+
+DISTRIBUTIONS = ("uniform", "skewed", "duplicates", "sorted", "reverse")
+DEFAULT_SIZES = (10, 1000, 100000)
+DEFAULT_DISTRIBUTIONS = DISTRIBUTIONS
+
+
+def _prepare_none(arr):
+    return None
+
+
+def _prepare_sorted(arr):
+    return SortedIndex.build(arr)
+
+
+def _prepare_hash(arr):
+    return HashIndex.build(arr)
+
+
+def _registry_runner(algorithm):
+    def run(arr, target, prepared):
+        return run_algorithm(algorithm, arr, target, index=prepared, hash_index=prepared)
+    return run
+
+
+def _prepare_numpy(arr):
+    dataset = NumpyDataset.from_sequence(arr)
+    # Build the sort order up front so it counts as preparation, not search
+    dataset.sorted_values
+    return dataset
+
+
+def _run_linear_np(arr, target, prepared):
+    return prepared.linear(target)
+
+
+def _run_binary_np(arr, target, prepared):
+    return prepared.binary(target)
+
+
+def _build_algorithms():
+    """name -> (prepare(arr), search(arr, target, prepared)) for every registered algorithm."""
+    algorithms = {}
+    for algorithm in list_algorithms():
+        if algorithm.requires_sorted:
+            prepare = _prepare_sorted
+        elif algorithm.hashed:
+            prepare = _prepare_hash
+        else:
+            prepare = _prepare_none
+        algorithms[algorithm.name] = (prepare, _registry_runner(algorithm))
+
+    if HAVE_NUMPY:
+        algorithms["Linear (NumPy)"] = (_prepare_numpy, _run_linear_np)
+        algorithms["Binary (NumPy)"] = (_prepare_numpy, _run_binary_np)
+    return algorithms
+
+
+ALGORITHMS = _build_algorithms()
+
+
+def generate_array(size, distribution, rng):
+    """
+    Generate a list of integers with the given shape.
+
+    Args:
+        size (int): Number of elements.
+        distribution (str): One of DISTRIBUTIONS.
+            uniform    - values spread evenly over [0, 10 * size)
+            skewed     - heavy-tailed values, most of them small
+            duplicates - only a handful of distinct values (like Q11/Q14)
+            sorted     - ascending uniform values
+            reverse    - descending uniform values
+        rng (random.Random): Random source.
+
+    Returns:
+        list: The generated array.
+    """
+    if distribution == "uniform":
+        return [rng.randrange(10 * size) for _ in range(size)]
+    if distribution == "skewed":
+        return [int(rng.paretovariate(1.2)) for _ in range(size)]
+    if distribution == "duplicates":
+        return [rng.randrange(4) for _ in range(size)]
+    if distribution == "sorted":
+        return sorted(rng.randrange(10 * size) for _ in range(size))
+    if distribution == "reverse":
+        return sorted((rng.randrange(10 * size) for _ in range(size)), reverse=True)
+    raise ValueError(f"Unknown distribution: {distribution}")
+
+
+def generate_targets(arr, count, rng, hit_ratio=0.5):
+    """
+    Pick query targets: a mix of values present in ``arr`` and misses.
+
+    Args:
+        arr (list): The dataset.
+        count (int): Number of targets.
+        rng (random.Random): Random source.
+        hit_ratio (float): Fraction of targets drawn from ``arr``.
+
+    Returns:
+        list: Target values.
+    """
+    if not arr:
+        return [0] * count
+    top = max(arr) + 1
+    targets = []
+    for _ in range(count):
+        if rng.random() < hit_ratio:
+            targets.append(arr[rng.randrange(len(arr))])
+        else:
+            # Negative values never occur in generated data
+            targets.append(-1 - rng.randrange(top))
+    return targets
+
+
+def percentile(sorted_samples, pct):
+    """
+    Nearest-rank percentile of an already sorted list.
+
+    Args:
+        sorted_samples (list): Samples in ascending order.
+        pct (float): Percentile in [0, 100].
+
+    Returns:
+        float: The percentile value (0 for no samples).
+    """
+    if not sorted_samples:
+        return 0
+    rank = max(1, -(-len(sorted_samples) * pct // 100))
+    return sorted_samples[int(rank) - 1]
+
+
+def bench_algorithm(name, arr, targets, repeat=5, warmup=1):
+    """
+    Time one algorithm over a set of targets.
+
+    Args:
+        name (str): Key in ALGORITHMS.
+        arr (list): The dataset.
+        targets (list): Query targets.
+        repeat (int): Timed passes over all targets.
+        warmup (int): Untimed passes run first.
+
+    Returns:
+        dict: Timing and step statistics for this algorithm.
+    """
+    prepare, search = ALGORITHMS[name]
+    clock = time.perf_counter_ns
+
+    start = clock()
+    prepared = prepare(arr)
+    prepare_ns = clock() - start
+
+    for _ in range(warmup):
+        for target in targets:
+            search(arr, target, prepared)
+
+    samples = []
+    total_steps = 0
+    found = 0
+    wall_start = clock()
+    for _ in range(repeat):
+        for target in targets:
+            t0 = clock()
+            index, steps = search(arr, target, prepared)
+            samples.append(clock() - t0)
+            total_steps += steps
+            found += index != -1
+    wall_ns = clock() - wall_start
+
+    queries = len(samples)
+    samples.sort()
+    search_ns = sum(samples)
+    return {
+        "algorithm": name,
+        "queries": queries,
+        "prepare_ms": prepare_ns / 1e6,
+        "wall_ms": wall_ns / 1e6,
+        "ops_per_sec": queries / (search_ns / 1e9) if search_ns else 0.0,
+        "mean_steps": total_steps / queries if queries else 0.0,
+        "found_rate": found / queries if queries else 0.0,
+        "mean_us": search_ns / queries / 1e3 if queries else 0.0,
+        "p50_us": percentile(samples, 50) / 1e3,
+        "p90_us": percentile(samples, 90) / 1e3,
+        "p99_us": percentile(samples, 99) / 1e3,
+    }
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, distributions=DEFAULT_DISTRIBUTIONS,
+                  algorithms=None, repeat=5, warmup=1, queries=100, seed=0,
+                  progress=None):
+    """
+    Benchmark every algorithm on every size/distribution combination.
+
+    Args:
+        sizes (iterable): Array sizes to generate.
+        distributions (iterable): Names from DISTRIBUTIONS.
+        algorithms (iterable): Names from ALGORITHMS (default: all).
+        repeat (int): Timed passes over the targets.
+        warmup (int): Untimed passes run first.
+        queries (int): Number of targets per dataset.
+        seed (int): Random seed, so runs are reproducible.
+        progress (callable): Optional callback receiving each result row.
+
+    Returns:
+        list: One dict per (size, distribution, algorithm).
+    """
+    names = list(algorithms) if algorithms else list(ALGORITHMS)
+    for name in names:
+        if name not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {name}")
+
+    rng = random.Random(seed)
+    rows = []
+    for size in sizes:
+        for distribution in distributions:
+            arr = generate_array(size, distribution, rng)
+            targets = generate_targets(arr, queries, rng)
+            for name in names:
+                row = bench_algorithm(name, arr, targets, repeat=repeat, warmup=warmup)
+                row["size"] = size
+                row["distribution"] = distribution
+                rows.append(row)
+                if progress is not None:
+                    progress(row)
+    return rows
+
+
+def print_report(rows, file=None):
+    """
+    Print benchmark rows as a table.
+
+    Args:
+        rows (list): Output of run_benchmark.
+        file: Stream to write to (default: stdout).
+    """
+    out = file or sys.stdout
+    header = (
+        f"{'Size':>9}  {'Distribution':<11}  {'Algorithm':<20}  {'Prep ms':>9}  "
+        f"{'Wall ms':>9}  {'Ops/sec':>11}  {'Steps':>9}  {'p50 us':>8}  "
+        f"{'p90 us':>8}  {'p99 us':>8}"
+    )
+    out.write(header + "\n")
+    out.write("-" * len(header) + "\n")
+    for r in rows:
+        out.write(
+            f"{r['size']:>9}  {r['distribution']:<11}  {r['algorithm']:<20}  "
+            f"{r['prepare_ms']:>9.3f}  {r['wall_ms']:>9.3f}  {r['ops_per_sec']:>11.0f}  "
+            f"{r['mean_steps']:>9.1f}  {r['p50_us']:>8.2f}  {r['p90_us']:>8.2f}  "
+            f"{r['p99_us']:>8.2f}\n"
+        )
+
+
+def write_json(rows, path, **settings):
+    """
+    Save benchmark rows as JSON for regression tracking.
+
+    Args:
+        rows (list): Output of run_benchmark.
+        path (str): Output file, or "-" for standard output.
+        **settings: Benchmark parameters recorded alongside the results.
+    """
+    from . import __version__
+
+    report = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": settings,
+        "results": rows,
+    }
+    if path == "-":
+        json.dump(report, sys.stdout, indent=4)
+        sys.stdout.write("\n")
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4)
@@ -1,11 +1,26 @@
 """Command-line interface components."""
 
 from .menu import show_main_q_menu, show_algo_menu
-from .commands import process_main_menu, process_algo_menu
+from .renderer import TraceRenderer
+from .commands import (
+    process_main_menu,
+    process_algo_menu,
+    run_batch,
+    run_compare_all,
+    run_replay,
+    run_occurrences,
+    run_range_query,
+)
 
 __all__ = [
     "show_main_q_menu",
     "show_algo_menu",
     "process_main_menu",
     "process_algo_menu",
+    "run_batch",
+    "run_compare_all",
+    "run_replay",
+    "run_occurrences",
+    "run_range_query",
+    "TraceRenderer",
 ]
@@ -2,8 +2,127 @@
 Command processing functions for the CLI interface.
 """
 
-from ..core.search_algorithms import linear_search, binary_search
-from ..utils import save_result, take_target_input, print_list_plain
+import time
+
+from .. import config
+from ..core.registry import (
+    Algorithm,
+    list_algorithms,
+    get_algorithm,
+    run_algorithm,
+    profile_dataset,
+    auto_select,
+)
+from ..core.sorted_index import get_sorted_index
+from ..core.hash_index import get_hash_index
+from ..core.bloom import get_bloom_filter
+from ..core.result_cache import get_result_cache
+from ..core.bounds import count_occurrences, range_query, COUNT_OCCURRENCES, RANGE_QUERY
+from ..core.batch import BATCH
+from ..core.numpy_engine import batch_search_np
+from ..core.trace_recorder import TraceRecorder
+from ..core.tracing import tee
+from ..utils import (
+    new_result_id,
+    find_result,
+    save_trace,
+    load_trace,
+    save_result,
+    save_results,
+    make_result,
+    take_target_input,
+    take_range_input,
+    print_list_plain,
+    PhaseTimer,
+    record_phase,
+)
+from .renderer import TraceRenderer
+
+
+def _run_traced(algorithm, arr, target, sorted_index, hash_index=None, timer=None,
+                bloom=None, key=None):
+    """
+    Run an algorithm with the rendered explanation, recording its full trace.
+    
+    Args:
+        timer (PhaseTimer): Timer holding phases already measured for this
+            result (e.g. building the sorted index); a new one if omitted.
+        bloom (BloomFilter): Prefilter checked before the algorithm runs.
+        key (str): Dataset fingerprint; when given, a repeat of an earlier
+            query replays its stored trace instead of searching again, and
+            its record points at the trace file of the original run.
+    
+    Returns:
+        tuple: (index, steps, record fields with the result id, trace file,
+            phase timings and Bloom filter counts)
+    """
+    if timer is None:
+        timer = PhaseTimer()
+    cache = get_result_cache() if key is not None else None
+    mode = bloom.fp_rate if bloom is not None else None
+    cached = cache.get(key, algorithm.key, target, mode) if cache is not None else None
+    renderer = TraceRenderer()
+    start = time.perf_counter_ns()
+    if cached is not None:
+        if bloom is not None and bloom.check(target) and cached.index == -1:
+            bloom.false_positives += 1
+        for event in TraceRecorder.from_bytes(cached.trace).events():
+            renderer(event)
+        renderer.flush()
+        index, steps, trace = cached.index, cached.steps, cached.trace
+    else:
+        recorder = TraceRecorder()
+        index, steps = run_algorithm(algorithm, arr, target,
+                                     tracer=tee(renderer, recorder),
+                                     index=sorted_index, hash_index=hash_index, bloom=bloom)
+        trace = recorder.to_bytes()
+    elapsed = time.perf_counter_ns() - start
+    timer.add("search", elapsed - renderer.render_ns)
+    timer.add("render", renderer.render_ns)
+    if cached is not None:
+        print(f"(cached result from {time.strftime('%H:%M:%S', time.localtime(cached.stored_at))}"
+              ", search skipped)")
+
+    result_id = new_result_id()
+    fields = {"id": result_id, "target": target}
+    if cached is not None:
+        path = cached.path
+    else:
+        with timer.phase("persist"):
+            path = save_trace(result_id, trace)
+        if cache is not None and not recorder.lossy:
+            cache.put(key, algorithm.key, target, index, steps, trace, path, mode)
+    if path is not None:
+        fields["trace"] = path
+    fields.update(timer.fields())
+    if bloom is not None:
+        fields.update(bloom.fields())
+    if cached is not None:
+        fields["cached"] = True
+    return index, steps, fields
+
+
+def _save_timed(**entry):
+    """``save_result`` with the append counted in the session's persist totals."""
+    start = time.perf_counter_ns()
+    save_result(**entry)
+    record_phase("persist", time.perf_counter_ns() - start)
+
+
+def _parallel_algorithm(scanner):
+    """Unregistered entry that runs ``scanner`` like a registry algorithm."""
+    from ..core.parallel import PARALLEL_LINEAR
+
+    def search(arr, target, tracer=None):
+        return scanner.search(target, tracer=tracer)
+
+    return Algorithm("parallel", PARALLEL_LINEAR, search, config.PARALLEL_LINEAR_COMPLEXITY,
+                     "O(n)", False, f"linear scan in chunks on {scanner.workers} processes")
+
+
+def _menu_choices():
+    """Map menu numbers ("1", "2", ...) to registered algorithms."""
+    return {str(number): algorithm for number, algorithm in enumerate(list_algorithms(), 1)}
 
 
 def process_algo_menu(arr, question_label):
@@ -17,10 +136,25 @@ def process_algo_menu(arr, question_label):
     Returns:
         bool: True if user wants to go back, False if user wants to exit.
     """
+    # Inspected once per loaded list; the sorted index is built on first use
+    # (without sorting when the list is already in order)
+    profile = profile_dataset(arr)
+    sorted_index = None
+    # Hash index likewise, with the lookups it has served for amortizing its build
+    hash_index = None
+    hash_lookups = 0
+    # Built with the list when --bloom is on, so misses skip every algorithm
+    bloom = get_bloom_filter(arr, profile.key)
+    if bloom is not None:
+        record_phase("build", bloom.build_ns)
+        print(f"Bloom filter ready: {bloom.size:,} bits, {bloom.hashes} hashes, "
+              f"{bloom.fp_rate:.2%} false positives")
+
     while True:
         from .menu import show_algo_menu
+        choices = _menu_choices()
         show_algo_menu()
-        algo = input("Enter choice (1/2/3/b/exit): ").strip().lower()
+        algo = input(f"Enter choice (1-{len(choices)}/c/o/r/p/a/b/exit): ").strip().lower()
 
         if algo == "b":
             return True  # Go back
@@ -28,95 +162,339 @@ def process_algo_menu(arr, question_label):
         elif algo == "exit":
             return False  # Exit program
 
-        elif algo == "1":
-            # Linear search
+        elif algo in choices or algo == "a":
+            if algo == "a":
+                algorithm, reason, _ = auto_select(arr, profile)
+                print(f"\nAuto mode picked {algorithm.name}: {reason}")
+                method = f"{algorithm.name} (Auto)"
+            else:
+                algorithm = choices[algo]
+                method = algorithm.name
+
             target = take_target_input()
-            index, steps = linear_search(arr, target)
+            timer = PhaseTimer()
+            # Targets the Bloom filter rules out never need an index built
+            needed = bloom is None or bloom.might_contain(target)
+            if needed and algorithm.requires_sorted and sorted_index is None:
+                with timer.phase("sort"):
+                    sorted_index = get_sorted_index(arr, profile.key, profile.is_sorted)
+            if needed and algorithm.hashed and hash_index is None:
+                with timer.phase("build"):
+                    hash_index = get_hash_index(arr, profile.key)
+            index, steps, fields = _run_traced(algorithm, arr, target, sorted_index, hash_index,
+                                               timer, bloom, profile.key)
             found = index != -1
 
-            save_result(
+            if algorithm.hashed and fields.get("bloom") != "miss":
+                hash_lookups += 1
+                count = hash_index.count(target)
+                if count > 1:
+                    shown = " ".join(str(i) for i in hash_index.occurrences(target)[:20])
+                    more = " ..." if count > 20 else ""
+                    print(f"{target} occurs {count} times, at original indices: {shown}{more}")
+
+            _save_timed(
                 question=question_label,
-                method="Linear Search",
-                time_complexity="O(n)",
-                space_complexity="O(1)",
+                method=method,
+                time_complexity=algorithm.time_complexity,
+                space_complexity=algorithm.space_complexity,
                 steps=steps,
-                found=found
+                found=found,
+                **fields
             )
+            print(f"Result id: {fields['id']}  (replay with /replay {fields['id']})")
 
             input("Press Enter to continue...")
 
-        elif algo == "2":
-            # Binary search
-            target = take_target_input()
-            index, steps = binary_search(arr, target)
-            found = index != -1
+        elif algo == "p":
+            from ..core.parallel import get_parallel_scanner
 
-            save_result(
+            target = take_target_input()
+            timer = PhaseTimer()
+            with timer.phase("build"):
+                scanner = get_parallel_scanner(arr, profile.key)
+            algorithm = _parallel_algorithm(scanner)
+            index, steps, fields = _run_traced(algorithm, arr, target, None, timer=timer,
+                                               bloom=bloom)
+            if fields.get("bloom") != "miss":
+                print(f"Scanned in {len(scanner.chunks)} chunk(s) on {scanner.workers} "
+                      f"process(es); {scanner.cancelled} chunk(s) cancelled after the "
+                      "earliest match")
+            _save_timed(
                 question=question_label,
-                method="Binary Search",
-                time_complexity="O(log n)",
-                space_complexity="O(1)",
+                method=algorithm.name,
+                time_complexity=algorithm.time_complexity,
+                space_complexity=algorithm.space_complexity,
                 steps=steps,
-                found=found
+                found=index != -1,
+                workers=scanner.workers,
+                **fields
             )
-
+            print(f"Result id: {fields['id']}  (replay with /replay {fields['id']})")
             input("Press Enter to continue...")
 
-        elif algo == "3":
-            # Compare Linear vs Binary
-            target = take_target_input()
-            print("\n===== Comparing Linear Search vs Binary Search =====")
-            print("Same list and same target will be used for both.\n")
-
-            print("[1] Running Linear Search...\n")
-            index_lin, steps_lin = linear_search(arr, target)
-            found_lin = index_lin != -1
-
-            save_result(
-                question=question_label,
-                method="Linear Search (Compare Mode)",
-                time_complexity="O(n)",
-                space_complexity="O(1)",
-                steps=steps_lin,
-                found=found_lin
-            )
-
-            print("\n[2] Running Binary Search...\n")
-            index_bin, steps_bin = binary_search(arr, target)
-            found_bin = index_bin != -1
-
-            save_result(
-                question=question_label,
-                method="Binary Search (Compare Mode)",
-                time_complexity="O(log n)",
-                space_complexity="O(1)",
-                steps=steps_bin,
-                found=found_bin
-            )
-
-            print("\n----------- SUMMARY -----------")
-            if found_lin:
-                print(f"Linear Search  : Found (index {index_lin} in original list)")
+        elif algo in ("o", "r"):
+            if sorted_index is None:
+                sorted_index = get_sorted_index(arr, profile.key, profile.is_sorted)
+            if algo == "o":
+                run_occurrences(arr, question_label, take_target_input(), sorted_index)
             else:
-                print("Linear Search  : Not found")
+                low, high = take_range_input()
+                run_range_query(arr, question_label, low, high, sorted_index)
+            input("Press Enter to continue...")
 
-            if found_bin:
-                print(f"Binary Search  : Found (index {index_bin} in sorted list)")
-            else:
-                print("Binary Search  : Not found")
+        elif algo == "c":
+            # Compare every registered algorithm on the same list and target
+            target = take_target_input()
+            # Index builds are shared by every algorithm, so they count towards
+            # the session totals rather than any one result
+            setup = PhaseTimer()
+            if sorted_index is None:
+                with setup.phase("sort"):
+                    sorted_index = get_sorted_index(arr, profile.key, profile.is_sorted)
+            if hash_index is None:
+                with setup.phase("build"):
+                    hash_index = get_hash_index(arr, profile.key)
+
+            print("\n===== Comparing all search algorithms =====")
+            print("Same list and same target will be used for all.\n")
+
+            outcomes = []
+            lookup_ns = None
+            for number, algorithm in enumerate(choices.values(), 1):
+                print(f"[{number}] Running {algorithm.name}...\n")
+                index, steps, fields = _run_traced(algorithm, arr, target, sorted_index,
+                                                   hash_index, bloom=bloom)
+                outcomes.append((algorithm, index, steps, fields["timings_ns"]))
+                if algorithm.hashed:
+                    # Timed untraced, so the figure is the lookup alone
+                    hash_lookups += 1
+                    start = time.perf_counter_ns()
+                    hash_index.lookup(target)
+                    lookup_ns = time.perf_counter_ns() - start
+
+                _save_timed(
+                    question=question_label,
+                    method=f"{algorithm.name} (Compare Mode)",
+                    time_complexity=algorithm.time_complexity,
+                    space_complexity=algorithm.space_complexity,
+                    steps=steps,
+                    found=index != -1,
+                    **fields
+                )
+                print()
+
+            print("----------- SUMMARY -----------")
+            for algorithm, index, steps, timings in outcomes:
+                if index == -1:
+                    print(f"{algorithm.name:<22} : Not found")
+                elif algorithm.requires_sorted:
+                    print(
+                        f"{algorithm.name:<22} : Found (index {index} in sorted list, "
+                        f"index {sorted_index.original_index(index)} in original list)"
+                    )
+                else:
+                    print(f"{algorithm.name:<22} : Found (index {index} in original list)")
 
             print("\nSteps taken:")
-            print(f"  Linear Search  -> {steps_lin} steps")
-            print(f"  Binary Search  -> {steps_bin} steps")
+            for algorithm, index, steps, timings in outcomes:
+                print(f"  {algorithm.name:<22} -> {steps} steps")
 
             print("\nTime Complexity:")
-            print("  Linear Search  -> O(n)")
-            print("  Binary Search  -> O(log n)  (requires sorted list)")
+            for algorithm, index, steps, timings in outcomes:
+                note = "  (requires sorted list)" if algorithm.requires_sorted else ""
+                print(f"  {algorithm.name:<22} -> {algorithm.time_complexity}{note}")
+
+            print("\nWall time (search / rendering the explanation):")
+            for algorithm, index, steps, timings in outcomes:
+                print(f"  {algorithm.name:<22} -> {timings['search'] / 1e3:>9.1f} us"
+                      f" / {timings['render'] / 1e3:>9.1f} us")
+
+            if lookup_ns is not None:
+                build_ns = hash_index.build_ns
+                print("\nHash index cost (built once per list, reused by every lookup):")
+                print(f"  Build          -> {build_ns / 1e6:.3f} ms for {len(arr)} elements")
+                print(f"  Lookup         -> {lookup_ns / 1e3:.2f} us")
+                print(f"  Amortized      -> {(build_ns / hash_lookups + lookup_ns) / 1e3:.2f} us "
+                      f"per lookup over {hash_lookups} lookup(s) on this list")
+
+            if bloom is not None:
+                outcome = ("ruled the target out, every search was skipped" if not bloom.last
+                           else "target may be present, every search ran")
+                print(f"\nBloom filter: {outcome} ({bloom.hits} hits, {bloom.misses} misses, "
+                      f"{bloom.false_positives} false positives on this list so far)")
+
+            _print_layout_timings(target, sorted_index)
+            _print_parallel_speedup(arr, target, profile.key)
+
+            best, reason, _ = auto_select(arr, profile)
+            print(f"\nAuto mode would pick: {best.name} ({reason})")
             print("-------------------------------")
             input("Press Enter to go back...")
 
         else:
-            print("Invalid choice. Enter 1, 2, 3, b, or exit.")
+            print(f"Invalid choice. Enter 1-{len(choices)}, c, o, r, p, a, b, or exit.")
+
+
+def _print_layout_timings(target, sorted_index, lookups=1000):
+    """
+    Compare mode: time binary search against the cache-friendly layouts, untraced.
+    
+    Each algorithm answers the same lookups (the target plus values spread
+    evenly across the sorted list), so the figures compare the layouts
+    rather than one lucky probe path.
+    """
+    values = sorted_index.values
+    stride = max(1, len(values) // lookups)
+    targets = [target] + list(values[::stride][:lookups])
+
+    print(f"\nSorted layouts head-to-head ({len(targets)} untraced lookups each):")
+    for key in ("binary", "eytzinger", "btree"):
+        algorithm = get_algorithm(key)
+        if algorithm is None:
+            continue
+        run_algorithm(algorithm, values, target, index=sorted_index)  # builds the layout
+        steps = 0
+        start = time.perf_counter_ns()
+        for value in targets:
+            steps += run_algorithm(algorithm, values, value, index=sorted_index)[1]
+        elapsed = time.perf_counter_ns() - start
+        layout = sorted_index.layouts.get(algorithm.name)
+        build = f" , built in {layout.build_ns / 1e6:.3f} ms" if layout is not None else ""
+        print(f"  {algorithm.name:<22} -> {elapsed / len(targets):>8.0f} ns per lookup , "
+              f"{steps / len(targets):>5.2f} steps{build}")
+
+
+def _print_parallel_speedup(arr, target, key):
+    """Compare mode: time serial against parallel linear search, both untraced."""
+    from ..core.parallel import get_parallel_scanner, PARALLEL_MIN_SIZE
+    from ..core.search_algorithms import linear_search
+
+    if len(arr) < PARALLEL_MIN_SIZE:
+        print(f"\nParallel linear search: skipped (lists under {PARALLEL_MIN_SIZE:,} elements "
+              "finish faster than worker processes start; use 'p' to run it anyway)")
+        return
+
+    scanner = get_parallel_scanner(arr, key)
+    start = time.perf_counter_ns()
+    serial = linear_search(arr, target)
+    serial_ns = time.perf_counter_ns() - start
+    start = time.perf_counter_ns()
+    parallel = scanner.search(target)
+    parallel_ns = time.perf_counter_ns() - start
+    record_phase("search", serial_ns + parallel_ns)
+
+    same = "same as serial" if parallel == serial else f"serial gave {serial}"
+    print(f"\nParallel linear search ({scanner.workers} processes, "
+          f"{len(scanner.chunks)} chunks):")
+    print(f"  Setup          -> {scanner.setup_ns / 1e6:.3f} ms (shared memory and worker pool, "
+          "once per list)")
+    print(f"  Serial         -> {serial_ns / 1e6:.3f} ms")
+    print(f"  Parallel       -> {parallel_ns / 1e6:.3f} ms (index {parallel[0]}, "
+          f"{parallel[1]} steps, {same})")
+    print(f"  Speedup        -> {serial_ns / max(parallel_ns, 1):.2f}x")
+
+
+def run_occurrences(arr, question_label, target, sorted_index=None):
+    """
+    Find the first and last occurrence of a target and count its matches.
+    
+    Args:
+        arr (list): The list to search in.
+        question_label (str): Label for the question (for logging).
+        target (int): The value to look for.
+        sorted_index (SortedIndex): Prebuilt sorted index of ``arr`` (optional).
+        
+    Returns:
+        Occurrences: First and last sorted positions, count and steps.
+    """
+    timer = PhaseTimer()
+    recorder = TraceRecorder()
+    renderer = TraceRenderer()
+    start = time.perf_counter_ns()
+    result = count_occurrences(arr, target, tracer=tee(renderer, recorder),
+                               index=sorted_index)
+    elapsed = time.perf_counter_ns() - start
+    timer.add("search", elapsed - renderer.render_ns)
+    timer.add("render", renderer.render_ns)
+
+    if result.count:
+        if sorted_index is None:
+            sorted_index = get_sorted_index(arr)
+        first = sorted_index.original_index(result.first)
+        last = sorted_index.original_index(result.last)
+        print(f"First occurrence: index {result.first} in sorted list "
+              f"(index {first} in original list)")
+        print(f"Last occurrence : index {result.last} in sorted list "
+              f"(index {last} in original list)")
+    print(f"Count: {result.count}")
+
+    result_id = new_result_id()
+    with timer.phase("persist"):
+        path = save_trace(result_id, recorder.to_bytes())
+    extra = {"trace": path} if path is not None else {}
+    extra.update(timer.fields())
+    _save_timed(
+        question=question_label,
+        method=COUNT_OCCURRENCES,
+        time_complexity="O(log n)",
+        space_complexity="O(1)",
+        steps=result.steps,
+        found=result.count > 0,
+        id=result_id,
+        target=target,
+        count=result.count,
+        **extra
+    )
+    return result
+
+
+def run_range_query(arr, question_label, low, high, sorted_index=None, preview=50):
+    """
+    List every element whose value lies in ``[low, high]``.
+    
+    Matches are streamed from the lazy range iterator, so only the shown
+    ones are ever materialised.
+    
+    Args:
+        arr (list): The list to search in.
+        question_label (str): Label for the question (for logging).
+        low (int): Smallest value to include.
+        high (int): Largest value to include.
+        sorted_index (SortedIndex): Prebuilt sorted index of ``arr`` (optional).
+        preview (int): Maximum number of matches printed.
+        
+    Returns:
+        RangeMatches: The matches.
+    """
+    timer = PhaseTimer()
+    renderer = TraceRenderer()
+    start = time.perf_counter_ns()
+    matches = range_query(arr, low, high, tracer=renderer, index=sorted_index)
+    elapsed = time.perf_counter_ns() - start
+    timer.add("search", elapsed - renderer.render_ns)
+    timer.add("render", renderer.render_ns)
+
+    if matches:
+        print(f"\n{'Original idx':>12}  {'Value':>12}")
+        for shown, (position, value) in enumerate(matches):
+            if shown == preview:
+                print(f"... {len(matches) - preview:,} more")
+                break
+            print(f"{position:>12}  {value:>12}")
+
+    _save_timed(
+        question=question_label,
+        method=RANGE_QUERY,
+        time_complexity="O(log n + k)",
+        space_complexity="O(1)",
+        steps=matches.steps,
+        found=bool(matches),
+        range=[low, high],
+        count=len(matches),
+        **timer.fields()
+    )
+    return matches
 
 
 def process_main_menu(questions):
@@ -175,4 +553,237 @@ def process_main_menu(questions):
         # Process algorithm menu
         should_continue = process_algo_menu(arr, question_label)
         if not should_continue:
-            return False  # User exited from algo menu
\ No newline at end of file
+            return False  # User exited from algo menu
+
+
+def run_batch(arr, question_label, targets):
+    """
+    Answer many targets against one list and log them in a single write.
+    
+    Args:
+        arr (list): The list to search in.
+        question_label (str): Label for the question (for logging).
+        targets (list): Target values to look up.
+        
+    Returns:
+        list: BatchResult per target.
+    """
+    # Vectorised when NumPy is installed, pure-Python sort-once otherwise
+    start = time.perf_counter_ns()
+    results = batch_search_np(arr, targets)
+    record_phase("search", time.perf_counter_ns() - start)
+
+    print("\n===== Batch Binary Search =====")
+    print(f"Question: {question_label}  |  List size: {len(arr)}  |  Targets: {len(targets)}")
+    print("-------------------------------------------------------")
+    print(f"{'Target':>12}  {'Result':<10}  {'Sorted idx':>10}  {'Original idx':>12}  {'Steps':>5}")
+    for r in results:
+        found = "Found" if r.index != -1 else "Not Found"
+        sorted_idx = r.index if r.index != -1 else "-"
+        original_idx = r.original_index if r.index != -1 else "-"
+        print(f"{r.target:>12}  {found:<10}  {sorted_idx!s:>10}  {original_idx!s:>12}  {r.steps:>5}")
+    print("-------------------------------------------------------")
+
+    hits = sum(1 for r in results if r.index != -1)
+    print(f"Found {hits} of {len(results)} targets")
+
+    start = time.perf_counter_ns()
+    save_results(
+        make_result(
+            question=question_label,
+            method=BATCH,
+            time_complexity="O(log n)",
+            space_complexity="O(1)",
+            steps=r.steps,
+            found=r.index != -1,
+            target=r.target,
+        )
+        for r in results
+    )
+    record_phase("persist", time.perf_counter_ns() - start)
+    return results
+
+
+def run_compare_all(questions, targets, workers=None, chunksize=None):
+    """
+    Compare every registered algorithm on every question across a process pool.
+    
+    Args:
+        questions (dict): Question key -> list of integers.
+        targets (list): Target values searched in every question.
+        workers (int): Worker processes (default: CPU count).
+        chunksize (int): Questions per submitted task.
+        
+    Returns:
+        list: CompareRow per (question, algorithm, target).
+    """
+    from ..core.parallel import compare_all
+
+    rows = compare_all(questions, targets, workers=workers, chunksize=chunksize)
+
+    # Aggregate per algorithm, and count which algorithm needed fewest steps
+    stats = {}
+    best = {}
+    for row in rows:
+        entry = stats.setdefault(row.algorithm, [0, 0, 0, None, None, 0])
+        entry[0] += 1
+        entry[1] += row.index != -1
+        entry[2] += row.steps
+        entry[3] = row.steps if entry[3] is None else min(entry[3], row.steps)
+        entry[4] = row.steps if entry[4] is None else max(entry[4], row.steps)
+        entry[5] += row.elapsed_ns
+
+        case = (row.question, row.target)
+        if case not in best or row.steps < best[case][1]:
+            best[case] = (row.algorithm, row.steps)
+
+    wins = {}
+    for algorithm, _ in best.values():
+        wins[algorithm] = wins.get(algorithm, 0) + 1
+
+    print("\n===== Compare All =====")
+    print(f"Questions: {len(questions)}  |  Targets: {len(targets)}  |  Runs: {len(rows)}")
+    print("-----------------------------------------------------------------------------")
+    print(f"{'Algorithm':<22} {'Runs':>6} {'Found':>6} {'Mean steps':>11} "
+          f"{'Min':>5} {'Max':>7} {'Total ms':>9} {'Fewest':>7}")
+    for key, (runs, found, steps, low, high, elapsed) in stats.items():
+        algorithm = get_algorithm(key)
+        print(f"{algorithm.name:<22} {runs:>6} {found:>6} {steps / runs:>11.2f} "
+              f"{low:>5} {high:>7} {elapsed / 1e6:>9.3f} {wins.get(key, 0):>7}")
+    print("-----------------------------------------------------------------------------")
+    print("Fewest = number of (question, target) cases where it needed the fewest steps")
+
+    save_results(
+        make_result(
+            question=row.question,
+            method=f"{get_algorithm(row.algorithm).name} (Compare All)",
+            time_complexity=get_algorithm(row.algorithm).time_complexity,
+            space_complexity=get_algorithm(row.algorithm).space_complexity,
+            steps=row.steps,
+            found=row.index != -1,
+            target=row.target,
+            timings_ns={"search": row.elapsed_ns},
+        )
+        for row in rows
+    )
+    return rows
+
+
+def run_file_search(path, target):
+    """
+    Search a data file on disk without loading it, explaining each step.
+    
+    Fixed-width sorted ``.i64`` files are binary searched through ``mmap``;
+    any other file is read as text and scanned in buffered chunks.
+    
+    Args:
+        path (str): Data file to search.
+        target (int): The value to look for.
+        
+    Returns:
+        FileMatch or None: The result, or None if the file could not be searched.
+    """
+    from ..core.external import (
+        STREAM_LINEAR,
+        EXTERNAL_BINARY,
+        is_fixed_width,
+        stream_linear_search,
+        external_binary_search,
+    )
+
+    if is_fixed_width(path):
+        name, search, complexity = EXTERNAL_BINARY, external_binary_search, "O(log n)"
+    else:
+        name, search, complexity = STREAM_LINEAR, stream_linear_search, "O(n)"
+
+    timer = PhaseTimer()
+    recorder = TraceRecorder()
+    renderer = TraceRenderer()
+    start = time.perf_counter_ns()
+    try:
+        result = search(path, target, tracer=tee(renderer, recorder))
+    except (OSError, ValueError) as e:
+        renderer.flush()
+        print(f"\n❌ Could not search {path}: {e}")
+        return None
+    elapsed = time.perf_counter_ns() - start
+    timer.add("search", elapsed - renderer.render_ns)
+    timer.add("render", renderer.render_ns)
+
+    if result.index != -1:
+        print(f"Byte offset of the match: {result.offset}")
+
+    result_id = new_result_id()
+    with timer.phase("persist"):
+        path_saved = save_trace(result_id, recorder.to_bytes())
+    extra = {"trace": path_saved} if path_saved is not None else {}
+    extra.update(timer.fields())
+    _save_timed(
+        question=f"file: {path}",
+        method=name,
+        time_complexity=complexity,
+        space_complexity="O(1)",
+        steps=result.steps,
+        found=result.index != -1,
+        id=result_id,
+        target=target,
+        byte_offset=result.offset,
+        pages_read=result.pages,
+        bytes_read=result.bytes_read,
+        **extra
+    )
+    print(f"Result id: {result_id}  (replay with /replay {result_id})")
+    return result
+
+
+def run_replay(result_id, speed=None, last=None):
+    """
+    Re-render the recorded trace of a logged search.
+    
+    Args:
+        result_id (str): Id of the result (shown by /history).
+        speed (float): Steps per second; None or 0 replays instantly.
+        last (int): Only replay the last K steps.
+        
+    Returns:
+        bool: True if the trace was found and replayed.
+    """
+    entry = find_result(result_id)
+    if entry is None:
+        print(f"\n❌ No result with id {result_id}")
+        return False
+
+    data = load_trace(entry["trace"]) if entry.get("trace") else None
+    if data is None:
+        print(f"\n❌ No trace recorded for result {result_id}")
+        return False
+
+    try:
+        recorder = TraceRecorder.from_bytes(data)
+    except ValueError as e:
+        print(f"\n❌ Could not read trace for {result_id}: {e}")
+        return False
+
+    print("\n" + "="*60)
+    print(f" REPLAY {result_id}: {entry.get('method', 'N/A')} on {entry.get('question', 'N/A')}")
+    print("="*60)
+    if recorder.lossy:
+        print("Note: some values did not fit in 64 bits and are shown as None.")
+
+    delay = 1.0 / speed if speed else 0
+    # Paced or --last replays show every step they were asked for
+    if delay or last is not None:
+        renderer = TraceRenderer(head=None, live=bool(delay))
+    else:
+        renderer = TraceRenderer()
+
+    skipped = recorder.skipped(last)
+    for event in recorder.events(last=last):
+        if skipped and event.kind == "step":
+            renderer.write(f"\n... {skipped:,} earlier steps omitted ...\n")
+            skipped = 0
+        renderer(event)
+        if delay and event.kind == "step":
+            time.sleep(delay)
+    renderer.flush()
+    return True
\ No newline at end of file
@@ -39,13 +39,19 @@ def show_main_q_menu(keys):
 
 
 def show_algo_menu():
-    """Display the algorithm selection menu."""
+    """Display the algorithm selection menu built from the algorithm registry."""
+    from ..core.registry import list_algorithms
     
     print("\n--------------------------------------")
     print(" Choose algorithm:")
-    print(" 1 - Linear Search")
-    print(" 2 - Binary Search (on sorted list)")
-    print(" 3 - Compare Linear vs Binary")
+    for number, algorithm in enumerate(list_algorithms(), 1):
+        note = " (on sorted list)" if algorithm.requires_sorted else ""
+        print(f" {number} - {algorithm.name}{note}")
+    print(" c - Compare all algorithms")
+    print(" o - Occurrences: first, last and count of a target")
+    print(" r - Range query: every value in [low, high]")
+    print(" p - Parallel linear search (chunks on every core)")
+    print(" a - Auto (pick the fastest for this list)")
     print(" b - Back to choose Q-key")
     print(" exit - Quit program")
-    print("--------------------------------------")
\ No newline at end of file
+    print("--------------------------------------")
@@ -0,0 +1,147 @@
+"""
+Buffered rendering of search traces.
+
+``print_trace_event`` writes every line as it arrives, which is fine for a
+handful of steps but floods the terminal (and dominates the run time) when a
+linear scan over a million elements emits a million steps. ``TraceRenderer``
+is a tracer that:
+
+- collects output in memory and writes it to the stream in large chunks,
+- prints only the first ``head`` and last ``tail`` steps, replacing the
+  middle with a single "... N steps omitted ..." line,
+- switches to a summary (header and result only) when the output is not a
+  terminal, e.g. when piped to a file.
+"""
+
+import sys
+import time
+from collections import deque
+
+from ..core import tracing
+from .trace_printer import format_trace_event
+
+# Steps printed before the middle of a long trace is elided
+HEAD_STEPS = 50
+
+# Steps kept from the end of a long trace
+TAIL_STEPS = 20
+
+# Buffered output is written once it grows past this many characters
+FLUSH_CHARS = 64 * 1024
+
+_FINAL_KINDS = (tracing.FOUND, tracing.NOT_FOUND, tracing.EMPTY, tracing.BOUND, tracing.COUNT)
+
+
+class TraceRenderer:
+    """
+    Tracer that renders step events through a single buffered writer.
+
+    Create one renderer per search and pass it (or a ``tee`` including it)
+    as the ``tracer`` argument. Output is written when the buffer fills and
+    when the search finishes; call ``flush()`` to force it out earlier.
+
+    Attributes:
+        steps (int): Step events seen so far.
+        omitted (int): Step events elided from the output.
+        render_ns (int): Time spent formatting and writing, in nanoseconds.
+    """
+
+    def __init__(self, stream=None, head=HEAD_STEPS, tail=TAIL_STEPS, summary=None,
+                 live=False):
+        """
+        Args:
+            stream: Text stream to write to (default: sys.stdout).
+            head (int): Steps printed before eliding (None prints every step).
+            tail (int): Steps printed from the end of an elided trace.
+            summary (bool): Print only the header and result (default: when
+                ``stream`` is not a TTY).
+            live (bool): Write after every step instead of in chunks (used by
+                paced replays).
+        """
+        self.stream = stream if stream is not None else sys.stdout
+        if summary is None:
+            isatty = getattr(self.stream, "isatty", None)
+            summary = not (isatty and isatty())
+        self.summary = summary
+        self.head = head
+        self.live = live
+        self.steps = 0
+        self.omitted = 0
+        self.render_ns = 0
+        self._reported = 0
+        self._tail = deque(maxlen=max(0, tail)) if head is not None else None
+        self._buffer = []
+        self._size = 0
+
+    def __call__(self, event):
+        start = time.perf_counter_ns()
+        self._render(event)
+        self.render_ns += time.perf_counter_ns() - start
+
+    def _render(self, event):
+        kind = event.kind
+
+        if kind == tracing.STEP:
+            self.steps += 1
+            if self.summary:
+                return
+            if self.head is None or self.steps <= self.head:
+                self._emit(format_trace_event(event))
+                if self.live:
+                    self.flush()
+                return
+            # Past the head: keep only the most recent steps
+            self._tail.append(event)
+            return
+
+        if kind in _FINAL_KINDS:
+            self._emit_tail()
+            self._emit(format_trace_event(event))
+            self.flush()
+            return
+
+        if kind == tracing.IO:
+            # Reported just before the final event; keep it after the last steps
+            self._emit_tail()
+
+        if kind == tracing.SORTED and self.summary:
+            return
+        self._emit(format_trace_event(event))
+
+    def _emit_tail(self):
+        """Write the omitted-steps marker and the buffered tail steps."""
+        if self._reported == self.steps:
+            return
+        self._reported = self.steps
+        if self.summary:
+            if self.steps:
+                self._emit([f"({self.steps:,} steps; step details hidden in summary output)"])
+            return
+        if self.head is None:
+            return
+        self.omitted = max(0, self.steps - self.head - len(self._tail))
+        if self.omitted:
+            self._emit([f"… {self.omitted:,} steps omitted …\n"])
+        for event in self._tail:
+            self._emit(format_trace_event(event))
+        self._tail.clear()
+
+    def write(self, text):
+        """Add a line of free text to the output, in order with the trace."""
+        self._emit([text])
+
+    def _emit(self, lines):
+        for line in lines:
+            self._buffer.append(line)
+            self._size += len(line) + 1
+        if self._size >= FLUSH_CHARS:
+            self.flush()
+
+    def flush(self):
+        """Write any buffered output to the stream."""
+        if self._buffer:
+            self._buffer.append("")
+            self.stream.write("\n".join(self._buffer))
+            self._buffer = []
+            self._size = 0
+        self.stream.flush()
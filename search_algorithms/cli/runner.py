@@ -0,0 +1,260 @@
+"""
+Non-interactive query execution for scripts and pipelines.
+
+``QueryRunner`` answers one search request at a time without prompting:
+``/run --question Q3 --algo binary --target 9`` runs a single query, and
+``/run --stdin`` streams newline-delimited JSON requests through one process,
+writing one JSON result per line. Per-question state (fingerprint, profile,
+sorted and hash indexes) is built on first use and reused by every later
+request, and results are written to the history log in batches.
+"""
+
+import json
+import sys
+
+from ..core.registry import get_algorithm, run_algorithm, profile_dataset, auto_select
+from ..core.sorted_index import get_sorted_index
+from ..core.hash_index import get_hash_index
+from ..core.bloom import get_bloom_filter
+from ..utils import make_result, save_results, convert_num, PhaseTimer
+
+# Results buffered before one bulk write to the history log
+LOG_BATCH = 1000
+
+
+class QueryError(ValueError):
+    """A request that cannot be answered (unknown question, bad target, ...)."""
+
+
+class _Dataset:
+    """Per-list state kept between requests."""
+
+    __slots__ = ("arr", "profile", "sorted_index", "hash_index", "bloom")
+
+    def __init__(self, arr):
+        self.arr = arr
+        self.profile = profile_dataset(arr)
+        self.sorted_index = None
+        self.hash_index = None
+        # None unless --bloom is on
+        self.bloom = get_bloom_filter(arr, self.profile.key)
+
+    def ensure_sorted(self):
+        if self.sorted_index is None:
+            self.sorted_index = get_sorted_index(self.arr, self.profile.key,
+                                                 self.profile.is_sorted)
+        return self.sorted_index
+
+    def ensure_hashed(self):
+        if self.hash_index is None:
+            self.hash_index = get_hash_index(self.arr, self.profile.key)
+        return self.hash_index
+
+
+class QueryRunner:
+    """
+    Answer search requests against loaded questions without any prompts.
+
+    A request is a dict with:
+        question (str): Question key (or "values": list of integers instead).
+        algo (str): Registry key or name, or "auto" (default: "auto").
+        target (int): The value to find.
+        id: Optional request id, echoed back as ``request_id``.
+    """
+
+    def __init__(self, questions, log=True, sink=None):
+        """
+        Args:
+            questions (dict): Question key -> list of integers.
+            log (bool): Write each result to the history log.
+            sink (callable): Called with each result record instead of the
+                built-in batched log writer (only when ``log`` is True).
+        """
+        self.questions = questions
+        self.log = log
+        self.sink = sink
+        self._datasets = {}
+        self._pending = []
+
+    def dataset(self, question):
+        """Return the cached per-question state, loading it on first use."""
+        dataset = self._datasets.get(question)
+        if dataset is None:
+            if question not in self.questions:
+                raise QueryError(f"Unknown question: {question}")
+            dataset = self._datasets[question] = _Dataset(self.questions[question])
+        return dataset
+
+    def resolve(self, request):
+        """
+        Return ``(question label, dataset state)`` for a request.
+
+        Raises:
+            QueryError: If neither a known question nor valid values are given.
+        """
+        if "values" in request:
+            values = request["values"]
+            if not isinstance(values, list) or not all(
+                    isinstance(v, int) and not isinstance(v, bool) for v in values):
+                raise QueryError("'values' must be a list of integers")
+            return "inline: " + " ".join(str(v) for v in values), _Dataset(values)
+
+        question = request.get("question")
+        if not isinstance(question, str):
+            raise QueryError("Request needs a 'question' key or 'values'")
+        return question, self.dataset(question)
+
+    def run(self, request, mode=None):
+        """
+        Answer one request.
+
+        Args:
+            request (dict): See the class docstring.
+            mode (str): Label appended to the logged method, e.g. "Compare Mode".
+
+        Returns:
+            dict: question, algorithm, method, target, found, index (in the
+                searched list), original_index, steps, the history id and
+                phase timings (``timings_ns``).
+
+        Raises:
+            QueryError: If the request is invalid.
+        """
+        if not isinstance(request, dict):
+            raise QueryError("Request must be a JSON object")
+
+        target = request.get("target")
+        if isinstance(target, str):
+            parsed = convert_num(target)
+            target = parsed[0] if parsed and len(parsed) == 1 else None
+        if not isinstance(target, int) or isinstance(target, bool):
+            raise QueryError("Request needs an integer 'target'")
+
+        question, dataset = self.resolve(request)
+
+        name = str(request.get("algo") or "auto")
+        if name.lower() == "auto":
+            algorithm, _, _ = auto_select(dataset.arr, dataset.profile)
+            method = f"{algorithm.name} (Auto)"
+        else:
+            algorithm = get_algorithm(name)
+            if algorithm is None:
+                raise QueryError(f"Unknown algorithm: {name}")
+            method = algorithm.name
+        if mode:
+            method = f"{algorithm.name} ({mode})"
+
+        timer = PhaseTimer()
+        # Targets the Bloom filter rules out never need an index built
+        needed = dataset.bloom is None or dataset.bloom.might_contain(target)
+        if needed and algorithm.requires_sorted and dataset.sorted_index is None:
+            with timer.phase("sort"):
+                dataset.ensure_sorted()
+        if needed and algorithm.hashed and dataset.hash_index is None:
+            with timer.phase("build"):
+                dataset.ensure_hashed()
+
+        with timer.phase("search"):
+            index, steps = run_algorithm(algorithm, dataset.arr, target,
+                                         index=dataset.sorted_index,
+                                         hash_index=dataset.hash_index,
+                                         bloom=dataset.bloom)
+        if algorithm.requires_sorted and index != -1:
+            original = dataset.sorted_index.original_index(index)
+        else:
+            original = index
+
+        entry = make_result(
+            question=question,
+            method=method,
+            time_complexity=algorithm.time_complexity,
+            space_complexity=algorithm.space_complexity,
+            steps=steps,
+            found=index != -1,
+            target=target,
+            **timer.fields()
+        )
+        if dataset.bloom is not None:
+            entry.update(dataset.bloom.fields())
+        self.record(entry)
+
+        result = {
+            "question": question,
+            "algorithm": algorithm.key,
+            "method": method,
+            "target": target,
+            "found": index != -1,
+            "index": index,
+            "original_index": original,
+            "steps": steps,
+            "id": entry["id"],
+            "timings_ns": entry["timings_ns"],
+        }
+        if dataset.bloom is not None:
+            result["bloom"] = entry["bloom"]
+        if "id" in request:
+            result["request_id"] = request["id"]
+        return result
+
+    def run_stream(self, lines, out=None):
+        """
+        Answer newline-delimited JSON requests, writing one JSON line per result.
+
+        Invalid lines produce ``{"error": ..., "line": n}`` instead of stopping
+        the stream.
+
+        Args:
+            lines (iterable): Input lines (e.g. ``sys.stdin``).
+            out: Text stream for results (default: sys.stdout).
+
+        Returns:
+            tuple: (answered, failed) counts.
+        """
+        out = out if out is not None else sys.stdout
+        answered = failed = 0
+        try:
+            for number, line in enumerate(lines, 1):
+                if not line.strip():
+                    continue
+                try:
+                    result = self.run(json.loads(line))
+                    answered += 1
+                except ValueError as e:
+                    result = {"error": str(e), "line": number}
+                    failed += 1
+                out.write(json.dumps(result, separators=(",", ":")) + "\n")
+                # Flushed per line so a caller can read each answer as it arrives
+                out.flush()
+        finally:
+            self.flush()
+        return answered, failed
+
+    def record(self, entry):
+        """Send one result record to the sink or the batched history log."""
+        if not self.log:
+            return
+        if self.sink is not None:
+            self.sink(entry)
+            return
+        self._pending.append(entry)
+        if len(self._pending) >= LOG_BATCH:
+            self.flush()
+
+    def flush(self):
+        """Write buffered results to the history log."""
+        if self._pending:
+            save_results(self._pending)
+            self._pending = []
+
+
+def format_result(result):
+    """
+    Format one ``QueryRunner.run`` result as a single human-readable line.
+    """
+    head = f"{result['question']} | {result['method']} | target {result['target']}: "
+    if not result["found"]:
+        return head + f"Not found ({result['steps']} steps)"
+    where = f"index {result['original_index']}"
+    if result["index"] != result["original_index"]:
+        where += f" (index {result['index']} in sorted list)"
+    return head + f"Found at {where} ({result['steps']} steps)"
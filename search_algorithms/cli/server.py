@@ -0,0 +1,314 @@
+"""
+Local HTTP query service (``/serve``).
+
+A small HTTP/1.1 server built on ``asyncio`` streams (standard library only)
+that answers queries against questions loaded once at startup. Sorted and
+hash indexes stay in memory between requests through a shared
+``QueryRunner``, and result records are handed to a single background writer
+task that appends them to the history log in batches.
+
+Requests are handled one at a time on a worker thread, so history reads and
+cold index builds never block the event loop: other connections are still
+accepted and parsed while a slow request runs.
+
+Endpoints (GET with query parameters, or POST with a JSON body):
+
+    /search   question, target, algo          one search
+    /batch    question, targets               many targets, one sorted index
+    /compare  question, target                every registered algorithm
+    /history  limit, method, question, found  newest entries first (position -1)
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qsl
+
+from ..core.batch import BATCH, batch_search
+from ..core.registry import list_algorithms
+from ..utils import iter_history, save_results, make_result, convert_num
+from .runner import QueryRunner, QueryError
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Largest request body accepted, in bytes
+MAX_BODY = 1024 * 1024
+
+# Most records the writer appends in one write
+WRITE_BATCH = 1000
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HistoryWriter:
+    """
+    Background task that owns all writes to the history log.
+
+    Handlers call ``submit`` (non-blocking, from any thread); the task drains
+    the queue and appends everything waiting as one batch in a worker thread.
+    """
+
+    def __init__(self):
+        self._queue = asyncio.Queue()
+        self._loop = None
+        self._task = None
+        self.written = 0
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._task = self._loop.create_task(self._run())
+
+    def submit(self, entry):
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, entry)
+
+    @property
+    def pending(self):
+        """Number of records waiting to be written."""
+        return self._queue.qsize()
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < WRITE_BATCH and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            await loop.run_in_executor(None, save_results, batch)
+            self.written += len(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    async def close(self):
+        """Wait for queued records to be written, then stop the task."""
+        if self._task is None:
+            return
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+class SearchService:
+    """
+    Request handlers for the HTTP endpoints.
+
+    Each handler takes the request parameters as a dict and returns a
+    JSON-serialisable result, raising ``QueryError`` for bad input.
+    """
+
+    def __init__(self, questions, writer):
+        self.writer = writer
+        self.runner = QueryRunner(questions, sink=writer.submit)
+        self.routes = {
+            "/search": self.search,
+            "/batch": self.batch,
+            "/compare": self.compare,
+            "/history": self.history,
+        }
+
+    def search(self, params):
+        return self.runner.run(params)
+
+    def batch(self, params):
+        targets = params.get("targets")
+        if isinstance(targets, str):
+            targets = convert_num(targets)
+        if not isinstance(targets, list) or not targets or not all(
+                isinstance(t, int) and not isinstance(t, bool) for t in targets):
+            raise QueryError("Request needs 'targets' as a list of integers")
+
+        question, dataset = self.runner.resolve(params)
+        index = dataset.ensure_sorted() if len(dataset.arr) else None
+        results = batch_search(dataset.arr, targets, index=index)
+
+        for r in results:
+            self.runner.record(make_result(
+                question=question,
+                method=BATCH,
+                time_complexity="O(log n)",
+                space_complexity="O(1)",
+                steps=r.steps,
+                found=r.index != -1,
+                target=r.target,
+            ))
+        return {
+            "question": question,
+            "results": [r._asdict() for r in results],
+            "found": sum(1 for r in results if r.index != -1),
+        }
+
+    def compare(self, params):
+        results = []
+        for algorithm in list_algorithms():
+            results.append(self.runner.run(dict(params, algo=algorithm.key),
+                                           mode="Compare Mode"))
+        return {"results": results}
+
+    def history(self, params):
+        try:
+            limit = int(params.get("limit", 20))
+        except (TypeError, ValueError):
+            raise QueryError("'limit' must be an integer")
+        try:
+            matches = iter_history(method=params.get("method"), question=params.get("question"),
+                                   found=params.get("found"), reverse=True)
+            entries = []
+            for position, entry in matches:
+                if len(entries) >= limit:
+                    break
+                entries.append(dict(entry, position=position))
+        except ValueError as e:
+            raise QueryError(str(e))
+        return {"entries": entries, "pending_writes": self.writer.pending}
+
+    def handle(self, method, target, body):
+        """
+        Route one request.
+
+        Returns:
+            tuple: (status code, JSON-serialisable payload)
+        """
+        url = urlsplit(target)
+        handler = self.routes.get(url.path.rstrip("/") or "/")
+        if handler is None:
+            return 404, {"error": f"Unknown endpoint: {url.path}",
+                         "endpoints": sorted(self.routes)}
+
+        params = dict(parse_qsl(url.query))
+        if method == "POST" and body:
+            try:
+                payload = json.loads(body)
+            except ValueError as e:
+                return 400, {"error": f"Invalid JSON body: {e}"}
+            if not isinstance(payload, dict):
+                return 400, {"error": "JSON body must be an object"}
+            params.update(payload)
+        elif method not in ("GET", "POST"):
+            return 405, {"error": f"Method {method} not allowed"}
+
+        for key in ("target", "limit"):
+            if isinstance(params.get(key), str):
+                parsed = convert_num(params[key])
+                if parsed is not None and len(parsed) == 1:
+                    params[key] = parsed[0]
+
+        try:
+            return 200, handler(params)
+        except QueryError as e:
+            return 400, {"error": str(e)}
+
+
+async def _handle_connection(service, executor, reader, writer):
+    """Serve requests on one connection until the client closes it."""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+            except ValueError:
+                await _respond(writer, 400, {"error": "Malformed request line"}, False)
+                break
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            try:
+                length = int(headers.get("content-length", 0) or 0)
+                if length < 0:
+                    raise ValueError
+            except ValueError:
+                await _respond(writer, 400, {"error": "Invalid Content-Length"}, False)
+                break
+            if length > MAX_BODY:
+                await _respond(writer, 413, {"error": "Request body too large"}, False)
+                break
+            body = await reader.readexactly(length) if length else b""
+
+            keep_alive = (version == "HTTP/1.1"
+                          and headers.get("connection", "").lower() != "close")
+            try:
+                status, payload = await asyncio.get_running_loop().run_in_executor(
+                    executor, service.handle, method.upper(), target, body)
+            except Exception as e:
+                status, payload = 500, {"error": str(e)}
+            await _respond(writer, status, payload, keep_alive)
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    except asyncio.CancelledError:
+        pass  # server shutting down with the connection still open
+    finally:
+        writer.close()
+
+
+async def _respond(writer, status, payload, keep_alive):
+    body = json.dumps(payload).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+
+
+async def serve(questions, host=DEFAULT_HOST, port=DEFAULT_PORT, ready=None):
+    """
+    Run the HTTP service until cancelled.
+
+    Args:
+        questions (dict): Question key -> list of integers.
+        host (str): Interface to bind (default: localhost only).
+        port (int): TCP port (0 picks a free one).
+        ready (callable): Called with the bound (host, port) once listening.
+    """
+    history_writer = HistoryWriter()
+    history_writer.start()
+    service = SearchService(questions, history_writer)
+    # One thread, so the runner's index caches are never built concurrently
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="search")
+
+    server = await asyncio.start_server(
+        lambda r, w: _handle_connection(service, executor, r, w), host, port
+    )
+    address = server.sockets[0].getsockname()[:2]
+    if ready is not None:
+        ready(address)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        executor.shutdown(wait=True)
+        await history_writer.close()
+
+
+def run_server(questions, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """
+    Start the HTTP service in the foreground (Ctrl+C to stop).
+
+    Args:
+        questions (dict): Question key -> list of integers.
+        host (str): Interface to bind.
+        port (int): TCP port.
+    """
+    def announce(address):
+        print(f"\nServing {len(questions)} questions on http://{address[0]}:{address[1]}")
+        print("Endpoints: /search  /batch  /compare  /history   (Ctrl+C to stop)")
+
+    try:
+        asyncio.run(serve(questions, host, port, ready=announce))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
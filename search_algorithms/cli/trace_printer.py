@@ -0,0 +1,144 @@
+"""
+Console rendering of search step events.
+"""
+
+from ..core import tracing
+from ..utils import format_list_plain
+
+_DECISION_TEXT = {
+    tracing.MATCH: "=> Match found",
+    tracing.NEXT: "=> Not equal, moving next\n",
+    tracing.RIGHT: "=> element < target , searching RIGHT half (low = mid + 1)\n",
+    tracing.LEFT: "=> element > target , searching LEFT half (high = mid - 1)\n",
+    tracing.MIDDLE: "=> target between the two probes , searching MIDDLE third\n",
+    tracing.EXPAND: "=> element < target , doubling the bound\n",
+    tracing.RANGE: "=> element > target , binary search inside the last range\n",
+    tracing.JUMP_AHEAD: "=> block end < target , jumping to the next block\n",
+    tracing.BLOCK: "=> block end >= target , scanning this block\n",
+    tracing.PASSED: "=> element > target , target cannot appear later\n",
+    tracing.LOWER_LEFT: "=> element >= target , bound is at mid or LEFT of it (high = mid)\n",
+    tracing.UPPER_RIGHT: "=> element <= target , bound is RIGHT of mid (low = mid + 1)\n",
+    tracing.UPPER_LEFT: "=> element > target , bound is at mid or LEFT of it (high = mid)\n",
+    tracing.NODE_LEFT: "=> element >= target , going to the LEFT child node\n",
+    tracing.NODE_RIGHT: "=> element < target , going to the RIGHT child node\n",
+    tracing.DESCEND: "=> first key >= target , descending into the block it ends\n",
+    tracing.LEAF_MISS: "=> first element >= target is not the target\n",
+    tracing.PAST_END: "=> every key < target , target is past the end\n",
+}
+
+
+def format_trace_event(event):
+    """
+    Format one StepEvent as lines of the step-by-step explanation.
+
+    Args:
+        event (StepEvent): Event emitted by a search algorithm.
+
+    Returns:
+        list: Output lines (without trailing newlines).
+    """
+    name = event.algorithm
+    kind = event.kind
+
+    if kind == tracing.START:
+        return [f"\n--------- {name.upper()} ---------"]
+
+    if kind == tracing.EMPTY:
+        return ["List is empty. Nothing to search."]
+
+    if kind == tracing.SORTED:
+        lines = [f"Note: {name} works on a sorted list."]
+        if event.value is not None:
+            lines.append("Sorted list used:")
+            lines.append(format_list_plain(event.value))
+        return lines
+
+    if kind == tracing.STEP:
+        if event.decision == tracing.HASHED:
+            line = f"Step {event.step} : hash lookup of target = {event.target}"
+            if event.index is None:
+                return [line, "=> Not in the hash index\n"]
+            return [line, f"=> Hash index points to index {event.index} , element = {event.value}"]
+        if event.decision == tracing.BLOOM_MISS:
+            return [f"Step {event.step} : Bloom filter check of target = {event.target}",
+                    "=> Definitely not in the list , search skipped\n"]
+        if event.decision in (tracing.CHUNK_CLEAR, tracing.CHUNK_MATCH):
+            line = f"Step {event.step} : chunk of indices {event.low} to {event.high - 1} scanned"
+            if event.decision == tracing.CHUNK_CLEAR:
+                return [line, "=> No match in this chunk\n"]
+            return [line, f"=> Match at index {event.index} , earliest in the list"]
+        if event.decision == tracing.FILE_CHUNK:
+            return [
+                f"Step {event.step} : read bytes {event.low} to {event.high - 1} "
+                f"(elements up to index {event.step - 1})",
+                "=> No match in this chunk\n",
+            ]
+        if event.mid is None:
+            line = (
+                f"Step {event.step} : index = {event.index} , "
+                f"element = {event.value} , target = {event.target}"
+            )
+        else:
+            line = (
+                f"Step {event.step} : low = {event.low} , high = {event.high} , "
+                f"mid = {event.mid} , element = {event.value} , target = {event.target}"
+            )
+        if event.origin is not None:
+            # File searches report where the element sits on disk
+            line += f" , byte offset = {event.origin}"
+        decision = _DECISION_TEXT.get(event.decision)
+        return [line, decision] if decision else [line]
+
+    if kind == tracing.FOUND:
+        # Events carrying ``mid`` come from a search over the sorted copy
+        where = ""
+        if event.mid is not None:
+            where = " (in sorted list)"
+            if event.origin is not None:
+                where = f" (in sorted list, index {event.origin} in original list)"
+        return [
+            f"=> Element {event.target} found at index {event.index}{where}",
+            f"Total steps taken ({name}): {event.step}",
+        ]
+
+    if kind == tracing.BOUND:
+        where = ""
+        if event.origin is not None:
+            where = f" (index {event.origin} in original list)"
+        return [
+            f"=> {name} of {event.target} is index {event.index} in sorted list{where}",
+            f"Total steps taken ({name}): {event.step}",
+        ]
+
+    if kind == tracing.COUNT:
+        if event.value:
+            line = (f"=> {event.value} matching element(s) at sorted indices "
+                    f"{event.low} to {event.high - 1}")
+        else:
+            line = "=> No matching elements"
+        return [line, f"Total steps taken ({name}): {event.step}"]
+
+    if kind == tracing.IO:
+        return [f"Disk reads: {event.value:,} page(s), {event.high:,} bytes"]
+
+    if kind == tracing.NOT_FOUND:
+        return [
+            "=> Element not found",
+            f"Total steps taken ({name}): {event.step}",
+        ]
+
+    return []
+
+
+def print_trace_event(event):
+    """
+    Print one StepEvent as the step-by-step explanation shown in the CLI.
+
+    Pass this function as the ``tracer`` argument of a search algorithm.
+    For long searches prefer ``TraceRenderer``, which buffers and elides output.
+
+    Args:
+        event (StepEvent): Event emitted by a search algorithm.
+    """
+    for line in format_trace_event(event):
+        print(line)
@@ -6,14 +6,17 @@ from pathlib import Path
 # Project root
 PROJECT_ROOT = Path(__file__).parent.absolute()
 
-# Data files
-DATA_DIR = PROJECT_ROOT / "data"
+# Data files (the data directory sits next to the package)
+DATA_DIR = PROJECT_ROOT.parent / "data"
 QUESTIONS_FILE = DATA_DIR / "questions.json"
 
+# On-disk caches (sorted indexes, memoized results)
+CACHE_DIR = PROJECT_ROOT.parent / ".search_cache"
+
 # Logging
 LOG_DIR = PROJECT_ROOT / "logs"
-LOG_DIR.mkdir(exist_ok=True)
-RESULTS_FILE = PROJECT_ROOT / "results.json"
+RESULTS_FILE = PROJECT_ROOT / "results.jsonl"
+LEGACY_RESULTS_FILE = PROJECT_ROOT / "results.json"
 
 # Application
 APP_NAME = "Search Algorithms Explainer"
@@ -26,11 +29,25 @@ VERBOSE = False
 # Algorithm settings
 LINEAR_SEARCH_COMPLEXITY = "O(n)"
 BINARY_SEARCH_COMPLEXITY = "O(log n)"
+INTERPOLATION_SEARCH_COMPLEXITY = "O(log log n)"
+EXPONENTIAL_SEARCH_COMPLEXITY = "O(log i)"
+JUMP_SEARCH_COMPLEXITY = "O(sqrt(n))"
+TERNARY_SEARCH_COMPLEXITY = "O(log3 n)"
+HASH_INDEX_COMPLEXITY = "O(1)"
+PARALLEL_LINEAR_COMPLEXITY = "O(n / p)"
+EYTZINGER_SEARCH_COMPLEXITY = "O(log n)"
+BTREE_SEARCH_COMPLEXITY = "O(log9 n)"
 
 def get_questions_file():
     """Get the path to questions.json file."""
     return str(QUESTIONS_FILE)
 
 def get_results_file():
-    """Get the path to results.json file."""
+    """Get the path to the results.jsonl log."""
     return str(RESULTS_FILE)
+
+
+def ensure_log_dir():
+    """Create the logs directory on first use and return its path."""
+    LOG_DIR.mkdir(exist_ok=True)
+    return str(LOG_DIR)
@@ -1,5 +1,73 @@
 """Core search algorithm implementations."""
 
-from .search_algorithms import linear_search, binary_search
+from .search_algorithms import (
+    linear_search,
+    binary_search,
+    interpolation_search,
+    exponential_search,
+    jump_search,
+    ternary_search,
+)
+from .hash_index import HashIndex, hash_search, get_hash_index
+from .bounds import (
+    lower_bound,
+    upper_bound,
+    first_occurrence,
+    last_occurrence,
+    count_occurrences,
+    range_query,
+    Occurrences,
+    RangeMatches,
+)
+from .tracing import StepEvent, StepRecorder, trace_steps
+from .registry import (
+    Algorithm,
+    register_algorithm,
+    get_algorithm,
+    list_algorithms,
+    run_algorithm,
+    profile_dataset,
+    auto_select,
+)
+from .numpy_engine import (
+    HAVE_NUMPY,
+    NumpyDataset,
+    linear_search_np,
+    binary_search_np,
+    batch_search_np,
+)
 
-__all__ = ["linear_search", "binary_search"]
\ No newline at end of file
+__all__ = [
+    "linear_search",
+    "binary_search",
+    "interpolation_search",
+    "exponential_search",
+    "jump_search",
+    "ternary_search",
+    "HashIndex",
+    "hash_search",
+    "get_hash_index",
+    "lower_bound",
+    "upper_bound",
+    "first_occurrence",
+    "last_occurrence",
+    "count_occurrences",
+    "range_query",
+    "Occurrences",
+    "RangeMatches",
+    "StepEvent",
+    "StepRecorder",
+    "trace_steps",
+    "Algorithm",
+    "register_algorithm",
+    "get_algorithm",
+    "list_algorithms",
+    "run_algorithm",
+    "profile_dataset",
+    "auto_select",
+    "HAVE_NUMPY",
+    "NumpyDataset",
+    "linear_search_np",
+    "binary_search_np",
+    "batch_search_np",
+]
@@ -0,0 +1,97 @@
+"""
+Batch lookups: answer many targets against one dataset in a single pass.
+
+The dataset is sorted once (through the shared sorted-index cache), the
+targets are sorted, and each target is located with a bisection that starts
+where the previous, smaller target ended. M queries therefore cost
+O(n log n) once plus O(M log n) at most, instead of M separate sorts.
+"""
+
+from bisect import bisect_left
+from collections import namedtuple
+
+from .sorted_index import get_sorted_index
+
+BATCH = "Batch Binary Search"
+
+BatchResult = namedtuple("BatchResult", ["target", "index", "original_index", "steps"])
+BatchResult.__doc__ = """
+One answer from ``batch_search``.
+
+Fields:
+    target (int): The value that was looked up.
+    index (int): Position in the sorted list, or -1 if not found.
+    original_index (int): First position in the original list, or -1.
+    steps (int): Probes the bisection made to locate the target.
+"""
+
+
+def bisect_probes(lo, hi, pos):
+    """
+    Count the probes ``bisect_left(values, target, lo, hi)`` makes.
+
+    Every probe compares ``values[mid] < target``, which holds exactly when
+    ``mid < pos``, so the path (and its length) follows from the answer
+    ``pos`` alone without touching the values again.
+
+    Args:
+        lo (int): Start of the searched range.
+        hi (int): End of the searched range (exclusive).
+        pos (int): Position ``bisect_left`` returned.
+
+    Returns:
+        int: Number of probes.
+    """
+    probes = 0
+    while lo < hi:
+        probes += 1
+        mid = (lo + hi) // 2
+        if mid < pos:
+            lo = mid + 1
+        else:
+            hi = mid
+    return probes
+
+
+def batch_search(arr, targets, index=None):
+    """
+    Look up every target in ``arr`` using one shared sorted index.
+
+    Args:
+        arr (list): The list to search in.
+        targets (iterable): Target values (duplicates are answered once).
+        index (SortedIndex): Prebuilt sorted index of ``arr`` (optional).
+
+    Returns:
+        list: BatchResult per target, in the order the targets were given.
+
+    Time Complexity: O(n log n) for the first index build, then O(M log n)
+    Space Complexity: O(M)
+    """
+    targets = list(targets)
+    if not targets:
+        return []
+
+    if len(arr) == 0:
+        return [BatchResult(t, -1, -1, 0) for t in targets]
+
+    if index is None:
+        index = get_sorted_index(arr)
+    values = index.values
+    positions = index.positions
+    n = len(values)
+
+    answers = {}
+    lo = 0
+    for target in sorted(set(targets)):
+        # Targets ascend, so each search only covers what is left to the right
+        pos = bisect_left(values, target, lo)
+        steps = bisect_probes(lo, n, pos)
+        lo = pos
+
+        if pos < n and values[pos] == target:
+            answers[target] = BatchResult(target, pos, positions[pos], steps)
+        else:
+            answers[target] = BatchResult(target, -1, -1, steps)
+
+    return [answers[t] for t in targets]
@@ -0,0 +1,267 @@
+"""
+Bloom filter prefilter for fast "not found" answers.
+
+A ``BloomFilter`` remembers every value of a dataset in a compact bit array.
+Asking it about a target answers either "definitely absent" or "maybe
+present"; only the second needs a real search. ``run_algorithm`` consults
+the filter before dispatching, so a miss costs one filter probe instead of
+a full scan or descent.
+
+Filters are opt-in (``enable_bloom``, or ``--bloom`` on the command line),
+built once per dataset and cached per fingerprint and false-positive rate.
+"""
+
+import math
+import time
+from collections import OrderedDict
+
+from .fingerprint import fingerprint
+from .tracing import StepEvent, START, STEP, NOT_FOUND, BLOOM_MISS
+
+# False-positive rate used when --bloom is given without a value
+DEFAULT_FP_RATE = 0.01
+
+# Number of filters kept in memory
+MEMORY_CAPACITY = 32
+
+_MASK = (1 << 64) - 1
+
+# Rate set by enable_bloom; None while filters are off
+_fp_rate = None
+
+
+def _hash_pair(value):
+    """Two independent 32-bit hashes of ``value`` (murmur3 finaliser of ``hash``)."""
+    x = hash(value) & _MASK
+    x = ((x ^ (x >> 33)) * 0xFF51AFD7ED558CCD) & _MASK
+    x = ((x ^ (x >> 33)) * 0xC4CEB9FE1A85EC53) & _MASK
+    x ^= x >> 33
+    return x & 0xFFFFFFFF, (x >> 32) | 1
+
+
+class BloomFilter:
+    """
+    Set-membership filter with no false negatives.
+
+    Attributes:
+        bits (bytearray): The bit array.
+        size (int): Number of bits.
+        hashes (int): Bits set per value.
+        fp_rate (float): False-positive rate the filter was sized for.
+        fingerprint (str): Content hash of the dataset.
+        build_ns (int): Time taken to build the filter, in nanoseconds.
+        hits (int): Checks answered "maybe present" (search dispatched).
+        misses (int): Checks answered "definitely absent" (search skipped).
+        false_positives (int): Dispatched searches that found nothing.
+        last (bool): Outcome of the latest check, or None before the first.
+    """
+
+    __slots__ = ("bits", "size", "hashes", "fp_rate", "fingerprint", "build_ns", "hits",
+                 "misses", "false_positives", "last")
+
+    def __init__(self, bits, size, hashes, fp_rate, fingerprint=None, build_ns=0):
+        self.bits = bits
+        self.size = size
+        self.hashes = hashes
+        self.fp_rate = fp_rate
+        self.fingerprint = fingerprint
+        self.build_ns = build_ns
+        self.hits = 0
+        self.misses = 0
+        self.false_positives = 0
+        self.last = None
+
+    @classmethod
+    def build(cls, arr, fp_rate=DEFAULT_FP_RATE, key=None):
+        """
+        Add every distinct value of ``arr`` to a filter sized for ``fp_rate``.
+
+        Args:
+            arr (list): The dataset.
+            fp_rate (float): Target false-positive rate, between 0 and 1.
+            key (str): Precomputed fingerprint of ``arr`` (optional).
+
+        Returns:
+            BloomFilter: The new filter.
+
+        Raises:
+            ValueError: If ``fp_rate`` is not between 0 and 1.
+        """
+        if not 0 < fp_rate < 1:
+            raise ValueError(f"Bloom filter false-positive rate must be between 0 and 1, "
+                             f"not {fp_rate}")
+        start = time.perf_counter_ns()
+        distinct = set(arr)
+        n = max(1, len(distinct))
+        # Optimal sizing: m = -n ln p / (ln 2)^2 bits and k = (m / n) ln 2 hashes
+        size = max(8, math.ceil(-n * math.log(fp_rate) / math.log(2) ** 2))
+        hashes = max(1, round(size / n * math.log(2)))
+
+        bits = bytearray((size + 7) // 8)
+        for value in distinct:
+            h1, h2 = _hash_pair(value)
+            for i in range(hashes):
+                bit = (h1 + i * h2) % size
+                bits[bit >> 3] |= 1 << (bit & 7)
+        return cls(bits, size, hashes, fp_rate, key, time.perf_counter_ns() - start)
+
+    def might_contain(self, value):
+        """
+        Return False if ``value`` is definitely not in the dataset.
+        """
+        h1, h2 = _hash_pair(value)
+        bits = self.bits
+        size = self.size
+        for i in range(self.hashes):
+            bit = (h1 + i * h2) % size
+            if not bits[bit >> 3] & (1 << (bit & 7)):
+                return False
+        return True
+
+    __contains__ = might_contain
+
+    def check(self, value):
+        """
+        ``might_contain`` that also updates the hit/miss counters.
+
+        Returns:
+            bool: True if a search is still needed.
+        """
+        self.last = self.might_contain(value)
+        if self.last:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return self.last
+
+    def fields(self):
+        """
+        Result-record fields for the latest check.
+
+        Returns:
+            dict: ``bloom`` ("pass" or "miss") and the filter's running
+                ``bloom_hits``, ``bloom_misses`` and ``bloom_false_positives``.
+        """
+        if self.last is None:
+            return {}
+        return {
+            "bloom": "pass" if self.last else "miss",
+            "bloom_hits": self.hits,
+            "bloom_misses": self.misses,
+            "bloom_false_positives": self.false_positives,
+        }
+
+    def __len__(self):
+        return len(self.bits)
+
+
+class BloomFilterCache:
+    """
+    LRU cache of Bloom filters keyed on dataset fingerprint and rate.
+    """
+
+    def __init__(self, capacity=MEMORY_CAPACITY):
+        """
+        Args:
+            capacity (int): Maximum number of filters held in memory.
+        """
+        self.capacity = max(1, int(capacity))
+        self._entries = OrderedDict()
+
+    def get(self, arr, key=None, fp_rate=DEFAULT_FP_RATE):
+        """
+        Return the filter for ``arr``, building it only on a cache miss.
+
+        Args:
+            arr (list): The dataset.
+            key (str): Precomputed fingerprint of ``arr`` (optional).
+            fp_rate (float): Target false-positive rate.
+
+        Returns:
+            BloomFilter: Filter for ``arr``.
+        """
+        if key is None:
+            key = fingerprint(arr)
+
+        bloom = self._entries.get((key, fp_rate))
+        if bloom is not None:
+            self._entries.move_to_end((key, fp_rate))
+            return bloom
+
+        bloom = BloomFilter.build(arr, fp_rate, key)
+        self._entries[(key, fp_rate)] = bloom
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        return bloom
+
+    def clear(self):
+        """Drop every cached filter."""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_default_cache = None
+
+
+def get_bloom_cache():
+    """
+    Return the process-wide Bloom filter cache, creating it on first use.
+
+    Returns:
+        BloomFilterCache: The shared cache.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = BloomFilterCache()
+    return _default_cache
+
+
+def enable_bloom(fp_rate=DEFAULT_FP_RATE):
+    """
+    Turn Bloom prefiltering on for the rest of the process.
+
+    Args:
+        fp_rate (float): False-positive rate, or None to turn filtering off.
+
+    Raises:
+        ValueError: If ``fp_rate`` is not between 0 and 1.
+    """
+    global _fp_rate
+    if fp_rate is not None and not 0 < fp_rate < 1:
+        raise ValueError(f"Bloom filter false-positive rate must be between 0 and 1, "
+                         f"not {fp_rate}")
+    _fp_rate = fp_rate
+
+
+def get_bloom_filter(arr, key=None, fp_rate=None):
+    """
+    Return the cached filter for ``arr``, or None while filtering is off.
+
+    Args:
+        arr (list): The dataset.
+        key (str): Precomputed fingerprint of ``arr`` (optional).
+        fp_rate (float): Rate to use instead of the one set by ``enable_bloom``.
+
+    Returns:
+        BloomFilter or None: Filter for ``arr``.
+    """
+    fp_rate = fp_rate if fp_rate is not None else _fp_rate
+    if fp_rate is None or not len(arr):
+        return None
+    return get_bloom_cache().get(arr, key, fp_rate)
+
+
+def bloom_reject(name, target, tracer=None):
+    """
+    Report a search skipped because the filter ruled ``target`` out.
+
+    Returns:
+        tuple: (-1, 1), the one step being the filter probe.
+    """
+    if tracer is not None:
+        tracer(StepEvent(name, START, target=target))
+        tracer(StepEvent(name, STEP, 1, target=target, decision=BLOOM_MISS))
+        tracer(StepEvent(name, NOT_FOUND, 1, target=target))
+    return -1, 1
@@ -0,0 +1,309 @@
+"""
+Duplicate-aware searches over the sorted index.
+
+``binary_search`` stops at whichever equal element it probes first, so on
+data with repeated values it cannot say where the run of matches starts or
+ends. The bound searches here keep bisecting after a match:
+
+- ``lower_bound``: first sorted position whose value is >= target
+- ``upper_bound``: first sorted position whose value is > target
+
+From those follow the first and last occurrence of a target, the number of
+occurrences, and range queries over ``[low, high]``, each in O(log n) steps
+on the cached sorted index. All of them accept a ``tracer`` like the other
+algorithms.
+"""
+
+from collections import namedtuple
+
+from .search_algorithms import _prepare_sorted
+from .tracing import (
+    StepEvent,
+    STEP,
+    FOUND,
+    NOT_FOUND,
+    BOUND,
+    COUNT,
+    RIGHT,
+    LOWER_LEFT,
+    UPPER_RIGHT,
+    UPPER_LEFT,
+)
+
+LOWER_BOUND = "Lower Bound"
+UPPER_BOUND = "Upper Bound"
+FIRST_OCCURRENCE = "First Occurrence"
+LAST_OCCURRENCE = "Last Occurrence"
+COUNT_OCCURRENCES = "Count Occurrences"
+RANGE_QUERY = "Range Query"
+
+Occurrences = namedtuple("Occurrences", ["first", "last", "count", "steps"])
+Occurrences.__doc__ = """
+Result of ``count_occurrences``.
+
+Fields:
+    first (int): Sorted position of the first match, or -1.
+    last (int): Sorted position of the last match, or -1.
+    count (int): Number of matches.
+    steps (int): Probes made by both bound searches.
+"""
+
+
+def lower_bound(arr, target, tracer=None, index=None):
+    """
+    Find the first position in the sorted list whose value is >= ``target``.
+
+    Args:
+        arr (list): The list to search in (will be sorted).
+        target (int): The value to bound.
+        tracer (callable): Optional sink called with a StepEvent per step.
+        index (SortedIndex): Prebuilt sorted index of ``arr`` (optional).
+
+    Returns:
+        tuple: (position_in_sorted_array (len(arr) if every value is smaller), steps_taken)
+
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+    """
+    index = _prepare_sorted(LOWER_BOUND, arr, target, tracer, index)
+    if index is None:
+        return 0, 0
+    pos, steps = _bound(LOWER_BOUND, index.values, target, 0, len(index.values), False, 0,
+                        tracer)
+    _report_bound(LOWER_BOUND, index, pos, steps, target, tracer)
+    return pos, steps
+
+
+def upper_bound(arr, target, tracer=None, index=None):
+    """
+    Find the first position in the sorted list whose value is > ``target``.
+
+    Args:
+        arr (list): The list to search in (will be sorted).
+        target (int): The value to bound.
+        tracer (callable): Optional sink called with a StepEvent per step.
+        index (SortedIndex): Prebuilt sorted index of ``arr`` (optional).
+
+    Returns:
+        tuple: (position_in_sorted_array (len(arr) if no value is larger), steps_taken)
+
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+    """
+    index = _prepare_sorted(UPPER_BOUND, arr, target, tracer, index)
+    if index is None:
+        return 0, 0
+    pos, steps = _bound(UPPER_BOUND, index.values, target, 0, len(index.values), True, 0,
+                        tracer)
+    _report_bound(UPPER_BOUND, index, pos, steps, target, tracer)
+    return pos, steps
+
+
+def first_occurrence(arr, target, tracer=None, index=None):
+    """
+    Find the first occurrence of ``target`` in the sorted list.
+
+    Args:
+        arr (list): The list to search in (will be sorted).
+        target (int): The target value to find.
+        tracer (callable): Optional sink called with a StepEvent per step.
+        index (SortedIndex): Prebuilt sorted index of ``arr`` (optional).
+
+    Returns:
+        tuple: (index_found_or_-1_in_sorted_array, steps_taken)
+
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+
+    Note: Equal values keep their original order in the sorted index, so
+    this is also the earliest occurrence in the original list.
+    """
+    index = _prepare_sorted(FIRST_OCCURRENCE, arr, target, tracer, index)
+    if index is None:
+        return -1, 0
+    values = index.values
+    pos, steps = _bound(FIRST_OCCURRENCE, values, target, 0, len(values), False, 0, tracer)
+    if pos == len(values) or values[pos] != target:
+        pos = -1
+    return _finish(FIRST_OCCURRENCE, index, pos, steps, target, tracer)
+
+
+def last_occurrence(arr, target, tracer=None, index=None):
+    """
+    Find the last occurrence of ``target`` in the sorted list.
+
+    Args:
+        arr (list): The list to search in (will be sorted).
+        target (int): The target value to find.
+        tracer (callable): Optional sink called with a StepEvent per step.
+        index (SortedIndex): Prebuilt sorted index of ``arr`` (optional).
+
+    Returns:
+        tuple: (index_found_or_-1_in_sorted_array, steps_taken)
+
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+    """
+    index = _prepare_sorted(LAST_OCCURRENCE, arr, target, tracer, index)
+    if index is None:
+        return -1, 0
+    values = index.values
+    pos, steps = _bound(LAST_OCCURRENCE, values, target, 0, len(values), True, 0, tracer)
+    pos -= 1
+    if pos < 0 or values[pos] != target:
+        pos = -1
+    return _finish(LAST_OCCURRENCE, index, pos, steps, target, tracer)
+
+
+def count_occurrences(arr, target, tracer=None, index=None):
+    """
+    Count how many times ``target`` occurs, locating the first and last match.
+
+    The upper-bound search starts where the lower-bound search ended, so the
+    second bisection only covers the rest of the list.
+
+    Args:
+        arr (list): The list to search in (will be sorted).
+        target (int): The value to count.
+        tracer (callable): Optional sink called with a StepEvent per step.
+        index (SortedIndex): Prebuilt sorted index of ``arr`` (optional).
+
+    Returns:
+        Occurrences: First and last sorted positions, count and steps.
+
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+    """
+    index = _prepare_sorted(COUNT_OCCURRENCES, arr, target, tracer, index)
+    if index is None:
+        return Occurrences(-1, -1, 0, 0)
+    values = index.values
+    n = len(values)
+    start, steps = _bound(COUNT_OCCURRENCES, values, target, 0, n, False, 0, tracer)
+    if start == n or values[start] != target:
+        # Nothing equal: the upper bound is the lower bound
+        stop = start
+    else:
+        stop, steps = _bound(COUNT_OCCURRENCES, values, target, start + 1, n, True, steps,
+                             tracer)
+
+    count = stop - start
+    if tracer is not None:
+        tracer(StepEvent(COUNT_OCCURRENCES, COUNT, steps, low=start, high=stop, value=count,
+                         target=target))
+    if count == 0:
+        return Occurrences(-1, -1, 0, steps)
+    return Occurrences(start, stop - 1, count, steps)
+
+
+class RangeMatches:
+    """
+    Lazy view of the elements whose values lie in ``[low, high]``.
+
+    The bounds are found up front; iterating yields ``(original_index, value)``
+    pairs in ascending value order without copying the matching slice.
+
+    Attributes:
+        low (int): Smallest value included.
+        high (int): Largest value included.
+        start (int): Sorted position of the first match.
+        stop (int): Sorted position just past the last match.
+        steps (int): Probes made by both bound searches.
+    """
+
+    def __init__(self, index, low, high, start, stop, steps):
+        self._index = index
+        self.low = low
+        self.high = high
+        self.start = start
+        self.stop = stop
+        self.steps = steps
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __bool__(self):
+        return self.stop > self.start
+
+    def __iter__(self):
+        if self._index is None:
+            return
+        values = self._index.values
+        positions = self._index.positions
+        for pos in range(self.start, self.stop):
+            yield positions[pos], values[pos]
+
+
+def range_query(arr, low, high, tracer=None, index=None):
+    """
+    Find every element with ``low <= value <= high``.
+
+    Args:
+        arr (list): The list to search in (will be sorted).
+        low (int): Smallest value to include.
+        high (int): Largest value to include.
+        tracer (callable): Optional sink called with a StepEvent per step.
+        index (SortedIndex): Prebuilt sorted index of ``arr`` (optional).
+
+    Returns:
+        RangeMatches: Lazy iterator over the matches (with ``len``).
+
+    Time Complexity: O(log n) to locate the range, O(1) per match yielded
+    Space Complexity: O(1)
+    """
+    index = _prepare_sorted(RANGE_QUERY, arr, low, tracer, index)
+    if index is None:
+        return RangeMatches(None, low, high, 0, 0, 0)
+    values = index.values
+    n = len(values)
+    if low > high:
+        start = stop = steps = 0
+    else:
+        start, steps = _bound(RANGE_QUERY, values, low, 0, n, False, 0, tracer)
+        stop, steps = _bound(RANGE_QUERY, values, high, start, n, True, steps, tracer)
+
+    if tracer is not None:
+        tracer(StepEvent(RANGE_QUERY, COUNT, steps, low=start, high=stop, value=stop - start))
+    return RangeMatches(index, low, high, start, stop, steps)
+
+
+def _bound(name, values, target, low, high, upper, steps, tracer):
+    """
+    Half-open bisection over ``values[low:high]``.
+
+    Returns the first position whose value is >= target (> target when
+    ``upper``) together with the updated step count.
+    """
+    while low < high:
+        steps += 1
+        mid = (low + high) // 2
+        value = values[mid]
+
+        if value < target or (upper and value == target):
+            if tracer is not None:
+                decision = UPPER_RIGHT if upper else RIGHT
+                tracer(StepEvent(name, STEP, steps, mid, low, high, mid, value, target, decision))
+            low = mid + 1
+        else:
+            if tracer is not None:
+                decision = UPPER_LEFT if upper else LOWER_LEFT
+                tracer(StepEvent(name, STEP, steps, mid, low, high, mid, value, target, decision))
+            high = mid
+    return low, steps
+
+
+def _report_bound(name, index, pos, steps, target, tracer):
+    if tracer is not None:
+        origin = index.positions[pos] if pos < len(index.values) else None
+        tracer(StepEvent(name, BOUND, steps, index=pos, target=target, origin=origin))
+
+
+def _finish(name, index, pos, steps, target, tracer):
+    """Emit the final event of a first/last occurrence search."""
+    if tracer is not None:
+        if pos == -1:
+            tracer(StepEvent(name, NOT_FOUND, steps, target=target))
+        else:
+            tracer(StepEvent(name, FOUND, steps, index=pos, mid=pos, target=target,
+                             origin=index.positions[pos]))
+    return pos, steps
@@ -0,0 +1,369 @@
+"""
+Searches over data files that are never loaded into memory.
+
+Two on-disk formats are supported:
+
+- text files of integers separated by newlines, commas or whitespace (plain
+  lists or CSV): ``stream_linear_search`` reads them in large buffered
+  chunks and keeps only one chunk in memory at a time;
+- fixed-width files of sorted little-endian int64 values (``.i64``):
+  ``external_binary_search`` memory-maps the file and bisects it, touching
+  only the O(log n) pages its probes land on.
+
+``sort_to_fixed_width`` turns a text file into a sorted ``.i64`` file with
+an external merge sort, so the input never has to fit in memory either.
+Both searches accept a ``tracer`` like the in-memory algorithms; their steps
+carry byte offsets, and an ``IO`` event reports the pages and bytes read.
+"""
+
+import heapq
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+from array import array
+from collections import namedtuple
+
+from .tracing import (
+    StepEvent,
+    START,
+    EMPTY,
+    STEP,
+    FOUND,
+    NOT_FOUND,
+    IO,
+    MATCH,
+    RIGHT,
+    LEFT,
+    FILE_CHUNK,
+)
+
+STREAM_LINEAR = "Streaming Linear Search"
+EXTERNAL_BINARY = "External Binary Search"
+
+FIXED_WIDTH_SUFFIX = ".i64"
+
+# Bytes read from a text file per chunk
+READ_CHUNK = 1 << 22
+
+# Values sorted in memory per run by sort_to_fixed_width
+RUN_ELEMENTS = 1 << 22
+
+PAGE_SIZE = mmap.PAGESIZE
+
+_ITEM = struct.Struct("<q")
+_SEPARATORS = re.compile(rb"[\s,]+")
+_TOKEN = re.compile(rb"[^\s,]+")
+
+FileMatch = namedtuple("FileMatch", ["index", "steps", "offset", "pages", "bytes_read"])
+FileMatch.__doc__ = """
+Result of a file search.
+
+Fields:
+    index (int): Position of the match among the file's values, or -1.
+    steps (int): Comparisons made (as for the in-memory algorithm).
+    offset (int): Byte offset of the match in the file, or -1.
+    pages (int): Pages of the file read.
+    bytes_read (int): Bytes of the file read.
+"""
+
+
+def is_fixed_width(path):
+    """Check whether ``path`` names a fixed-width int64 file (by suffix)."""
+    return str(path).lower().endswith(FIXED_WIDTH_SUFFIX)
+
+
+def stream_linear_search(path, target, tracer=None, chunk_size=READ_CHUNK):
+    """
+    Scan a text file of integers for the first ``target``, one chunk at a time.
+
+    Args:
+        path (str): File of integers separated by newlines, commas or spaces.
+        target (int): The target value to find.
+        tracer (callable): Optional sink called with a StepEvent per chunk.
+        chunk_size (int): Bytes read per chunk.
+
+    Returns:
+        FileMatch: Position, steps, byte offset and I/O of the search.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If a field is not an integer.
+
+    Time Complexity: O(n)
+    Space Complexity: O(chunk_size)
+    """
+    if tracer is not None:
+        tracer(StepEvent(STREAM_LINEAR, START, target=target))
+
+    steps = 0
+    position = 0        # byte offset of ``pending`` in the file
+    pending = b""
+    bytes_read = 0
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(chunk_size)
+            bytes_read += len(block)
+            data = pending + block
+            if block:
+                # Hold back a number that may continue in the next chunk
+                cut = _last_separator(data) + 1
+            else:
+                cut = len(data)
+            chunk, pending = data[:cut], data[cut:]
+
+            if chunk.strip(b" \t\r\n,"):
+                values = _parse(chunk, position)
+                try:
+                    found = values.index(target)
+                except ValueError:
+                    found = -1
+                if found != -1:
+                    steps += found + 1
+                    offset = position + _token_offset(chunk, found)
+                    if tracer is not None:
+                        tracer(StepEvent(STREAM_LINEAR, STEP, steps, index=steps - 1,
+                                         value=target, target=target, decision=MATCH,
+                                         origin=offset))
+                    return _finish(STREAM_LINEAR, steps - 1, steps, offset, bytes_read, target,
+                                   tracer)
+                steps += len(values)
+                if tracer is not None:
+                    tracer(StepEvent(STREAM_LINEAR, STEP, steps, low=position,
+                                     high=position + cut, target=target, decision=FILE_CHUNK))
+            position += cut
+            if not block:
+                break
+
+    if tracer is not None and not steps:
+        tracer(StepEvent(STREAM_LINEAR, EMPTY, 0, target=target))
+        return FileMatch(-1, 0, -1, _pages(bytes_read), bytes_read)
+    return _finish(STREAM_LINEAR, -1, steps, -1, bytes_read, target, tracer)
+
+
+def external_binary_search(path, target, tracer=None):
+    """
+    Binary search a sorted fixed-width int64 file without reading it whole.
+
+    The file is memory-mapped, so only the pages holding probed values are
+    read from disk.
+
+    Args:
+        path (str): File of sorted little-endian int64 values.
+        target (int): The target value to find.
+        tracer (callable): Optional sink called with a StepEvent per step.
+
+    Returns:
+        FileMatch: Position, steps, byte offset and I/O of the search.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file size is not a multiple of 8 bytes.
+
+    Time Complexity: O(log n) probes and pages
+    Space Complexity: O(1)
+    """
+    if tracer is not None:
+        tracer(StepEvent(EXTERNAL_BINARY, START, target=target))
+
+    size = os.path.getsize(path)
+    if size % _ITEM.size:
+        raise ValueError(f"{path} is not a fixed-width int64 file ({size} bytes)")
+    n = size // _ITEM.size
+    if not n:
+        if tracer is not None:
+            tracer(StepEvent(EXTERNAL_BINARY, EMPTY, 0, target=target))
+        return FileMatch(-1, 0, -1, 0, 0)
+
+    pages = set()
+    steps = 0
+    low, high = 0, n - 1
+    found = -1
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        while low <= high:
+            steps += 1
+            mid = (low + high) // 2
+            offset = mid * _ITEM.size
+            pages.add(offset // PAGE_SIZE)
+            value = _ITEM.unpack_from(data, offset)[0]
+
+            if value == target:
+                decision = MATCH
+            elif value < target:
+                decision = RIGHT
+            else:
+                decision = LEFT
+            if tracer is not None:
+                tracer(StepEvent(EXTERNAL_BINARY, STEP, steps, mid, low, high, mid, value,
+                                 target, decision, offset))
+            if decision == MATCH:
+                found = mid
+                break
+            if decision == RIGHT:
+                low = mid + 1
+            else:
+                high = mid - 1
+
+    offset = found * _ITEM.size if found != -1 else -1
+    if tracer is not None:
+        tracer(StepEvent(EXTERNAL_BINARY, IO, value=len(pages), high=len(pages) * PAGE_SIZE))
+        if found == -1:
+            tracer(StepEvent(EXTERNAL_BINARY, NOT_FOUND, steps, target=target))
+        else:
+            tracer(StepEvent(EXTERNAL_BINARY, FOUND, steps, index=found, target=target))
+    return FileMatch(found, steps, offset, len(pages), len(pages) * PAGE_SIZE)
+
+
+def sort_to_fixed_width(source, destination, run_elements=RUN_ELEMENTS):
+    """
+    Write the integers of a text file, sorted, as a fixed-width int64 file.
+
+    Runs of ``run_elements`` values are sorted in memory and spilled to
+    temporary files, then merged, so memory use stays bounded by one run.
+
+    Args:
+        source (str): Text file of integers (newline, comma or space separated).
+        destination (str): Output ``.i64`` path.
+        run_elements (int): Values sorted in memory at a time.
+
+    Returns:
+        int: Number of values written.
+
+    Raises:
+        OSError: If a file cannot be read or written.
+        ValueError: If a field is not an integer or does not fit in int64.
+    """
+    directory = os.path.dirname(os.path.abspath(destination))
+    runs = []
+    total = 0
+    try:
+        run = []
+        for value in _iter_file_ints(source):
+            run.append(value)
+            if len(run) >= run_elements:
+                runs.append(_spill(run, directory))
+                total += len(run)
+                run = []
+        total += len(run)
+
+        tmp_path = destination + ".tmp"
+        with open(tmp_path, "wb") as out:
+            if not runs:
+                _write_int64(out, sorted(run))
+            else:
+                if run:
+                    runs.append(_spill(run, directory))
+                buffer = array("q")
+                for value in heapq.merge(*(_read_run(path) for path in runs)):
+                    buffer.append(value)
+                    if len(buffer) >= RUN_ELEMENTS // 4:
+                        _write_int64(out, buffer)
+                        buffer = array("q")
+                _write_int64(out, buffer)
+        os.replace(tmp_path, destination)
+    finally:
+        for path in runs:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    return total
+
+
+def _finish(name, index, steps, offset, bytes_read, target, tracer):
+    """Emit the I/O and final events of a streaming search."""
+    pages = _pages(bytes_read)
+    if tracer is not None:
+        tracer(StepEvent(name, IO, value=pages, high=bytes_read))
+        if index == -1:
+            tracer(StepEvent(name, NOT_FOUND, steps, target=target))
+        else:
+            tracer(StepEvent(name, FOUND, steps, index=index, target=target))
+    return FileMatch(index, steps, offset, pages, bytes_read)
+
+
+def _pages(nbytes):
+    return -(-nbytes // PAGE_SIZE)
+
+
+def _last_separator(data):
+    """Index of the last separator byte in ``data``, or -1."""
+    return max(data.rfind(b"\n"), data.rfind(b","), data.rfind(b" "), data.rfind(b"\t"),
+               data.rfind(b"\r"))
+
+
+def _parse(chunk, position):
+    """Parse a chunk of separated integers, naming the byte offset on failure."""
+    try:
+        return [int(token) for token in _SEPARATORS.split(chunk.strip(b" \t\r\n,"))]
+    except ValueError:
+        for match in _TOKEN.finditer(chunk):
+            try:
+                int(match.group())
+            except ValueError:
+                raise ValueError(f"Not an integer at byte {position + match.start()}: "
+                                 f"{match.group()[:20].decode('utf-8', 'replace')!r}")
+        raise
+
+
+def _token_offset(chunk, number):
+    """Byte offset within ``chunk`` of its ``number``-th field."""
+    for i, match in enumerate(_TOKEN.finditer(chunk)):
+        if i == number:
+            return match.start()
+    return -1
+
+
+def _iter_file_ints(path):
+    """Yield the integers of a text file, reading it in chunks."""
+    position = 0
+    pending = b""
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(READ_CHUNK)
+            data = pending + block
+            cut = _last_separator(data) + 1 if block else len(data)
+            chunk, pending = data[:cut], data[cut:]
+            if chunk.strip(b" \t\r\n,"):
+                yield from _parse(chunk, position)
+            position += cut
+            if not block:
+                return
+
+
+def _write_int64(f, values):
+    try:
+        packed = values if isinstance(values, array) else array("q", values)
+    except OverflowError as e:
+        raise ValueError(f"Value does not fit in int64: {e}")
+    if sys.byteorder != "little":
+        packed = array("q", packed)
+        packed.byteswap()
+    packed.tofile(f)
+
+
+def _spill(run, directory):
+    """Sort one run and write it to a temporary fixed-width file."""
+    try:
+        packed = array("q", sorted(run))
+    except OverflowError as e:
+        raise ValueError(f"Value does not fit in int64: {e}")
+    fd, path = tempfile.mkstemp(suffix=FIXED_WIDTH_SUFFIX, dir=directory)
+    with os.fdopen(fd, "wb") as f:
+        _write_int64(f, packed)
+    return path
+
+
+def _read_run(path, items=1 << 16):
+    """Yield the values of a temporary run file in order."""
+    with open(path, "rb") as f:
+        while True:
+            block = array("q")
+            block.frombytes(f.read(items * _ITEM.size))
+            if not block:
+                return
+            if sys.byteorder != "little":
+                block.byteswap()
+            yield from block
@@ -0,0 +1,43 @@
+"""
+Content fingerprints for datasets.
+
+Caches keyed on a fingerprint stay valid for as long as the array contents
+do, no matter where the array came from (questions.json, manual input, ...).
+"""
+
+import hashlib
+from array import array
+
+
+def fingerprint(arr):
+    """
+    Return a stable content hash for a sequence of integers.
+
+    Lists, ``array('q')`` buffers and int64 memoryviews with the same values
+    produce the same fingerprint.
+
+    Args:
+        arr (list): The dataset to fingerprint.
+
+    Returns:
+        str: Hex digest identifying the contents of ``arr``.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    if isinstance(arr, memoryview) and arr.format == "q":
+        packed = arr
+    else:
+        try:
+            packed = array("q", arr)
+        except (OverflowError, TypeError):
+            packed = None
+
+    if packed is not None:
+        digest.update(b"q")
+        digest.update(packed)
+    else:
+        # Values outside int64 (or non-integers) fall back to their repr
+        digest.update(b"r")
+        digest.update(repr(list(arr)).encode("utf-8"))
+
+    return digest.hexdigest()
@@ -0,0 +1,220 @@
+"""
+Hash index of a dataset for O(1) exact-match lookups on unsorted data.
+
+A ``HashIndex`` maps every value to the first position it occurs at in the
+original list, and values that occur more than once to all of their
+positions. It is built with one pass over the data and cached per dataset
+fingerprint, so repeated queries against the same list never rescan it.
+"""
+
+import time
+from collections import OrderedDict
+
+from .fingerprint import fingerprint
+from .tracing import StepEvent, START, EMPTY, STEP, FOUND, NOT_FOUND, HASHED
+
+HASH = "Hash Index Lookup"
+
+# Number of hash indexes kept in memory
+MEMORY_CAPACITY = 32
+
+
+class HashIndex:
+    """
+    Value -> original position map of a dataset.
+
+    Attributes:
+        first (dict): Value -> index of its first occurrence.
+        duplicates (dict): Value -> every index, for values occurring more than once.
+        fingerprint (str): Content hash of the dataset.
+        build_ns (int): Time taken to build the index, in nanoseconds.
+    """
+
+    __slots__ = ("first", "duplicates", "fingerprint", "build_ns")
+
+    def __init__(self, first, duplicates, fingerprint=None, build_ns=0):
+        self.first = first
+        self.duplicates = duplicates
+        self.fingerprint = fingerprint
+        self.build_ns = build_ns
+
+    @classmethod
+    def build(cls, arr, key=None):
+        """
+        Index every value of ``arr`` by position.
+
+        Args:
+            arr (list): The dataset to index.
+            key (str): Precomputed fingerprint of ``arr`` (optional).
+
+        Returns:
+            HashIndex: The new index.
+        """
+        start = time.perf_counter_ns()
+        n = len(arr)
+        # Inserting from the back leaves each value mapped to its first position
+        first = dict(zip(reversed(arr), range(n - 1, -1, -1)))
+
+        duplicates = {}
+        if len(first) < n:
+            for i, value in enumerate(arr):
+                if first[value] != i:
+                    positions = duplicates.get(value)
+                    if positions is None:
+                        duplicates[value] = [first[value], i]
+                    else:
+                        positions.append(i)
+
+        return cls(first, duplicates, key, time.perf_counter_ns() - start)
+
+    def __len__(self):
+        return len(self.first)
+
+    def lookup(self, value):
+        """
+        Return the first original index of ``value``, or -1.
+        """
+        return self.first.get(value, -1)
+
+    def occurrences(self, value):
+        """
+        Return every original index of ``value`` in ascending order.
+
+        Returns:
+            list: Indices (empty if ``value`` is absent).
+        """
+        positions = self.duplicates.get(value)
+        if positions is not None:
+            return list(positions)
+        index = self.first.get(value)
+        return [] if index is None else [index]
+
+    def count(self, value):
+        """Return how many times ``value`` occurs."""
+        positions = self.duplicates.get(value)
+        if positions is not None:
+            return len(positions)
+        return 1 if value in self.first else 0
+
+
+class HashIndexCache:
+    """
+    LRU cache of hash indexes keyed on dataset fingerprint.
+
+    Hash indexes are cheap to rebuild compared to reading them back from
+    disk, so unlike sorted indexes they are only kept in memory.
+    """
+
+    def __init__(self, capacity=MEMORY_CAPACITY):
+        """
+        Args:
+            capacity (int): Maximum number of indexes held in memory.
+        """
+        self.capacity = max(1, int(capacity))
+        self._entries = OrderedDict()
+
+    def get(self, arr, key=None):
+        """
+        Return the hash index for ``arr``, building it only on a cache miss.
+
+        Args:
+            arr (list): The dataset.
+            key (str): Precomputed fingerprint of ``arr`` (optional).
+
+        Returns:
+            HashIndex: Index for ``arr``.
+        """
+        if key is None:
+            key = fingerprint(arr)
+
+        index = self._entries.get(key)
+        if index is not None:
+            self._entries.move_to_end(key)
+            return index
+
+        index = HashIndex.build(arr, key)
+        self._entries[key] = index
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        return index
+
+    def peek(self, key):
+        """Return the cached index for fingerprint ``key`` without building it."""
+        return self._entries.get(key)
+
+    def clear(self):
+        """Drop every cached index."""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_default_cache = None
+
+
+def get_hash_cache():
+    """
+    Return the process-wide hash index cache, creating it on first use.
+
+    Returns:
+        HashIndexCache: The shared cache.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = HashIndexCache()
+    return _default_cache
+
+
+def get_hash_index(arr, key=None):
+    """
+    Return the cached hash index for ``arr`` from the process-wide cache.
+
+    Args:
+        arr (list): The dataset.
+        key (str): Precomputed fingerprint of ``arr`` (optional).
+
+    Returns:
+        HashIndex: Index for ``arr``.
+    """
+    return get_hash_cache().get(arr, key)
+
+
+def hash_search(arr, target, tracer=None, index=None):
+    """
+    Look ``target`` up in the dataset's hash index, optionally tracing the lookup.
+
+    Args:
+        arr (list): The list to search in (not modified or sorted).
+        target (int): The target value to find.
+        tracer (callable): Optional sink called with a StepEvent per step.
+        index (HashIndex): Prebuilt hash index of ``arr``. When omitted the
+            cached index for ``arr`` is used, so it is built at most once
+            per dataset.
+
+    Returns:
+        tuple: (index_of_first_occurrence_or_-1_in_original_list, steps_taken)
+
+    Time Complexity: O(1) per lookup after an O(n) build
+    Space Complexity: O(n) for the index
+    """
+    if not len(arr):
+        if tracer is not None:
+            tracer(StepEvent(HASH, START, target=target))
+            tracer(StepEvent(HASH, EMPTY, 0, target=target))
+        return -1, 0
+
+    if index is None:
+        index = get_hash_index(arr)
+    found = index.lookup(target)
+
+    if tracer is not None:
+        tracer(StepEvent(HASH, START, target=target))
+        if found == -1:
+            tracer(StepEvent(HASH, STEP, 1, target=target, decision=HASHED))
+            tracer(StepEvent(HASH, NOT_FOUND, 1, target=target))
+        else:
+            tracer(StepEvent(HASH, STEP, 1, index=found, value=arr[found], target=target,
+                             decision=HASHED))
+            tracer(StepEvent(HASH, FOUND, 1, index=found, target=target))
+    return found, 1
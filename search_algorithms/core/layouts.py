@@ -0,0 +1,289 @@
+"""
+Cache-friendly layouts of a sorted index.
+
+``binary_search`` probes a plain sorted list at positions that jump all over
+memory. The layouts here store the same values in the order a search visits
+them, so successive probes land close together:
+
+- ``EytzingerLayout``: the values in breadth-first order of the implicit
+  binary search tree (node ``k`` has children ``2k`` and ``2k + 1``), so the
+  first levels of every search share the same few cache lines and the
+  descent is a branch-free ``k = 2k + (element < target)``.
+- ``BTreeLayout``: a static B+tree whose nodes hold ``KEYS_PER_NODE`` keys,
+  one 64-byte cache line of int64 values. Each step scans one node and
+  descends into one child, so a search reads log9(n) nodes.
+
+Layouts are built once per ``SortedIndex`` and kept in ``index.layouts``.
+Both searches return the sorted position of the first occurrence, like the
+other sorted-list algorithms, and accept a ``tracer``.
+"""
+
+import time
+from array import array
+from bisect import bisect_left
+
+from .search_algorithms import _prepare_sorted
+from .tracing import (
+    StepEvent,
+    STEP,
+    FOUND,
+    NOT_FOUND,
+    MATCH,
+    NODE_LEFT,
+    NODE_RIGHT,
+    DESCEND,
+    LEAF_MISS,
+    PAST_END,
+)
+
+EYTZINGER = "Eytzinger Search"
+BTREE = "B+Tree Search"
+
+# Bytes per cache line, and int64 keys that fit in one B+tree node
+CACHE_LINE = 64
+KEYS_PER_NODE = CACHE_LINE // 8
+
+
+def _packed(values):
+    """Contiguous int64 storage where possible, a list otherwise."""
+    try:
+        return array("q", values)
+    except (OverflowError, TypeError):
+        return list(values)
+
+
+class EytzingerLayout:
+    """
+    Sorted values in Eytzinger (breadth-first) order.
+
+    Attributes:
+        values: ``values[k]`` for nodes ``k = 1..n`` (slot 0 unused).
+        positions (array): ``positions[k]`` is the sorted position of node ``k``.
+        build_ns (int): Time taken to build the layout, in nanoseconds.
+    """
+
+    __slots__ = ("values", "positions", "build_ns")
+
+    def __init__(self, values, positions, build_ns=0):
+        self.values = values
+        self.positions = positions
+        self.build_ns = build_ns
+
+    @classmethod
+    def build(cls, sorted_values):
+        """
+        Lay out ascending ``sorted_values`` in breadth-first order.
+
+        Args:
+            sorted_values (list): The values in ascending order.
+
+        Returns:
+            EytzingerLayout: The new layout.
+        """
+        start = time.perf_counter_ns()
+        n = len(sorted_values)
+        order = [0] * (n + 1)
+        # In-order walk of the implicit tree assigns sorted positions to nodes
+        stack = []
+        k = 1
+        i = 0
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            order[k] = i
+            i += 1
+            k = 2 * k + 1
+
+        values = _packed([sorted_values[0] if n else 0] + [sorted_values[p] for p in order[1:]])
+        positions = array("q", order)
+        return cls(values, positions, time.perf_counter_ns() - start)
+
+    def __len__(self):
+        return len(self.values) - 1
+
+
+class BTreeLayout:
+    """
+    Static B+tree over sorted values, one cache line of keys per node.
+
+    ``levels[0]`` holds the separators of the root; every separator is the
+    last key of the block it leads to on the level below, and the leaves are
+    the sorted values themselves.
+
+    Attributes:
+        leaves: The sorted values.
+        levels (list): Separator arrays from the root down.
+        positions (list): Per level, the sorted position of each separator.
+        build_ns (int): Time taken to build the layout, in nanoseconds.
+    """
+
+    __slots__ = ("leaves", "levels", "positions", "build_ns")
+
+    def __init__(self, leaves, levels, positions, build_ns=0):
+        self.leaves = leaves
+        self.levels = levels
+        self.positions = positions
+        self.build_ns = build_ns
+
+    @classmethod
+    def build(cls, sorted_values, keys=KEYS_PER_NODE):
+        """
+        Build the separator levels bottom-up over ascending ``sorted_values``.
+
+        Args:
+            sorted_values (list): The values in ascending order.
+            keys (int): Keys per node.
+
+        Returns:
+            BTreeLayout: The new layout.
+        """
+        start = time.perf_counter_ns()
+        leaves = _packed(sorted_values)
+        levels = []
+        positions = []
+        below, below_pos = leaves, range(len(leaves))
+        while len(below) > keys:
+            ends = range(keys - 1, len(below) + keys - 1, keys)
+            last = len(below) - 1
+            level_pos = array("q", (below_pos[min(e, last)] for e in ends))
+            level = _packed(leaves[p] for p in level_pos)
+            levels.append(level)
+            positions.append(level_pos)
+            below, below_pos = level, level_pos
+        levels.reverse()
+        positions.reverse()
+        return cls(leaves, levels, positions, time.perf_counter_ns() - start)
+
+    def __len__(self):
+        return len(self.leaves)
+
+
+def get_layout(index, kind):
+    """
+    Return the ``kind`` layout of a sorted index, building it on first use.
+
+    Args:
+        index (SortedIndex): The sorted index.
+        kind (str): ``EYTZINGER`` or ``BTREE``.
+
+    Returns:
+        EytzingerLayout or BTreeLayout: The cached layout.
+    """
+    layout = index.layouts.get(kind)
+    if layout is None:
+        builder = EytzingerLayout if kind == EYTZINGER else BTreeLayout
+        layout = index.layouts[kind] = builder.build(index.values)
+    return layout
+
+
+def eytzinger_search(arr, target, tracer=None, index=None):
+    """
+    Search the Eytzinger layout of the sorted list, optionally tracing every step.
+
+    Args:
+        arr (list): The list to search in (will be sorted).
+        target (int): The target value to find.
+        tracer (callable): Optional sink called with a StepEvent per step.
+        index (SortedIndex): Prebuilt sorted index of ``arr`` (optional).
+
+    Returns:
+        tuple: (index_of_first_occurrence_or_-1_in_sorted_array, steps_taken)
+
+    Time Complexity: O(log n)
+    Space Complexity: O(n) for the layout, built once per sorted index
+    """
+    index = _prepare_sorted(EYTZINGER, arr, target, tracer, index)
+    if index is None:
+        return -1, 0
+    layout = get_layout(index, EYTZINGER)
+    values = layout.values
+    n = len(values) - 1
+
+    steps = 0
+    k = 1
+    if tracer is None:
+        while k <= n:
+            steps += 1
+            k = 2 * k + (values[k] < target)
+    else:
+        while k <= n:
+            steps += 1
+            value = values[k]
+            decision = NODE_RIGHT if value < target else NODE_LEFT
+            tracer(StepEvent(EYTZINGER, STEP, steps, index=layout.positions[k], value=value,
+                             target=target, decision=decision))
+            k = 2 * k + (value < target)
+
+    # Undo the right turns taken after the last left turn: that node is the lower bound
+    k >>= ((~k) & (k + 1)).bit_length()
+    pos = layout.positions[k] if k and values[k] == target else -1
+    return _finish(EYTZINGER, index, pos, steps, target, tracer)
+
+
+def btree_search(arr, target, tracer=None, index=None):
+    """
+    Search the static B+tree layout of the sorted list, optionally tracing every node.
+
+    Args:
+        arr (list): The list to search in (will be sorted).
+        target (int): The target value to find.
+        tracer (callable): Optional sink called with a StepEvent per node.
+        index (SortedIndex): Prebuilt sorted index of ``arr`` (optional).
+
+    Returns:
+        tuple: (index_of_first_occurrence_or_-1_in_sorted_array, steps_taken)
+
+    Time Complexity: O(log9 n) nodes, each one cache line
+    Space Complexity: O(n / 8) for the separators, built once per sorted index
+    """
+    index = _prepare_sorted(BTREE, arr, target, tracer, index)
+    if index is None:
+        return -1, 0
+    layout = get_layout(index, BTREE)
+    keys = KEYS_PER_NODE
+
+    steps = 0
+    block = 0
+    for level, level_pos in zip(layout.levels, layout.positions):
+        steps += 1
+        start = block * keys
+        block = bisect_left(level, target, start, min(start + keys, len(level)))
+        if block == len(level):
+            # Every key in the root is smaller: target is past the end
+            if tracer is not None:
+                tracer(StepEvent(BTREE, STEP, steps, index=level_pos[-1], value=level[-1],
+                                 target=target, decision=PAST_END))
+            return _finish(BTREE, index, -1, steps, target, tracer)
+        if tracer is not None:
+            tracer(StepEvent(BTREE, STEP, steps, index=level_pos[block], value=level[block],
+                             target=target, decision=DESCEND))
+
+    leaves = layout.leaves
+    steps += 1
+    start = block * keys
+    pos = bisect_left(leaves, target, start, min(start + keys, len(leaves)))
+    if pos == len(leaves):
+        if tracer is not None:
+            tracer(StepEvent(BTREE, STEP, steps, index=pos - 1, value=leaves[-1], target=target,
+                             decision=PAST_END))
+        return _finish(BTREE, index, -1, steps, target, tracer)
+    if tracer is not None:
+        decision = MATCH if leaves[pos] == target else LEAF_MISS
+        tracer(StepEvent(BTREE, STEP, steps, index=pos, value=leaves[pos], target=target,
+                         decision=decision))
+    if leaves[pos] != target:
+        pos = -1
+    return _finish(BTREE, index, pos, steps, target, tracer)
+
+
+def _finish(name, index, pos, steps, target, tracer):
+    """Emit the final events of a layout search."""
+    if tracer is not None:
+        if pos == -1:
+            tracer(StepEvent(name, NOT_FOUND, steps, target=target))
+        else:
+            tracer(StepEvent(name, FOUND, steps, index=pos, mid=pos, target=target,
+                             origin=index.positions[pos]))
+    return pos, steps
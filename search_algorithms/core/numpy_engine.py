@@ -0,0 +1,227 @@
+"""
+Optional NumPy-backed search engine for large integer arrays.
+
+Datasets are stored once as contiguous int64 arrays: linear search becomes a
+vectorised comparison, binary search uses ``np.searchsorted`` over a stably
+sorted copy, and many targets can be answered in one call. Every function
+returns the same ``(index, steps)`` contract as the pure-Python algorithms
+and falls back to them when NumPy is not installed or the values do not fit
+in int64.
+"""
+
+import importlib.util
+import numbers
+
+from .search_algorithms import linear_search, binary_search, bisect_outcome
+from .batch import batch_search, bisect_probes, BatchResult
+
+# Checked without importing: NumPy itself is only imported on first use,
+# keeping it out of CLI startup
+HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+np = None
+
+
+def _load_numpy():
+    """Import NumPy on first use and return the module (None if missing)."""
+    global np
+    if np is None and HAVE_NUMPY:
+        import numpy
+        np = numpy
+    return np
+
+
+class NumpyDataset:
+    """
+    A dataset held as an int64 NumPy array plus its stable sort order.
+
+    Attributes:
+        values (numpy.ndarray): The dataset in original order.
+        sorter (numpy.ndarray): ``values[sorter]`` is ascending.
+        sorted_values (numpy.ndarray): The dataset in ascending order.
+    """
+
+    __slots__ = ("values", "_sorter", "_sorted_values")
+
+    def __init__(self, values):
+        self.values = values
+        self._sorter = None
+        self._sorted_values = None
+
+    @classmethod
+    def from_sequence(cls, arr):
+        """
+        Convert ``arr`` to an int64 array.
+
+        Args:
+            arr (list): The dataset (list, array('q'), memoryview or ndarray).
+
+        Returns:
+            NumpyDataset or None: None if NumPy is missing or a value does not
+            fit in int64.
+        """
+        if _load_numpy() is None:
+            return None
+        if isinstance(arr, np.ndarray) and arr.dtype == np.int64:
+            return cls(np.ascontiguousarray(arr))
+        try:
+            values = np.asarray(arr, dtype=np.int64)
+        except (OverflowError, TypeError, ValueError):
+            return None
+        return cls(values)
+
+    def __len__(self):
+        return int(self.values.shape[0])
+
+    @property
+    def sorter(self):
+        if self._sorter is None:
+            self._sorter = np.argsort(self.values, kind="stable")
+        return self._sorter
+
+    @property
+    def sorted_values(self):
+        if self._sorted_values is None:
+            self._sorted_values = self.values[self.sorter]
+        return self._sorted_values
+
+    def linear(self, target):
+        """
+        Find the first occurrence of ``target`` with a vectorised comparison.
+
+        Returns:
+            tuple: (index_found_or_-1, steps_taken) with steps counted as in
+            the element-by-element scan.
+        """
+        n = len(self)
+        if n == 0:
+            return -1, 0
+        matches = self.values == target
+        index = int(matches.argmax())
+        if not matches[index]:
+            return -1, n
+        return index, index + 1
+
+    def binary(self, target):
+        """
+        Find ``target`` in the sorted copy with ``np.searchsorted``.
+
+        Returns:
+            tuple: (index_found_or_-1_in_sorted_array, steps_taken), the same
+            answer and step count as ``binary_search`` on the list.
+        """
+        n = len(self)
+        if n == 0:
+            return -1, 0
+        first = int(np.searchsorted(self.sorted_values, target, side="left"))
+        stop = int(np.searchsorted(self.sorted_values, target, side="right"))
+        return bisect_outcome(n, first, stop)
+
+    def original_index(self, sorted_pos):
+        """Map a position in the sorted copy back to the original array."""
+        if sorted_pos < 0:
+            return -1
+        return int(self.sorter[sorted_pos])
+
+    def batch(self, targets):
+        """
+        Answer many targets with one vectorised ``searchsorted`` call.
+
+        Steps are the probes ``batch_search`` makes for the same targets, so
+        results do not depend on whether NumPy is installed.
+
+        Args:
+            targets (iterable): Target values.
+
+        Returns:
+            list: BatchResult per target, in input order.
+        """
+        targets = list(targets)
+        n = len(self)
+        if not targets:
+            return []
+        if n == 0:
+            return [BatchResult(t, -1, -1, 0) for t in targets]
+
+        queries = np.asarray(targets, dtype=np.int64)
+        pos = np.searchsorted(self.sorted_values, queries, side="left")
+        clipped = np.minimum(pos, n - 1)
+        hit = (pos < n) & (self.sorted_values[clipped] == queries)
+        original = np.where(hit, self.sorter[clipped], -1)
+
+        # batch_search bisects distinct targets in ascending order, each from
+        # where the previous one ended
+        steps = {}
+        lo = 0
+        for t, p in sorted(set(zip(targets, pos.tolist()))):
+            if t not in steps:
+                steps[t] = bisect_probes(lo, n, p)
+                lo = p
+
+        return [
+            BatchResult(t, int(p) if h else -1, int(o), steps[t])
+            for t, p, h, o in zip(targets, pos.tolist(), hit.tolist(), original.tolist())
+        ]
+
+
+def linear_search_np(arr, target, dataset=None):
+    """
+    Linear search using NumPy when available.
+
+    Args:
+        arr (list): The list to search in.
+        target (int): The target value to find.
+        dataset (NumpyDataset): Pre-converted dataset (optional).
+
+    Returns:
+        tuple: (index_found_or_-1, steps_taken)
+    """
+    if dataset is None:
+        dataset = NumpyDataset.from_sequence(arr)
+    if dataset is None or not _fits_int64(target):
+        return linear_search(arr, target)
+    return dataset.linear(target)
+
+
+def binary_search_np(arr, target, dataset=None, index=None):
+    """
+    Binary search using ``np.searchsorted`` when available.
+
+    Args:
+        arr (list): The list to search in.
+        target (int): The target value to find.
+        dataset (NumpyDataset): Pre-converted dataset (optional).
+        index (SortedIndex): Sorted index for the pure-Python fallback (optional).
+
+    Returns:
+        tuple: (index_found_or_-1_in_sorted_array, steps_taken)
+    """
+    if dataset is None:
+        dataset = NumpyDataset.from_sequence(arr)
+    if dataset is None or not _fits_int64(target):
+        return binary_search(arr, target, index=index)
+    return dataset.binary(target)
+
+
+def batch_search_np(arr, targets, dataset=None, index=None):
+    """
+    Bulk multi-target lookup using one ``np.searchsorted`` call.
+
+    Args:
+        arr (list): The list to search in.
+        targets (iterable): Target values.
+        dataset (NumpyDataset): Pre-converted dataset (optional).
+        index (SortedIndex): Sorted index for the pure-Python fallback (optional).
+
+    Returns:
+        list: BatchResult per target, in input order.
+    """
+    targets = list(targets)
+    if dataset is None:
+        dataset = NumpyDataset.from_sequence(arr)
+    if dataset is None or not all(_fits_int64(t) for t in targets):
+        return batch_search(arr, targets, index=index)
+    return dataset.batch(targets)
+
+
+def _fits_int64(value):
+    return isinstance(value, numbers.Integral) and -(1 << 63) <= int(value) < (1 << 63)
@@ -0,0 +1,428 @@
+"""
+Process-pool execution for search workloads.
+
+Question arrays are packed once into a ``multiprocessing.shared_memory``
+block as int64 values; worker processes attach to it by name and read the
+arrays as zero-copy views, so no large list is ever pickled. Work is
+submitted in chunks of several questions to keep scheduling overhead low.
+
+``ParallelScanner`` uses the same block layout to split a linear search of
+one large array into chunks scanned on every core.
+"""
+
+import atexit
+import os
+import sys
+import time
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+from .fingerprint import fingerprint
+from .registry import get_algorithm, list_algorithms, run_algorithm
+from .search_algorithms import linear_search
+from .sorted_index import SortedIndex
+from .hash_index import HashIndex
+from .tracing import StepEvent, START, EMPTY, STEP, FOUND, NOT_FOUND, CHUNK_CLEAR, CHUNK_MATCH
+
+_ITEM_SIZE = 8
+
+PARALLEL_LINEAR = "Parallel Linear Search"
+
+# Smallest chunk handed to one worker, in elements
+MIN_CHUNK = 1 << 16
+
+# Chunks per worker, so chunks after an early match can still be cancelled
+CHUNKS_PER_WORKER = 4
+
+# Elements a worker scans between checks for an earlier match elsewhere
+SCAN_BLOCK = 1 << 18
+
+# Lists shorter than this are not worth starting a worker pool for in compare mode
+PARALLEL_MIN_SIZE = 100_000
+
+CompareRow = namedtuple(
+    "CompareRow", ["question", "algorithm", "target", "index", "steps", "elapsed_ns"]
+)
+CompareRow.__doc__ = """
+One (question, algorithm, target) result from ``compare_all``.
+
+Fields:
+    question (str): Question key.
+    algorithm (str): Registry key of the algorithm.
+    target (int): The value searched for.
+    index (int): Result index (-1 if not found).
+    steps (int): Steps taken.
+    elapsed_ns (int): Wall time of the search in nanoseconds.
+"""
+
+
+class SharedArrays:
+    """
+    Several integer arrays packed into one shared memory block.
+
+    Arrays whose values do not fit in int64 are kept aside and shipped to
+    workers inline instead.
+
+    Attributes:
+        name (str): Shared memory block name, or None if nothing was packed.
+        layout (dict): Key -> (offset, length) for packed arrays.
+        inline (dict): Key -> list for arrays that could not be packed.
+    """
+
+    def __init__(self, arrays):
+        """
+        Args:
+            arrays (dict): Key -> sequence of integers.
+        """
+        packed = {}
+        self.inline = {}
+        total = 0
+        for key, values in arrays.items():
+            try:
+                packed[key] = array("q", values)
+            except (OverflowError, TypeError):
+                self.inline[key] = list(values)
+                continue
+            total += len(packed[key]) * _ITEM_SIZE
+
+        self.layout = {}
+        self._shm = None
+        self.name = None
+        if not packed:
+            return
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(total, _ITEM_SIZE))
+        self.name = self._shm.name
+        offset = 0
+        for key, values in packed.items():
+            size = len(values) * _ITEM_SIZE
+            self._shm.buf[offset:offset + size] = values.tobytes()
+            self.layout[key] = (offset, len(values))
+            offset += size
+
+    def view(self, key):
+        """Return a zero-copy int64 view of a packed array in this process."""
+        offset, length = self.layout[key]
+        return self._shm.buf[offset:offset + length * _ITEM_SIZE].cast("q")
+
+    def close(self):
+        """Release and unlink the shared memory block."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Per-worker attachment to the shared block (set by _attach)
+_worker_shm = None
+
+
+def _attach(name):
+    """Pool initializer: attach to the shared block once per worker process."""
+    global _worker_shm
+    if name is not None:
+        _worker_shm = shared_memory.SharedMemory(name=name)
+
+
+def _worker_view(spec):
+    """Resolve a task's array spec to a sequence inside the worker."""
+    kind, payload = spec
+    if kind == "inline":
+        return payload
+    offset, length = payload
+    return _worker_shm.buf[offset:offset + length * _ITEM_SIZE].cast("q")
+
+
+def _scan_chunk(spec, found_spec, start, stop, target):
+    """
+    Scan ``[start, stop)`` of a packed array for the first ``target``.
+
+    The shared ``found`` cell holds the earliest match any worker has seen;
+    the scan gives up as soon as that lies before this chunk, since nothing
+    here can be the earliest match any more.
+
+    Returns:
+        int: Global index of the first match in the chunk, or -1.
+    """
+    offset, _ = spec[1]
+    found = _worker_view(found_spec)
+    try:
+        needle = target.to_bytes(_ITEM_SIZE, sys.byteorder, signed=True)
+    except OverflowError:
+        return -1  # every packed value fits in int64
+
+    buf = _worker_shm.buf
+    for low in range(start, stop, SCAN_BLOCK):
+        if found[0] < start:
+            return -1
+        high = min(low + SCAN_BLOCK, stop)
+        block = bytes(buf[offset + low * _ITEM_SIZE:offset + high * _ITEM_SIZE])
+        pos = block.find(needle)
+        # Only matches aligned to an element boundary count
+        while pos != -1 and pos % _ITEM_SIZE:
+            pos = block.find(needle, pos + 1)
+        if pos != -1:
+            index = low + pos // _ITEM_SIZE
+            if index < found[0]:
+                found[0] = index
+            return index
+    return -1
+
+
+class ParallelScanner:
+    """
+    Linear search of one array split into chunks across a process pool.
+
+    The array is packed into shared memory and the pool started once; each
+    ``search`` then only submits (start, stop, target) per chunk. Results
+    match ``linear_search`` exactly: the earliest index and ``index + 1``
+    steps when found, ``len(arr)`` steps when not.
+
+    Attributes:
+        size (int): Number of elements.
+        workers (int): Worker processes.
+        chunks (list): (start, stop) element range of every chunk.
+        fingerprint (str): Content hash of the array.
+        setup_ns (int): Time taken to pack the array and start the pool.
+        cancelled (int): Chunks the last search cancelled before they ran.
+    """
+
+    def __init__(self, arr, workers=None, key=None):
+        """
+        Args:
+            arr (list): The array to search.
+            workers (int): Worker processes (default: CPU count).
+            key (str): Precomputed fingerprint of ``arr`` (optional).
+        """
+        start = time.perf_counter_ns()
+        self.size = len(arr)
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.fingerprint = key
+        self.cancelled = 0
+        self._arr = None
+        self._pool = None
+
+        size = -(-self.size // (self.workers * CHUNKS_PER_WORKER)) if self.size else 0
+        size = max(MIN_CHUNK, size)
+        self.chunks = [(low, min(low + size, self.size)) for low in range(0, self.size, size)]
+
+        self._shared = SharedArrays({"data": arr, "found": [self.size]})
+        if "data" in self._shared.inline:
+            # Values beyond int64: scanned serially in this process instead
+            self._arr = arr
+        else:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_attach,
+                                             initargs=(self._shared.name,))
+        self.setup_ns = time.perf_counter_ns() - start
+
+    def search(self, target, tracer=None):
+        """
+        Find the first occurrence of ``target``, optionally tracing each chunk.
+
+        Args:
+            target (int): The target value to find.
+            tracer (callable): Optional sink called with a StepEvent per chunk.
+
+        Returns:
+            tuple: (index_found_or_-1, steps_taken)
+        """
+        if not self.size:
+            if tracer is not None:
+                tracer(StepEvent(PARALLEL_LINEAR, START, target=target))
+                tracer(StepEvent(PARALLEL_LINEAR, EMPTY, 0, target=target))
+            return -1, 0
+        if self._pool is None:
+            return linear_search(self._arr, target, tracer=tracer)
+
+        data_spec = ("shared", self._shared.layout["data"])
+        found_spec = ("shared", self._shared.layout["found"])
+        found = self._shared.view("found")
+        try:
+            found[0] = self.size
+        finally:
+            found.release()
+        futures = {
+            self._pool.submit(_scan_chunk, data_spec, found_spec, low, high, target): number
+            for number, (low, high) in enumerate(self.chunks)
+        }
+
+        # Every future is waited for, so no scan for this target outlives the call
+        best, best_chunk = -1, len(self.chunks)
+        cancelled = 0
+        for future in as_completed(futures):
+            if future.cancelled():
+                cancelled += 1
+                continue
+            index = future.result()
+            number = futures[future]
+            if index != -1 and number < best_chunk:
+                best, best_chunk = index, number
+                for other, later in futures.items():
+                    if later > number:
+                        other.cancel()
+        self.cancelled = cancelled
+
+        steps = best + 1 if best != -1 else self.size
+        if tracer is not None:
+            tracer(StepEvent(PARALLEL_LINEAR, START, target=target))
+            for low, high in self.chunks[:best_chunk]:
+                tracer(StepEvent(PARALLEL_LINEAR, STEP, high, low=low, high=high,
+                                 target=target, decision=CHUNK_CLEAR))
+            if best == -1:
+                tracer(StepEvent(PARALLEL_LINEAR, NOT_FOUND, steps, target=target))
+            else:
+                low, high = self.chunks[best_chunk]
+                tracer(StepEvent(PARALLEL_LINEAR, STEP, steps, index=best, low=low, high=high,
+                                 value=target, target=target, decision=CHUNK_MATCH))
+                tracer(StepEvent(PARALLEL_LINEAR, FOUND, steps, index=best, target=target))
+        return best, steps
+
+    def close(self):
+        """Stop the worker pool and release the shared memory."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        self._shared.close()
+
+
+_scanner = None
+
+
+def get_parallel_scanner(arr, key=None, workers=None):
+    """
+    Return a scanner for ``arr``, reusing the last one if it holds the same data.
+
+    Only one scanner is kept, since each holds a worker pool and a copy of
+    the array in shared memory.
+
+    Args:
+        arr (list): The array to search.
+        key (str): Precomputed fingerprint of ``arr`` (optional).
+        workers (int): Worker processes (default: CPU count).
+
+    Returns:
+        ParallelScanner: Scanner for ``arr``.
+    """
+    global _scanner
+    if key is None:
+        key = fingerprint(arr)
+    if _scanner is not None and _scanner.fingerprint == key and (
+            workers is None or _scanner.workers == workers):
+        return _scanner
+    if _scanner is not None:
+        _scanner.close()
+    else:
+        atexit.register(_close_scanner)
+    _scanner = ParallelScanner(arr, workers, key)
+    return _scanner
+
+
+def _close_scanner():
+    global _scanner
+    if _scanner is not None:
+        _scanner.close()
+        _scanner = None
+
+
+def parallel_linear_search(arr, target, tracer=None, workers=None):
+    """
+    Linear search split across every core, optionally reporting each chunk.
+
+    Args:
+        arr (list): The list to search in (not modified or sorted).
+        target (int): The target value to find.
+        tracer (callable): Optional sink called with a StepEvent per chunk.
+        workers (int): Worker processes (default: CPU count).
+
+    Returns:
+        tuple: (index_found_or_-1, steps_taken), identical to ``linear_search``
+
+    Time Complexity: O(n / workers) wall time after an O(n) one-off setup
+    Space Complexity: O(n) shared memory
+    """
+    return get_parallel_scanner(arr, workers=workers).search(target, tracer=tracer)
+
+
+def _compare_chunk(chunk, algorithm_keys, targets):
+    """
+    Run every algorithm for every target on each question in ``chunk``.
+
+    Args:
+        chunk (list): (question key, array spec) pairs.
+        algorithm_keys (list): Registry keys to run.
+        targets (list): Target values.
+
+    Returns:
+        list: CompareRow tuples.
+    """
+    clock = time.perf_counter_ns
+    algorithms = [get_algorithm(key) for key in algorithm_keys]
+    hashed = any(algorithm.hashed for algorithm in algorithms)
+    rows = []
+    for question, spec in chunk:
+        arr = _worker_view(spec)
+        # Indexes are built once per question, outside the timed searches
+        index = SortedIndex.build(arr) if len(arr) else None
+        hash_index = HashIndex.build(arr) if hashed else None
+        for algorithm in algorithms:
+            for target in targets:
+                start = clock()
+                found, steps = run_algorithm(algorithm, arr, target, index=index,
+                                             hash_index=hash_index)
+                rows.append(CompareRow(question, algorithm.key, target, found, steps,
+                                       clock() - start))
+        del arr
+    return rows
+
+
+def compare_all(questions, targets, algorithms=None, workers=None, chunksize=None):
+    """
+    Run algorithms against every question for every target across a process pool.
+
+    Args:
+        questions (dict): Question key -> integer sequence.
+        targets (list): Target values searched in every question.
+        algorithms (list): Registry keys (default: every registered algorithm).
+        workers (int): Worker processes (default: CPU count).
+        chunksize (int): Questions per submitted task (default: spread the
+            questions over about four tasks per worker).
+
+    Returns:
+        list: CompareRow per (question, algorithm, target), in question order.
+    """
+    keys = algorithms or [a.key for a in list_algorithms()]
+    for key in keys:
+        if get_algorithm(key) is None:
+            raise ValueError(f"Unknown algorithm: {key}")
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    question_keys = list(questions)
+    if chunksize is None:
+        chunksize = max(1, len(question_keys) // (workers * 4))
+
+    order = {key: i for i, key in enumerate(question_keys)}
+    rows = []
+    with SharedArrays({k: questions[k] for k in question_keys}) as shared:
+        specs = [
+            (k, ("shared", shared.layout[k]) if k in shared.layout else ("inline", shared.inline[k]))
+            for k in question_keys
+        ]
+        chunks = [specs[i:i + chunksize] for i in range(0, len(specs), chunksize)]
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                 initargs=(shared.name,)) as pool:
+            futures = [pool.submit(_compare_chunk, chunk, keys, list(targets))
+                       for chunk in chunks]
+            for future in as_completed(futures):
+                rows.extend(future.result())
+
+    rows.sort(key=lambda r: order[r.question])
+    return rows
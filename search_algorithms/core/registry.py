@@ -0,0 +1,284 @@
+"""
+Registry of available search algorithms.
+
+Menus, compare mode, the benchmark suite and history filters all read the
+list of algorithms from here, so adding an algorithm is a single
+``register_algorithm`` call. The registry can also pick an algorithm
+automatically from a quick profile of the data (``auto_select``).
+"""
+
+from collections import OrderedDict, namedtuple
+from itertools import islice
+
+from .. import config
+from .fingerprint import fingerprint
+from .sorted_index import get_index_cache
+from .hash_index import hash_search
+from .bloom import bloom_reject
+from .bounds import first_occurrence, last_occurrence
+from .layouts import eytzinger_search, btree_search
+from .search_algorithms import (
+    linear_search,
+    binary_search,
+    interpolation_search,
+    exponential_search,
+    jump_search,
+    ternary_search,
+)
+
+# Arrays up to this size are searched linearly in auto mode (no sort overhead)
+AUTO_LINEAR_MAX = 16
+
+# Number of sample points used to judge how evenly spaced sorted data is
+UNIFORMITY_SAMPLES = 64
+
+# Maximum deviation (as a fraction of the value range) still counted as uniform
+UNIFORMITY_TOLERANCE = 0.1
+
+Algorithm = namedtuple(
+    "Algorithm",
+    ["key", "name", "search", "time_complexity", "space_complexity", "requires_sorted",
+     "description", "hashed"],
+    defaults=(False,),
+)
+Algorithm.__doc__ = """
+A registered search algorithm.
+
+Fields:
+    key (str): Short identifier used on the command line (e.g. "binary").
+    name (str): Display name, also stored as ``method`` in the results log.
+    search (callable): ``search(arr, target, tracer=None[, index=None])``.
+    time_complexity (str): e.g. "O(log n)".
+    space_complexity (str): e.g. "O(1)".
+    requires_sorted (bool): Searches the sorted copy and accepts ``index=``.
+    description (str): One-line summary shown in menus.
+    hashed (bool): Looks targets up in a hash index and accepts ``index=``.
+"""
+
+DatasetProfile = namedtuple(
+    "DatasetProfile",
+    ["size", "is_sorted", "duplicate_ratio", "is_uniform", "key", "has_index"],
+)
+DatasetProfile.__doc__ = """
+What ``profile_dataset`` learned about an array.
+
+Fields:
+    size (int): Number of elements.
+    is_sorted (bool): Already in ascending order.
+    duplicate_ratio (float): Share of elements equal to another element.
+    is_uniform (bool): Sorted and roughly evenly spaced.
+    key (str): Content fingerprint of the array.
+    has_index (bool): A sorted index is already cached for it.
+"""
+
+_REGISTRY = OrderedDict()
+
+
+def register_algorithm(key, name, search, time_complexity, space_complexity="O(1)",
+                       requires_sorted=False, description="", hashed=False):
+    """
+    Add an algorithm to the registry (replacing any with the same key).
+
+    Args:
+        key (str): Short identifier (e.g. "binary").
+        name (str): Display name (e.g. "Binary Search").
+        search (callable): The search function.
+        time_complexity (str): Time complexity string.
+        space_complexity (str): Space complexity string.
+        requires_sorted (bool): Whether it searches the sorted copy.
+        description (str): One-line summary for menus.
+        hashed (bool): Whether it uses the dataset's hash index.
+
+    Returns:
+        Algorithm: The registered entry.
+    """
+    algorithm = Algorithm(key, name, search, time_complexity, space_complexity,
+                          requires_sorted, description, hashed)
+    _REGISTRY[key] = algorithm
+    return algorithm
+
+
+def get_algorithm(key):
+    """
+    Look up an algorithm by key or display name (case-insensitive).
+
+    Args:
+        key (str): e.g. "binary" or "Binary Search".
+
+    Returns:
+        Algorithm or None: The matching entry.
+    """
+    if key in _REGISTRY:
+        return _REGISTRY[key]
+    wanted = key.strip().lower()
+    for algorithm in _REGISTRY.values():
+        if wanted in (algorithm.key.lower(), algorithm.name.lower()):
+            return algorithm
+    return None
+
+
+def list_algorithms():
+    """
+    Return every registered algorithm in registration order.
+
+    Returns:
+        list: Algorithm entries.
+    """
+    return list(_REGISTRY.values())
+
+
+def run_algorithm(algorithm, arr, target, tracer=None, index=None, hash_index=None,
+                  bloom=None):
+    """
+    Run a registered algorithm, passing each prebuilt index only where it is used.
+
+    Args:
+        algorithm (Algorithm): The algorithm to run.
+        arr (list): The list to search in.
+        target (int): The target value to find.
+        tracer (callable): Optional step-event sink.
+        index (SortedIndex): Sorted index of ``arr`` (optional).
+        hash_index (HashIndex): Hash index of ``arr`` (optional).
+        bloom (BloomFilter): Filter of ``arr``; targets it rules out return
+            at once without running the algorithm (optional).
+
+    Returns:
+        tuple: (index_found_or_-1, steps_taken)
+    """
+    if bloom is not None and not bloom.check(target):
+        return bloom_reject(algorithm.name, target, tracer)
+
+    if algorithm.requires_sorted:
+        result = algorithm.search(arr, target, tracer=tracer, index=index)
+    elif algorithm.hashed:
+        result = algorithm.search(arr, target, tracer=tracer, index=hash_index)
+    else:
+        result = algorithm.search(arr, target, tracer=tracer)
+
+    if bloom is not None and result[0] == -1:
+        bloom.false_positives += 1
+    return result
+
+
+def profile_dataset(arr, key=None):
+    """
+    Inspect an array once to decide which algorithm suits it.
+
+    Sortedness and (for sorted data) duplicates are found in a single pass;
+    for unsorted data duplicates are estimated from a sample.
+
+    Args:
+        arr (list): The dataset.
+        key (str): Precomputed fingerprint of ``arr`` (optional).
+
+    Returns:
+        DatasetProfile: The profile.
+    """
+    n = len(arr)
+    if key is None:
+        key = fingerprint(arr)
+    has_index = get_index_cache().peek(key) is not None
+
+    is_sorted = True
+    equal_pairs = 0
+    for a, b in zip(arr, islice(arr, 1, None)):
+        if a > b:
+            is_sorted = False
+            break
+        if a == b:
+            equal_pairs += 1
+
+    if is_sorted:
+        duplicate_ratio = equal_pairs / n if n else 0.0
+    else:
+        sample = list(islice(arr, 1024))
+        duplicate_ratio = 1 - len(set(sample)) / len(sample) if sample else 0.0
+
+    return DatasetProfile(n, is_sorted, duplicate_ratio, is_sorted and _is_uniform(arr),
+                          key, has_index)
+
+
+def auto_select(arr, profile=None):
+    """
+    Pick the fastest applicable algorithm for ``arr``.
+
+    Rules, in order:
+        - tiny arrays: linear search (no sort or index overhead)
+        - already sorted and evenly spaced: interpolation search
+        - already sorted: binary search on the array itself (no sort)
+        - sorted index already cached: binary search
+        - otherwise: linear search, since sorting costs more than one scan
+
+    Args:
+        arr (list): The dataset.
+        profile (DatasetProfile): Result of ``profile_dataset`` (optional).
+
+    Returns:
+        tuple: (Algorithm, reason string, DatasetProfile)
+    """
+    if profile is None:
+        profile = profile_dataset(arr)
+
+    if profile.size <= AUTO_LINEAR_MAX:
+        return _REGISTRY["linear"], f"only {profile.size} elements", profile
+    if profile.is_sorted and profile.is_uniform and profile.duplicate_ratio < 0.5:
+        return (_REGISTRY["interpolation"],
+                "already sorted and evenly spaced (no sort needed)", profile)
+    if profile.is_sorted:
+        return _REGISTRY["binary"], "already sorted (no sort needed)", profile
+    if profile.has_index:
+        return _REGISTRY["binary"], "sorted index already cached", profile
+    return _REGISTRY["linear"], "unsorted; one scan is cheaper than sorting", profile
+
+
+def _is_uniform(arr):
+    """Check whether sorted ``arr`` grows roughly linearly from first to last value."""
+    n = len(arr)
+    if n < 3:
+        return True
+    low, high = arr[0], arr[-1]
+    span = high - low
+    if span == 0:
+        return False
+
+    stride = max(1, (n - 1) // UNIFORMITY_SAMPLES)
+    for i in range(0, n, stride):
+        expected = low + span * i / (n - 1)
+        if abs(arr[i] - expected) > UNIFORMITY_TOLERANCE * span:
+            return False
+    return True
+
+
+register_algorithm("linear", "Linear Search", linear_search,
+                   config.LINEAR_SEARCH_COMPLEXITY,
+                   description="check every element in order")
+register_algorithm("binary", "Binary Search", binary_search,
+                   config.BINARY_SEARCH_COMPLEXITY, requires_sorted=True,
+                   description="halve the sorted list each step")
+register_algorithm("interpolation", "Interpolation Search", interpolation_search,
+                   config.INTERPOLATION_SEARCH_COMPLEXITY, requires_sorted=True,
+                   description="estimate the position on evenly spaced data")
+register_algorithm("exponential", "Exponential Search", exponential_search,
+                   config.EXPONENTIAL_SEARCH_COMPLEXITY, requires_sorted=True,
+                   description="double a bound, then binary search")
+register_algorithm("jump", "Jump Search", jump_search,
+                   config.JUMP_SEARCH_COMPLEXITY, requires_sorted=True,
+                   description="jump sqrt(n) blocks, then scan one")
+register_algorithm("ternary", "Ternary Search", ternary_search,
+                   config.TERNARY_SEARCH_COMPLEXITY, requires_sorted=True,
+                   description="split the sorted list into thirds")
+register_algorithm("hash", "Hash Index Lookup", hash_search,
+                   config.HASH_INDEX_COMPLEXITY, "O(n)", hashed=True,
+                   description="build a value -> index map once, then O(1) lookups")
+register_algorithm("first", "First Occurrence", first_occurrence,
+                   config.BINARY_SEARCH_COMPLEXITY, requires_sorted=True,
+                   description="lower-bound bisection to the first match")
+register_algorithm("last", "Last Occurrence", last_occurrence,
+                   config.BINARY_SEARCH_COMPLEXITY, requires_sorted=True,
+                   description="upper-bound bisection to the last match")
+register_algorithm("eytzinger", "Eytzinger Search", eytzinger_search,
+                   config.EYTZINGER_SEARCH_COMPLEXITY, "O(n)", requires_sorted=True,
+                   description="binary search over a breadth-first layout of the sorted list")
+register_algorithm("btree", "B+Tree Search", btree_search,
+                   config.BTREE_SEARCH_COMPLEXITY, "O(n)", requires_sorted=True,
+                   description="descend a static B+tree with one cache line per node")
@@ -0,0 +1,248 @@
+"""
+Memoized search results for repeated identical queries.
+
+Running the same algorithm for the same target on the same list always
+gives the same answer, so the CLI keeps each traced result (index, steps
+and the recorded trace) keyed on the dataset fingerprint, the algorithm key
+and the target. A repeat query replays the stored trace instead of
+searching again.
+
+The cache is bounded by total trace bytes (least recently used entries go
+first) and by age. It can be persisted to disk between sessions, and is
+cleared whenever the questions file it was filled from changes.
+"""
+
+import atexit
+import base64
+import json
+import os
+import time
+from collections import OrderedDict, namedtuple
+
+from .. import config
+
+# Total bytes of stored traces kept in memory
+CAPACITY_BYTES = 32 * 1024 * 1024
+
+# Seconds a result stays valid
+TTL_SECONDS = 24 * 60 * 60
+
+# Bookkeeping bytes counted per entry on top of its trace
+_ENTRY_OVERHEAD = 128
+
+CachedResult = namedtuple("CachedResult", ["index", "steps", "trace", "path", "stored_at"])
+CachedResult.__doc__ = """
+One memoized search.
+
+Fields:
+    index (int): Result index (-1 if not found).
+    steps (int): Steps taken.
+    trace (bytes): ``TraceRecorder.to_bytes()`` of the original run.
+    path (str): Trace file saved for the original run, or None.
+    stored_at (float): ``time.time()`` when the search ran.
+"""
+
+
+def _signature(path):
+    """(size, mtime) of the source file, or None if it cannot be read."""
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class ResultCache:
+    """
+    LRU cache of traced search results with size and age limits.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to search.
+    """
+
+    def __init__(self, capacity_bytes=CAPACITY_BYTES, ttl=TTL_SECONDS, cache_dir=None,
+                 source=None):
+        """
+        Args:
+            capacity_bytes (int): Maximum total size of stored traces.
+            ttl (float): Seconds before a stored result expires.
+            cache_dir (str): Directory to persist the cache in, or None for memory only.
+            source (str): Questions file; the cache is cleared when it changes.
+        """
+        self.capacity_bytes = max(1, int(capacity_bytes))
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.source = source
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._signature = _signature(source)
+        self._dirty = False
+        self._load()
+
+    def get(self, key, algorithm, target, mode=None):
+        """
+        Return the stored result of a query, or None.
+
+        Args:
+            key (str): Dataset fingerprint.
+            algorithm (str): Algorithm registry key.
+            target (int): The value searched for.
+            mode (str): Anything else that changes the result (optional).
+
+        Returns:
+            CachedResult or None: The stored result if present and fresh.
+        """
+        self._check_source()
+        entry_key = (key, algorithm, target, mode)
+        entry = self._entries.get(entry_key)
+        if entry is not None and time.time() - entry.stored_at > self.ttl:
+            self._drop(entry_key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(entry_key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, algorithm, target, index, steps, trace, path=None, mode=None):
+        """
+        Store the result of a query.
+
+        ``path`` is the trace file already saved for the run; records of
+        later hits point at it instead of saving another copy.
+
+        Results whose trace would take more than an eighth of the cache are
+        not stored, so one huge scan cannot flush everything else.
+        """
+        cost = len(trace) + _ENTRY_OVERHEAD
+        if cost > self.capacity_bytes // 8:
+            return
+        entry_key = (key, algorithm, target, mode)
+        self._drop(entry_key)
+        self._entries[entry_key] = CachedResult(index, steps, bytes(trace), path,
+                                                 time.time())
+        self._size += cost
+        while self._size > self.capacity_bytes:
+            self._drop(next(iter(self._entries)))
+        self._dirty = True
+
+    def clear(self):
+        """Drop every stored result."""
+        if self._entries:
+            self._dirty = True
+        self._entries.clear()
+        self._size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def save(self):
+        """Write the cache to disk (when persisted and changed)."""
+        if not self.cache_dir or not self._dirty:
+            return
+        now = time.time()
+        entries = [
+            [key, algorithm, target, mode, e.index, e.steps, e.path, e.stored_at,
+             base64.b64encode(e.trace).decode("ascii")]
+            for (key, algorithm, target, mode), e in self._entries.items()
+            if now - e.stored_at <= self.ttl
+        ]
+        path = self._path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"source": self._signature, "entries": entries}, f,
+                          separators=(",", ":"))
+            os.replace(tmp_path, path)
+            self._dirty = False
+        except OSError:
+            pass
+
+    def _path(self):
+        return os.path.join(self.cache_dir, "results.json")
+
+    def _load(self):
+        if not self.cache_dir:
+            return
+        try:
+            with open(self._path(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("source") != self._signature:
+                # Questions changed since the cache was written
+                self._dirty = True
+                return
+            now = time.time()
+            for (key, algorithm, target, mode, index, steps, path, stored_at,
+                 trace) in data["entries"]:
+                if now - stored_at <= self.ttl:
+                    entry = CachedResult(index, steps, base64.b64decode(trace), path, stored_at)
+                    self._entries[(key, algorithm, target, mode)] = entry
+                    self._size += len(entry.trace) + _ENTRY_OVERHEAD
+        except (OSError, ValueError, KeyError, TypeError):
+            self._entries.clear()
+            self._size = 0
+
+    def _check_source(self):
+        signature = _signature(self.source)
+        if signature != self._signature:
+            self._signature = signature
+            self.clear()
+
+    def _drop(self, entry_key):
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self._size -= len(entry.trace) + _ENTRY_OVERHEAD
+            self._dirty = True
+
+
+# "memory", "disk" or "off", and the questions file results come from
+_mode = "memory"
+_source = None
+_default_cache = None
+
+RESULT_CACHE_MODES = ("memory", "disk", "off")
+
+
+def configure_result_cache(mode="memory", source=None):
+    """
+    Choose how results are memoized for the rest of the process.
+
+    Args:
+        mode (str): "memory" (default), "disk" (also persisted between
+            sessions) or "off".
+        source (str): Questions file whose changes invalidate the cache
+            (default: data/questions.json).
+
+    Raises:
+        ValueError: For an unknown mode.
+    """
+    global _mode, _source, _default_cache
+    if mode not in RESULT_CACHE_MODES:
+        raise ValueError(f"Result cache mode must be one of {', '.join(RESULT_CACHE_MODES)}")
+    _mode = mode
+    _source = source
+    _default_cache = None
+
+
+def get_result_cache():
+    """
+    Return the process-wide result cache, or None when caching is off.
+
+    Returns:
+        ResultCache or None: The shared cache.
+    """
+    global _default_cache
+    if _mode == "off":
+        return None
+    if _default_cache is None:
+        persisted = _mode == "disk"
+        _default_cache = ResultCache(cache_dir=str(config.CACHE_DIR) if persisted else None,
+                                     source=_source or config.get_questions_file())
+        if persisted:
+            atexit.register(_default_cache.save)
+    return _default_cache
@@ -2,103 +2,438 @@
 Core search algorithm implementations.
 
 This module contains the main search algorithms with step-by-step execution tracking.
+The algorithms themselves never print: pass a ``tracer`` callable to receive a
+``StepEvent`` for every step (see ``core.tracing``), or leave it out to run silently.
 """
 
+from math import isqrt
 
-def linear_search(arr, target):
+from .sorted_index import get_sorted_index
+from .tracing import (
+    StepEvent,
+    START,
+    EMPTY,
+    SORTED,
+    STEP,
+    FOUND,
+    NOT_FOUND,
+    MATCH,
+    NEXT,
+    RIGHT,
+    LEFT,
+    MIDDLE,
+    EXPAND,
+    RANGE,
+    JUMP_AHEAD,
+    BLOCK,
+    PASSED,
+)
+
+LINEAR = "Linear Search"
+BINARY = "Binary Search"
+INTERPOLATION = "Interpolation Search"
+EXPONENTIAL = "Exponential Search"
+JUMP = "Jump Search"
+TERNARY = "Ternary Search"
+
+
+def linear_search(arr, target, tracer=None):
     """
-    Perform linear search with step-by-step explanation.
-    
+    Perform linear search, optionally reporting every step to a tracer.
+
     Args:
         arr (list): The list to search in.
         target (int): The target value to find.
-        
+        tracer (callable): Optional sink called with a StepEvent per step.
+
     Returns:
         tuple: (index_found_or_-1, steps_taken)
-        
+
     Time Complexity: O(n)
     Space Complexity: O(1)
     """
-    print("\n--------- LINEAR SEARCH ---------")
+    if tracer is None:
+        try:
+            index = arr.index(target)
+        except ValueError:
+            return -1, len(arr)
+        except AttributeError:
+            for index, value in enumerate(arr):
+                if value == target:
+                    return index, index + 1
+            return -1, len(arr)
+        return index, index + 1
+
+    tracer(StepEvent(LINEAR, START, target=target))
     steps = 0
 
     for i in range(len(arr)):
         value = arr[i]
         steps += 1
-        print(f"Step {steps} : index = {i} , element = {value} , target = {target}")
 
         if value == target:
-            print("=> Match found")
-            print(f"=> Element {target} found at index {i}")
-            print(f"Total steps taken (Linear Search): {steps}")
+            tracer(StepEvent(LINEAR, STEP, steps, index=i, value=value,
+                             target=target, decision=MATCH))
+            tracer(StepEvent(LINEAR, FOUND, steps, index=i, target=target))
             return i, steps
-        else:
-            print("=> Not equal, moving next\n")
 
-    print("=> Element not found")
-    print(f"Total steps taken (Linear Search): {steps}")
+        tracer(StepEvent(LINEAR, STEP, steps, index=i, value=value,
+                         target=target, decision=NEXT))
+
+    tracer(StepEvent(LINEAR, NOT_FOUND, steps, target=target))
     return -1, steps
 
 
-def binary_search(arr, target):
+def binary_search(arr, target, tracer=None, index=None):
     """
-    Perform binary search with step-by-step explanation on a sorted copy.
-    
+    Perform binary search on a sorted copy, optionally reporting every step.
+
     Args:
         arr (list): The list to search in (will be sorted).
         target (int): The target value to find.
-        
+        tracer (callable): Optional sink called with a StepEvent per step.
+        index (SortedIndex): Prebuilt sorted index of ``arr``. When omitted the
+            cached index for ``arr`` is used, so the sort happens at most once
+            per dataset.
+
     Returns:
         tuple: (index_found_or_-1_in_sorted_array, steps_taken)
-        
+
     Time Complexity: O(log n)
     Space Complexity: O(1)
-    
-    Note: Binary search requires a sorted list, so this function creates
-    a sorted copy of the input array.
+
+    Note: Binary search requires a sorted list, so this function searches
+    a sorted copy of the input array. ``index.original_index(i)`` maps the
+    returned position back to the original list.
     """
-    print("\n--------- BINARY SEARCH ---------")
-    if len(arr) == 0:
-        print("List is empty. Nothing to search.")
+    index = _prepare_sorted(BINARY, arr, target, tracer, index)
+    if index is None:
+        return -1, 0
+
+    return _bisect(BINARY, index, target, 0, len(index.values) - 1, 0, tracer)
+
+
+def interpolation_search(arr, target, tracer=None, index=None):
+    """
+    Perform interpolation search on a sorted copy, optionally tracing every step.
+
+    Instead of always probing the middle, the probe position is estimated from
+    where ``target`` falls between the values at ``low`` and ``high``. On
+    uniformly distributed data this converges much faster than halving.
+
+    Args:
+        arr (list): The list to search in (will be sorted).
+        target (int): The target value to find.
+        tracer (callable): Optional sink called with a StepEvent per step.
+        index (SortedIndex): Prebuilt sorted index of ``arr`` (optional).
+
+    Returns:
+        tuple: (index_found_or_-1_in_sorted_array, steps_taken)
+
+    Time Complexity: O(log log n) on uniform data, O(n) worst case
+    Space Complexity: O(1)
+    """
+    index = _prepare_sorted(INTERPOLATION, arr, target, tracer, index)
+    if index is None:
         return -1, 0
 
-    # Binary search requires a sorted list → use a sorted copy
-    sorted_arr = sorted(arr)
-    print("Note: Binary Search works on a sorted list.")
-    print("Sorted list used:")
-    _print_list_plain(sorted_arr)
+    values = index.values
+    low, high = 0, len(values) - 1
+    steps = 0
+
+    while low <= high and values[low] <= target <= values[high]:
+        steps += 1
+        span = values[high] - values[low]
+        if span == 0:
+            mid = low
+        else:
+            mid = low + (target - values[low]) * (high - low) // span
+        value = values[mid]
+
+        if value == target:
+            return _found(INTERPOLATION, index, mid, low, high, steps, target, tracer)
+        elif value < target:
+            if tracer is not None:
+                tracer(StepEvent(INTERPOLATION, STEP, steps, mid, low, high, mid, value, target, RIGHT))
+            low = mid + 1
+        else:
+            if tracer is not None:
+                tracer(StepEvent(INTERPOLATION, STEP, steps, mid, low, high, mid, value, target, LEFT))
+            high = mid - 1
+
+    if tracer is not None:
+        tracer(StepEvent(INTERPOLATION, NOT_FOUND, steps, target=target))
+    return -1, steps
+
+
+def exponential_search(arr, target, tracer=None, index=None):
+    """
+    Perform exponential search on a sorted copy, optionally tracing every step.
+
+    The upper bound doubles (1, 2, 4, 8, ...) until it passes ``target``, then a
+    binary search runs inside the last range. Targets near the front of the
+    sorted list are found in very few steps.
+
+    Args:
+        arr (list): The list to search in (will be sorted).
+        target (int): The target value to find.
+        tracer (callable): Optional sink called with a StepEvent per step.
+        index (SortedIndex): Prebuilt sorted index of ``arr`` (optional).
+
+    Returns:
+        tuple: (index_found_or_-1_in_sorted_array, steps_taken)
+
+    Time Complexity: O(log i), where i is the position of the target
+    Space Complexity: O(1)
+    """
+    index = _prepare_sorted(EXPONENTIAL, arr, target, tracer, index)
+    if index is None:
+        return -1, 0
 
-    low, high = 0, len(sorted_arr) - 1
+    values = index.values
+    n = len(values)
+    bound = 0
+    steps = 0
+
+    while bound < n:
+        steps += 1
+        value = values[bound]
+
+        if value == target:
+            return _found(EXPONENTIAL, index, bound, 0, bound, steps, target, tracer)
+        elif value < target:
+            if tracer is not None:
+                tracer(StepEvent(EXPONENTIAL, STEP, steps, bound, bound // 2, bound, bound,
+                                 value, target, EXPAND))
+            bound = bound * 2 if bound else 1
+        else:
+            if tracer is not None:
+                tracer(StepEvent(EXPONENTIAL, STEP, steps, bound, bound // 2, bound, bound,
+                                 value, target, RANGE))
+            break
+
+    return _bisect(EXPONENTIAL, index, target, bound // 2 + 1 if bound else 0,
+                   min(bound, n) - 1, steps, tracer)
+
+
+def jump_search(arr, target, tracer=None, index=None):
+    """
+    Perform jump search on a sorted copy, optionally tracing every step.
+
+    The sorted list is checked in blocks of about sqrt(n) elements: jump ahead
+    while the last element of the block is smaller than ``target``, then scan
+    the one block that can contain it.
+
+    Args:
+        arr (list): The list to search in (will be sorted).
+        target (int): The target value to find.
+        tracer (callable): Optional sink called with a StepEvent per step.
+        index (SortedIndex): Prebuilt sorted index of ``arr`` (optional).
+
+    Returns:
+        tuple: (index_found_or_-1_in_sorted_array, steps_taken)
+
+    Time Complexity: O(sqrt(n))
+    Space Complexity: O(1)
+    """
+    index = _prepare_sorted(JUMP, arr, target, tracer, index)
+    if index is None:
+        return -1, 0
+
+    values = index.values
+    n = len(values)
+    block = max(1, isqrt(n))
+    low = 0
+    steps = 0
+
+    # Jump block by block, probing the last element of each block
+    while True:
+        high = min(low + block, n) - 1
+        steps += 1
+        value = values[high]
+
+        if value == target:
+            return _found(JUMP, index, high, low, high, steps, target, tracer)
+        if value < target:
+            if tracer is not None:
+                tracer(StepEvent(JUMP, STEP, steps, high, low, high, high, value, target, JUMP_AHEAD))
+            low = high + 1
+            if low >= n:
+                if tracer is not None:
+                    tracer(StepEvent(JUMP, NOT_FOUND, steps, target=target))
+                return -1, steps
+        else:
+            if tracer is not None:
+                tracer(StepEvent(JUMP, STEP, steps, high, low, high, high, value, target, BLOCK))
+            break
+
+    # Scan the rest of the candidate block linearly
+    for i in range(low, high):
+        steps += 1
+        value = values[i]
+
+        if value == target:
+            return _found(JUMP, index, i, low, high, steps, target, tracer)
+        if value > target:
+            if tracer is not None:
+                tracer(StepEvent(JUMP, STEP, steps, i, low, high, i, value, target, PASSED))
+            break
+        if tracer is not None:
+            tracer(StepEvent(JUMP, STEP, steps, i, low, high, i, value, target, NEXT))
+
+    if tracer is not None:
+        tracer(StepEvent(JUMP, NOT_FOUND, steps, target=target))
+    return -1, steps
+
+
+def ternary_search(arr, target, tracer=None, index=None):
+    """
+    Perform ternary search on a sorted copy, optionally tracing every step.
+
+    Each round probes two points that split the range into thirds and keeps
+    the third that can still contain ``target``.
+
+    Args:
+        arr (list): The list to search in (will be sorted).
+        target (int): The target value to find.
+        tracer (callable): Optional sink called with a StepEvent per step.
+        index (SortedIndex): Prebuilt sorted index of ``arr`` (optional).
+
+    Returns:
+        tuple: (index_found_or_-1_in_sorted_array, steps_taken)
+
+    Time Complexity: O(log3 n)
+    Space Complexity: O(1)
+    """
+    index = _prepare_sorted(TERNARY, arr, target, tracer, index)
+    if index is None:
+        return -1, 0
+
+    values = index.values
+    low, high = 0, len(values) - 1
     steps = 0
 
+    while low <= high:
+        third = (high - low) // 3
+        mid1 = low + third
+        mid2 = high - third
+
+        steps += 1
+        value = values[mid1]
+        if value == target:
+            return _found(TERNARY, index, mid1, low, high, steps, target, tracer)
+        if target < value:
+            if tracer is not None:
+                tracer(StepEvent(TERNARY, STEP, steps, mid1, low, high, mid1, value, target, LEFT))
+            high = mid1 - 1
+            continue
+        if tracer is not None:
+            tracer(StepEvent(TERNARY, STEP, steps, mid1, low, high, mid1, value, target, NEXT))
+
+        steps += 1
+        value = values[mid2]
+        if value == target:
+            return _found(TERNARY, index, mid2, low, high, steps, target, tracer)
+        if target > value:
+            if tracer is not None:
+                tracer(StepEvent(TERNARY, STEP, steps, mid2, low, high, mid2, value, target, RIGHT))
+            low = mid2 + 1
+        else:
+            if tracer is not None:
+                tracer(StepEvent(TERNARY, STEP, steps, mid2, low, high, mid2, value, target, MIDDLE))
+            low, high = mid1 + 1, mid2 - 1
+
+    if tracer is not None:
+        tracer(StepEvent(TERNARY, NOT_FOUND, steps, target=target))
+    return -1, steps
+
+
+def _prepare_sorted(name, arr, target, tracer, index):
+    """
+    Emit the start events of a sorted-list search and return the sorted index.
+
+    Returns:
+        SortedIndex or None: None when ``arr`` is empty.
+    """
+    if tracer is not None:
+        tracer(StepEvent(name, START, target=target))
+
+    if len(arr) == 0:
+        if tracer is not None:
+            tracer(StepEvent(name, EMPTY, 0, target=target))
+        return None
+
+    # These searches require a sorted list → use the cached sorted copy. Looking
+    # it up fingerprints ``arr`` (O(n)), so callers searching one dataset
+    # repeatedly build the index once and pass ``index=``
+    if index is None:
+        index = get_sorted_index(arr)
+    if tracer is not None:
+        tracer(StepEvent(name, SORTED, value=index.values, target=target))
+    return index
+
+
+def _bisect(name, index, target, low, high, steps, tracer):
+    """Classic binary search over ``index.values[low:high + 1]``."""
+    sorted_arr = index.values
+
     while low <= high:
         steps += 1
         mid = (low + high) // 2
         value = sorted_arr[mid]
 
-        print(
-            f"Step {steps} : low = {low} , high = {high} , mid = {mid} , "
-            f"element = {value} , target = {target}"
-        )
-
         if value == target:
-            print("=> Match found")
-            print(f"=> Element {target} found at index {mid} (in sorted list)")
-            print(f"Total steps taken (Binary Search): {steps}")
-            return mid, steps
+            return _found(name, index, mid, low, high, steps, target, tracer)
         elif value < target:
-            print("=> element < target , searching RIGHT half (low = mid + 1)\n")
+            if tracer is not None:
+                tracer(StepEvent(name, STEP, steps, mid, low, high, mid, value, target, RIGHT))
             low = mid + 1
         else:
-            print("=> element > target , searching LEFT half (high = mid - 1)\n")
+            if tracer is not None:
+                tracer(StepEvent(name, STEP, steps, mid, low, high, mid, value, target, LEFT))
             high = mid - 1
 
-    print("=> Element not found")
-    print(f"Total steps taken (Binary Search): {steps}")
+    if tracer is not None:
+        tracer(StepEvent(name, NOT_FOUND, steps, target=target))
+    return -1, steps
+
+
+def bisect_outcome(n, first, stop):
+    """
+    Result of ``binary_search`` given where the target's matches lie.
+
+    A probe at ``mid`` goes right when ``mid < first``, left when
+    ``mid >= stop`` and matches otherwise, so the classic search can be
+    replayed from the match range alone (as the NumPy engine does after
+    ``searchsorted``).
+
+    Args:
+        n (int): Length of the sorted list.
+        first (int): Leftmost position holding the target (its lower bound).
+        stop (int): Position after the last match (its upper bound).
+
+    Returns:
+        tuple: (index_found_or_-1_in_sorted_array, steps_taken), identical to
+            ``binary_search`` on the same list.
+    """
+    low, high = 0, n - 1
+    steps = 0
+    while low <= high:
+        steps += 1
+        mid = (low + high) // 2
+        if mid < first:
+            low = mid + 1
+        elif mid >= stop:
+            high = mid - 1
+        else:
+            return mid, steps
     return -1, steps
 
 
-def _print_list_plain(arr):
-    """Print the list in a simple, single-line format."""
-    output = " ".join(str(x) for x in arr)
-    print(f"List contents: {output}")
+def _found(name, index, mid, low, high, steps, target, tracer):
+    """Emit the match events for a hit at ``mid`` in the sorted list."""
+    if tracer is not None:
+        tracer(StepEvent(name, STEP, steps, mid, low, high, mid, index.values[mid], target, MATCH))
+        tracer(StepEvent(name, FOUND, steps, index=mid, mid=mid, target=target,
+                         origin=index.positions[mid]))
+    return mid, steps
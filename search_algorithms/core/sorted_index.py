@@ -0,0 +1,278 @@
+"""
+Sorted index of a dataset, cached so binary search never re-sorts.
+
+A ``SortedIndex`` holds the sorted values together with the permutation back
+to the original positions, so a hit in the sorted list can also be reported
+as an index into the list the user actually loaded.
+"""
+
+import json
+import os
+from collections import OrderedDict
+
+from .. import config
+from .fingerprint import fingerprint
+
+# Default on-disk cache location
+CACHE_DIR = str(config.CACHE_DIR)
+
+# Number of indexes kept in memory / on disk
+MEMORY_CAPACITY = 32
+DISK_CAPACITY = 128
+
+# Smallest dataset whose index is written to disk; re-sorting anything
+# smaller is cheaper than reading it back
+PERSIST_MIN_SIZE = 10_000
+
+
+class SortedIndex:
+    """
+    Sorted values of a dataset plus their original positions.
+
+    Attributes:
+        values (list): The dataset in ascending order.
+        positions (list): ``positions[i]`` is the original index of ``values[i]``.
+        fingerprint (str): Content hash of the original dataset.
+        layouts (dict): Search layouts derived from ``values`` (see ``layouts.py``),
+            built on first use and kept for the life of the index.
+    """
+
+    __slots__ = ("values", "positions", "fingerprint", "layouts")
+
+    def __init__(self, values, positions, fingerprint=None):
+        self.values = values
+        self.positions = positions
+        self.fingerprint = fingerprint
+        self.layouts = {}
+
+    @classmethod
+    def build(cls, arr, key=None):
+        """
+        Sort ``arr`` once, remembering where every value came from.
+
+        Args:
+            arr (list): The dataset to index.
+            key (str): Precomputed fingerprint of ``arr`` (optional).
+
+        Returns:
+            SortedIndex: The new index.
+        """
+        # Stable sort, so duplicates keep their original relative order
+        positions = sorted(range(len(arr)), key=arr.__getitem__)
+        values = [arr[i] for i in positions]
+        return cls(values, positions, key)
+
+    @classmethod
+    def presorted(cls, arr, key=None):
+        """
+        Wrap an already ascending ``arr`` without sorting or copying it.
+
+        Args:
+            arr (list): A dataset already in ascending order.
+            key (str): Precomputed fingerprint of ``arr`` (optional).
+
+        Returns:
+            SortedIndex: Index whose positions are the identity permutation.
+        """
+        return cls(arr, range(len(arr)), key)
+
+    @property
+    def is_identity(self):
+        """True when the dataset was already sorted (positions are 0..n-1)."""
+        return isinstance(self.positions, range)
+
+    def __len__(self):
+        return len(self.values)
+
+    def original_index(self, sorted_pos):
+        """
+        Map a position in the sorted list back to the original list.
+
+        Args:
+            sorted_pos (int): Index into ``values`` (or -1).
+
+        Returns:
+            int: Index into the original dataset, or -1.
+        """
+        if sorted_pos < 0:
+            return -1
+        return self.positions[sorted_pos]
+
+    def to_dict(self):
+        """Return a JSON-serialisable representation."""
+        return {
+            "fingerprint": self.fingerprint,
+            "values": list(self.values),
+            "positions": list(self.positions),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild an index from ``to_dict`` output."""
+        return cls(data["values"], data["positions"], data.get("fingerprint"))
+
+
+class SortedIndexCache:
+    """
+    LRU cache of sorted indexes keyed on dataset fingerprint.
+
+    Recently used indexes stay in memory; with a ``cache_dir``, indexes of
+    large datasets are also written to disk so later sessions can skip the
+    sort entirely.
+    """
+
+    def __init__(self, capacity=MEMORY_CAPACITY, cache_dir=CACHE_DIR,
+                 disk_capacity=DISK_CAPACITY, persist_min_size=PERSIST_MIN_SIZE):
+        """
+        Args:
+            capacity (int): Maximum number of indexes held in memory.
+            cache_dir (str): Directory for persisted indexes, or None for memory only.
+            disk_capacity (int): Maximum number of persisted index files.
+            persist_min_size (int): Only datasets at least this long are persisted.
+        """
+        self.capacity = max(1, int(capacity))
+        self.cache_dir = cache_dir
+        self.disk_capacity = max(1, int(disk_capacity))
+        self.persist_min_size = persist_min_size
+        self._entries = OrderedDict()
+
+    def get(self, arr, key=None, presorted=False):
+        """
+        Return the sorted index for ``arr``, building it only on a cache miss.
+
+        Args:
+            arr (list): The dataset.
+            key (str): Precomputed fingerprint of ``arr`` (optional).
+            presorted (bool): ``arr`` is known to be ascending, so wrap it
+                instead of sorting (such indexes are not written to disk).
+
+        Returns:
+            SortedIndex: Index for ``arr``.
+        """
+        if key is None:
+            key = fingerprint(arr)
+
+        index = self._entries.get(key)
+        if index is not None:
+            self._entries.move_to_end(key)
+            return index
+
+        if presorted:
+            index = SortedIndex.presorted(arr, key)
+        elif len(arr) < self.persist_min_size:
+            index = SortedIndex.build(arr, key)
+        else:
+            index = self._load(key)
+            if index is None:
+                index = SortedIndex.build(arr, key)
+                self._store(index)
+
+        self._remember(key, index)
+        return index
+
+    def peek(self, key):
+        """
+        Return the index for fingerprint ``key`` if it is already available.
+
+        Args:
+            key (str): Dataset fingerprint.
+
+        Returns:
+            SortedIndex or None: The cached index, without building anything.
+        """
+        index = self._entries.get(key)
+        if index is None and self.cache_dir and os.path.exists(self._path(key)):
+            index = self._load(key)
+            if index is not None:
+                self._remember(key, index)
+        return index
+
+    def clear(self):
+        """Drop every in-memory entry (persisted files are kept)."""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remember(self, key, index):
+        self._entries[key] = index
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, "sorted_index", key + ".json")
+
+    def _load(self, key):
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                index = SortedIndex.from_dict(json.load(f))
+            # Refresh the timestamp used for on-disk LRU eviction
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            return None
+        index.fingerprint = key
+        return index
+
+    def _store(self, index):
+        if not self.cache_dir:
+            return
+        path = self._path(index.fingerprint)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index.to_dict(), f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+            self._evict_disk(os.path.dirname(path))
+        except OSError:
+            pass
+
+    def _evict_disk(self, folder):
+        files = [
+            os.path.join(folder, name)
+            for name in os.listdir(folder)
+            if name.endswith(".json")
+        ]
+        if len(files) <= self.disk_capacity:
+            return
+        files.sort(key=os.path.getmtime)
+        for path in files[:len(files) - self.disk_capacity]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+_default_cache = None
+
+
+def get_index_cache():
+    """
+    Return the process-wide sorted index cache, creating it on first use.
+
+    Returns:
+        SortedIndexCache: The shared cache.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SortedIndexCache()
+    return _default_cache
+
+
+def get_sorted_index(arr, key=None, presorted=False):
+    """
+    Return the cached sorted index for ``arr`` from the process-wide cache.
+
+    Args:
+        arr (list): The dataset.
+        key (str): Precomputed fingerprint of ``arr`` (optional).
+        presorted (bool): ``arr`` is already ascending; skip the sort.
+
+    Returns:
+        SortedIndex: Index for ``arr``.
+    """
+    return get_index_cache().get(arr, key, presorted)
@@ -0,0 +1,189 @@
+"""
+Compact recording of search step events.
+
+``TraceRecorder`` is a tracer that stores each StepEvent field in its own
+typed ``array`` column instead of keeping event objects or formatted
+strings, and can serialise the whole trace to a small binary blob. The
+events can be re-created later to replay the explanation.
+"""
+
+import struct
+from array import array
+
+from . import tracing
+from .tracing import StepEvent
+
+MAGIC = b"SATR"
+VERSION = 1
+
+# Stored in int64 columns in place of None
+NONE = -(1 << 63)
+
+_INT64_MIN = -(1 << 63) + 1
+_INT64_MAX = (1 << 63) - 1
+
+KINDS = (tracing.START, tracing.EMPTY, tracing.SORTED, tracing.STEP, tracing.FOUND,
+         tracing.NOT_FOUND, tracing.BOUND, tracing.COUNT, tracing.IO)
+DECISIONS = (None, tracing.MATCH, tracing.NEXT, tracing.RIGHT, tracing.LEFT, tracing.MIDDLE,
+             tracing.EXPAND, tracing.RANGE, tracing.JUMP_AHEAD, tracing.BLOCK, tracing.PASSED,
+             tracing.HASHED, tracing.LOWER_LEFT, tracing.UPPER_RIGHT, tracing.UPPER_LEFT,
+             tracing.CHUNK_CLEAR, tracing.CHUNK_MATCH, tracing.FILE_CHUNK, tracing.NODE_LEFT,
+             tracing.NODE_RIGHT, tracing.DESCEND, tracing.LEAF_MISS, tracing.BLOOM_MISS,
+             tracing.PAST_END)
+
+_KIND_CODE = {kind: code for code, kind in enumerate(KINDS)}
+_DECISION_CODE = {decision: code for code, decision in enumerate(DECISIONS)}
+
+_INT_COLUMNS = ("step", "index", "low", "high", "mid", "value", "origin")
+_HEADER = struct.Struct("<4sHHqQ")
+
+
+class TraceRecorder:
+    """
+    Tracer that records step events into ``array`` columns.
+
+    Attributes:
+        algorithm (str): Algorithm name from the first event.
+        target (int): Target value from the first event.
+        lossy (bool): True if some value did not fit in int64 and was dropped.
+    """
+
+    def __init__(self):
+        self.algorithm = ""
+        self.target = None
+        self.lossy = False
+        self.kinds = array("b")
+        self.decisions = array("b")
+        self.columns = {name: array("q") for name in _INT_COLUMNS}
+
+    def __call__(self, event):
+        if not self.kinds:
+            self.algorithm = event.algorithm
+            self.target = event.target
+
+        self.kinds.append(_KIND_CODE[event.kind])
+        self.decisions.append(_DECISION_CODE.get(event.decision, 0))
+
+        columns = self.columns
+        columns["step"].append(self._int(event.step))
+        columns["index"].append(self._int(event.index))
+        columns["low"].append(self._int(event.low))
+        columns["high"].append(self._int(event.high))
+        columns["mid"].append(self._int(event.mid))
+        # The sorted-list event carries the whole list; it is not recorded
+        value = None if event.kind == tracing.SORTED else event.value
+        columns["value"].append(self._int(value))
+        columns["origin"].append(self._int(event.origin))
+
+    def _int(self, value):
+        if value is None:
+            return NONE
+        if _INT64_MIN <= value <= _INT64_MAX:
+            return value
+        self.lossy = True
+        return NONE
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def events(self, last=None):
+        """
+        Re-create the recorded events.
+
+        Args:
+            last (int): Only yield the last ``last`` step events (start and
+                final events are always included).
+
+        Yields:
+            StepEvent: Events in recorded order.
+        """
+        step_code = _KIND_CODE[tracing.STEP]
+        skip_until = 0
+        if last is not None:
+            steps_seen = self.kinds.count(step_code)
+            skip_until = max(0, steps_seen - last)
+
+        columns = self.columns
+        step_no = 0
+        for i, kind_code in enumerate(self.kinds):
+            if kind_code == step_code:
+                step_no += 1
+                if step_no <= skip_until:
+                    continue
+            yield StepEvent(
+                self.algorithm,
+                KINDS[kind_code],
+                _opt(columns["step"][i]),
+                _opt(columns["index"][i]),
+                _opt(columns["low"][i]),
+                _opt(columns["high"][i]),
+                _opt(columns["mid"][i]),
+                _opt(columns["value"][i]),
+                self.target,
+                DECISIONS[self.decisions[i]],
+                _opt(columns["origin"][i]),
+            )
+
+    def skipped(self, last):
+        """Number of step events ``events(last=last)`` leaves out."""
+        if last is None:
+            return 0
+        return max(0, self.kinds.count(_KIND_CODE[tracing.STEP]) - last)
+
+    def to_bytes(self):
+        """
+        Serialise the trace.
+
+        Returns:
+            bytes: Header, algorithm name, then each column's raw bytes.
+        """
+        name = self.algorithm.encode("utf-8")
+        target = self._int(self.target)
+        flags = 1 if self.lossy else 0
+        parts = [
+            _HEADER.pack(MAGIC, VERSION, flags, target, len(self.kinds)),
+            struct.pack("<H", len(name)),
+            name,
+            self.kinds.tobytes(),
+            self.decisions.tobytes(),
+        ]
+        parts.extend(self.columns[column].tobytes() for column in _INT_COLUMNS)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Rebuild a recorder from ``to_bytes`` output.
+
+        Raises:
+            ValueError: If the data is not a trace.
+        """
+        if len(data) < _HEADER.size or data[:4] != MAGIC:
+            raise ValueError("Not a recorded trace")
+        _, version, flags, target, count = _HEADER.unpack_from(data, 0)
+        if version != VERSION:
+            raise ValueError(f"Unsupported trace version: {version}")
+
+        pos = _HEADER.size
+        (name_len,) = struct.unpack_from("<H", data, pos)
+        pos += 2
+
+        recorder = cls()
+        recorder.algorithm = data[pos:pos + name_len].decode("utf-8")
+        pos += name_len
+        recorder.target = _opt(target)
+        recorder.lossy = bool(flags & 1)
+
+        recorder.kinds.frombytes(data[pos:pos + count])
+        pos += count
+        recorder.decisions.frombytes(data[pos:pos + count])
+        pos += count
+        size = count * recorder.columns["step"].itemsize
+        for column in _INT_COLUMNS:
+            recorder.columns[column].frombytes(data[pos:pos + size])
+            pos += size
+        return recorder
+
+
+def _opt(value):
+    return None if value == NONE else value
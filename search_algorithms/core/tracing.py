@@ -0,0 +1,119 @@
+"""
+Step events emitted by the search algorithms.
+
+The algorithms never print. When a ``tracer`` callable is passed they call it
+with one ``StepEvent`` per step (plus start/finish events); the CLI uses a
+tracer that renders the familiar step-by-step explanation, while programmatic
+and benchmark callers pass nothing and run at full speed.
+"""
+
+from collections import namedtuple
+
+# Event kinds
+START = "start"          # search begins
+EMPTY = "empty"          # nothing to search
+SORTED = "sorted"        # sorted copy in use (``value`` holds the sorted list)
+STEP = "step"            # one comparison
+FOUND = "found"          # target found at ``index`` (``origin`` = original index)
+NOT_FOUND = "not_found"  # search exhausted
+BOUND = "bound"          # bound search finished at sorted position ``index``
+COUNT = "count"          # ``value`` matches at sorted positions ``low`` .. ``high - 1``
+IO = "io"                # file search read ``value`` pages (``high`` bytes) from disk
+
+# Step decisions
+MATCH = "match"
+NEXT = "next"
+RIGHT = "right"
+LEFT = "left"
+MIDDLE = "middle"          # ternary: target lies between the two probes
+EXPAND = "expand"          # exponential: double the bound
+RANGE = "range"            # exponential: bound passed target, bisect the range
+JUMP_AHEAD = "jump"        # jump: skip to the next block
+BLOCK = "block"            # jump: target is inside this block
+PASSED = "passed"          # jump: scanned past where target would be
+HASHED = "hashed"          # hash index: one dictionary lookup
+LOWER_LEFT = "lower_left"  # bound: element >= target, keep mid (high = mid)
+UPPER_RIGHT = "upper_right"  # bound: element <= target, go right (low = mid + 1)
+UPPER_LEFT = "upper_left"  # bound: element > target, keep mid (high = mid)
+CHUNK_CLEAR = "chunk_clear"  # parallel linear: no match in ``low`` .. ``high - 1``
+CHUNK_MATCH = "chunk_match"  # parallel linear: earliest match, at ``index``
+FILE_CHUNK = "file_chunk"  # file scan: no match in bytes ``low`` .. ``high - 1``
+NODE_LEFT = "node_left"    # eytzinger: element >= target, go to the left child
+NODE_RIGHT = "node_right"  # eytzinger: element < target, go to the right child
+DESCEND = "descend"        # b+tree: first key >= target, descend into its block
+LEAF_MISS = "leaf_miss"    # b+tree: first element >= target is not the target
+BLOOM_MISS = "bloom_miss"  # bloom filter: target definitely absent, search skipped
+PAST_END = "past_end"      # b+tree: every key in the node < target, nothing left to search
+
+StepEvent = namedtuple(
+    "StepEvent",
+    ["algorithm", "kind", "step", "index", "low", "high", "mid", "value", "target",
+     "decision", "origin"],
+)
+StepEvent.__new__.__defaults__ = (None,) * 9
+
+
+class StepRecorder:
+    """
+    Tracer that keeps every event it receives.
+
+    Example:
+        >>> recorder = StepRecorder()
+        >>> linear_search([4, 2, 9], 9, tracer=recorder)
+        (2, 3)
+        >>> [e.index for e in recorder if e.kind == "step"]
+        [0, 1, 2]
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event):
+        self.events.append(event)
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __len__(self):
+        return len(self.events)
+
+
+def trace_steps(search, arr, target, **kwargs):
+    """
+    Run ``search`` and yield its step events one by one.
+
+    Args:
+        search (callable): A search function accepting a ``tracer`` keyword.
+        arr (list): The list to search in.
+        target (int): The target value to find.
+        **kwargs: Extra keyword arguments for ``search``.
+
+    Yields:
+        StepEvent: Events in the order the search produced them.
+    """
+    recorder = StepRecorder()
+    search(arr, target, tracer=recorder, **kwargs)
+    yield from recorder.events
+
+
+def tee(*tracers):
+    """
+    Combine tracers into one that forwards every event to each of them.
+
+    Args:
+        *tracers: Tracer callables (None entries are ignored).
+
+    Returns:
+        callable or None: The combined tracer, or None if none were given.
+    """
+    active = [tracer for tracer in tracers if tracer is not None]
+    if not active:
+        return None
+    if len(active) == 1:
+        return active[0]
+
+    def forward(event):
+        for tracer in active:
+            tracer(event)
+
+    return forward
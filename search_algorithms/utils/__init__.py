@@ -1,15 +1,60 @@
 """Utility functions for data handling and logging."""
 
-from .data_handler import load_questions, save_result, show_history, clear_last_result
-from .input_handler import take_list_input, take_target_input, convert_num, print_list_plain
+from .data_handler import (
+    load_questions,
+    make_result,
+    new_result_id,
+    find_result,
+    save_result,
+    save_results,
+    show_history,
+    iter_history,
+    show_stats,
+    clear_last_result,
+)
+from .results_store import ResultsStore, get_store
+from .binary_dataset import BinaryQuestions, convert_json_to_binary, write_binary_dataset
+from .lazy_questions import LazyJsonQuestions
+from .trace_store import save_trace, load_trace
+from .profiling import PhaseTimer, record_phase, start_profiling, print_profile
+from .input_handler import (
+    take_list_input,
+    take_target_input,
+    take_range_input,
+    read_targets,
+    convert_num,
+    format_list_plain,
+    print_list_plain,
+)
 
 __all__ = [
     "load_questions",
+    "make_result",
+    "new_result_id",
+    "find_result",
     "save_result",
+    "save_results",
     "show_history",
+    "iter_history",
+    "show_stats",
     "clear_last_result",
+    "ResultsStore",
+    "get_store",
+    "BinaryQuestions",
+    "convert_json_to_binary",
+    "write_binary_dataset",
+    "LazyJsonQuestions",
+    "save_trace",
+    "load_trace",
+    "PhaseTimer",
+    "record_phase",
+    "start_profiling",
+    "print_profile",
     "take_list_input",
     "take_target_input",
+    "take_range_input",
+    "read_targets",
     "convert_num",
+    "format_list_plain",
     "print_list_plain",
 ]
\ No newline at end of file
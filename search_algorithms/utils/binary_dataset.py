@@ -0,0 +1,209 @@
+"""
+Compact binary dataset format for large question sets.
+
+Layout (all integers little-endian):
+
+    header     magic b"SAQB", u16 version, u16 flags, u32 key count, u64 data offset
+    key index  per key: u16 key length, UTF-8 key, u64 byte offset, u64 element count
+    data       packed int64 arrays, one per key, 8-byte aligned
+
+``BinaryQuestions`` maps the file with ``mmap`` and only parses the header and
+key index on open; each question array is a zero-copy int64 ``memoryview``
+created when the key is first looked up.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+
+MAGIC = b"SAQB"
+VERSION = 1
+BINARY_SUFFIX = ".bin"
+
+_HEADER = struct.Struct("<4sHHIQ")
+_KEY_LEN = struct.Struct("<H")
+_KEY_ENTRY = struct.Struct("<QQ")
+_ITEM_SIZE = 8
+
+
+def is_binary_dataset(filename):
+    """
+    Check whether a file starts with the binary dataset magic bytes.
+
+    Args:
+        filename (str): Path to check.
+
+    Returns:
+        bool: True for a binary dataset file.
+    """
+    try:
+        with open(filename, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def write_binary_dataset(questions, filename):
+    """
+    Write a dict of integer lists in the binary dataset format.
+
+    Args:
+        questions (dict): Question key -> list of integers.
+        filename (str): Output path.
+
+    Returns:
+        int: Number of questions written.
+
+    Raises:
+        ValueError: If a value is not an integer or does not fit in int64.
+    """
+    entries = []
+    index_size = 0
+    for key, values in questions.items():
+        encoded = str(key).encode("utf-8")
+        try:
+            packed = array("q", values)
+        except (OverflowError, TypeError) as e:
+            raise ValueError(f"Question {key} cannot be stored as int64: {e}")
+        if sys.byteorder != "little":
+            packed.byteswap()
+        entries.append((encoded, packed))
+        index_size += _KEY_LEN.size + len(encoded) + _KEY_ENTRY.size
+
+    data_offset = _align(_HEADER.size + index_size)
+
+    tmp_path = filename + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(entries), data_offset))
+
+        offset = data_offset
+        for encoded, packed in entries:
+            f.write(_KEY_LEN.pack(len(encoded)))
+            f.write(encoded)
+            f.write(_KEY_ENTRY.pack(offset, len(packed)))
+            offset += len(packed) * _ITEM_SIZE
+
+        f.write(b"\0" * (data_offset - f.tell()))
+        for _, packed in entries:
+            packed.tofile(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, filename)
+    return len(entries)
+
+
+def convert_json_to_binary(source, destination=None):
+    """
+    Convert a questions.json file into the binary dataset format.
+
+    Args:
+        source (str): Path of the JSON questions file.
+        destination (str): Output path (default: source with a .bin suffix).
+
+    Returns:
+        tuple: (destination path, number of questions written)
+    """
+    if destination is None:
+        destination = os.path.splitext(source)[0] + BINARY_SUFFIX
+
+    with open(source, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("JSON must contain key-value pairs.")
+
+    return destination, write_binary_dataset(data, destination)
+
+
+class BinaryQuestions(Mapping):
+    """
+    Read-only mapping of question key -> int64 memoryview backed by ``mmap``.
+
+    Opening only reads the key index. Arrays are never copied: each lookup
+    returns a view into the mapped file, so pages are read from disk only
+    when a question is actually searched.
+    """
+
+    def __init__(self, filename):
+        """
+        Args:
+            filename (str): Path of a file written by ``write_binary_dataset``.
+
+        Raises:
+            ValueError: If the file is not a valid binary dataset.
+        """
+        self.filename = filename
+        self._file = open(filename, "rb")
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"{filename} is too small to be a binary dataset")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        magic, version, _, count, _ = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{filename} is not a binary dataset")
+        if version != VERSION:
+            raise ValueError(f"Unsupported binary dataset version: {version}")
+
+        self._index = {}
+        pos = _HEADER.size
+        for _ in range(count):
+            (key_len,) = _KEY_LEN.unpack_from(self._mmap, pos)
+            pos += _KEY_LEN.size
+            key = bytes(self._mmap[pos:pos + key_len]).decode("utf-8")
+            pos += key_len
+            offset, length = _KEY_ENTRY.unpack_from(self._mmap, pos)
+            pos += _KEY_ENTRY.size
+            if offset + length * _ITEM_SIZE > size:
+                raise ValueError(f"{filename} is truncated (question {key})")
+            self._index[key] = (offset, length)
+
+        self._buffer = memoryview(self._mmap)
+
+    def __getitem__(self, key):
+        offset, length = self._index[key]
+        view = self._buffer[offset:offset + length * _ITEM_SIZE]
+        if sys.byteorder == "little":
+            return view.cast("q")
+        # Big-endian hosts need a byte-swapped copy
+        values = array("q", view.tobytes())
+        values.byteswap()
+        return values
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def length(self, key):
+        """Return the number of elements in a question without touching its data."""
+        return self._index[key][1]
+
+    def close(self):
+        """
+        Release the mapping.
+
+        Views handed out earlier must be released first; otherwise the
+        mapping stays open until they are garbage collected.
+        """
+        try:
+            self._buffer.release()
+            self._mmap.close()
+        except BufferError:
+            return
+        self._file.close()
+
+
+def _align(offset):
+    return (offset + _ITEM_SIZE - 1) // _ITEM_SIZE * _ITEM_SIZE
@@ -4,27 +4,52 @@ Data handling utilities for file I/O and result logging.
 
 import json
 import os
+import uuid
+from itertools import islice
 from pathlib import Path
 
+from .results_store import RESULTS_FILE, get_store
+from .binary_dataset import BinaryQuestions, is_binary_dataset
+from .lazy_questions import LazyJsonQuestions, LAZY_THRESHOLD
+
 # Default paths
-RESULTS_FILE = "results.json"
 QUESTIONS_FILE = "data/questions.json"
 
 
 def load_questions(filename):
     """
-    Load questions from a JSON file and return as a dictionary.
+    Load questions from a JSON file (or a binary dataset) as a mapping.
+    
+    Binary datasets written by ``convert_json_to_binary`` are memory-mapped,
+    and JSON files larger than ``LAZY_THRESHOLD`` are indexed by key: in both
+    cases only the key list is read here and each question's array is loaded
+    when it is first accessed.
     
     Args:
-        filename (str): Path to the JSON file containing questions.
+        filename (str): Path to the JSON or binary file containing questions.
         
     Returns:
-        dict: Dictionary of questions, or empty dict if load fails.
+        dict: Mapping of questions, or empty dict if load fails.
     """
     if not os.path.exists(filename):
         print(f"Warning: {filename} not found.")
         return {}
     
+    if is_binary_dataset(filename):
+        try:
+            return BinaryQuestions(filename)
+        except (OSError, ValueError) as e:
+            print(f"Error: Unable to read '{filename}': {e}")
+            return {}
+    
+    if os.path.getsize(filename) >= LAZY_THRESHOLD:
+        # Large files: index the keys now, parse each array when it is chosen
+        try:
+            return LazyJsonQuestions(filename)
+        except (OSError, ValueError) as e:
+            print(f"Error: Unable to read '{filename}': {e}")
+            return {}
+    
     try:
         with open(filename, "r", encoding="utf-8") as file:
             data = json.load(file)
@@ -39,9 +64,30 @@ def load_questions(filename):
     return data
 
 
-def save_result(question, method, steps, time_complexity, space_complexity, found):
+def new_result_id():
+    """Return a short random id for a result record."""
+    return uuid.uuid4().hex[:10]
+
+
+def find_result(result_id):
     """
-    Save one result entry into results.json as a list of records.
+    Find a result record by id, scanning the log from the newest entry.
+    
+    Args:
+        result_id (str): Id shown in the history.
+        
+    Returns:
+        dict or None: The matching entry.
+    """
+    for entry in get_store().iter_reversed():
+        if entry.get("id") == result_id:
+            return entry
+    return None
+
+
+def make_result(question, method, steps, time_complexity, space_complexity, found, **extra):
+    """
+    Build one result entry in the format stored in the results log.
     
     Args:
         question (str): Question identifier (e.g., "Q1", "manual", "inline: 1 2 3")
@@ -50,8 +96,14 @@ def save_result(question, method, steps, time_complexity, space_complexity, foun
         time_complexity (str): Time complexity (e.g., "O(n)", "O(log n)")
         space_complexity (str): Space complexity (e.g., "O(1)")
         found (bool): Whether the target was found.
+        **extra: Additional fields to store with the entry (e.g. target, trace).
+            An ``id`` may be given; otherwise a new one is generated.
+        
+    Returns:
+        dict: The result entry.
     """
     entry = {
+        "id": extra.pop("id", None) or new_result_id(),
         "question": question,
         "method": method,
         "time_complexity": time_complexity,
@@ -59,94 +111,243 @@ def save_result(question, method, steps, time_complexity, space_complexity, foun
         "steps": steps,
         "found": "Found" if found else "Not Found"
     }
+    entry.update(extra)
+    return entry
 
-    # Load existing data (if any)
-    data = []
-    if os.path.exists(RESULTS_FILE):
-        try:
-            with open(RESULTS_FILE, "r", encoding="utf-8") as f:
-                old = json.load(f)
-                if isinstance(old, list):
-                    data = old
-        except Exception:
-            data = []
 
-    data.append(entry)
+def save_result(question, method, steps, time_complexity, space_complexity, found, **extra):
+    """
+    Append one result entry to the JSON Lines results log.
+    
+    Args:
+        question (str): Question identifier (e.g., "Q1", "manual", "inline: 1 2 3")
+        method (str): Search method used ("Linear Search", "Binary Search", etc.)
+        steps (int): Number of steps taken during search.
+        time_complexity (str): Time complexity (e.g., "O(n)", "O(log n)")
+        space_complexity (str): Space complexity (e.g., "O(1)")
+        found (bool): Whether the target was found.
+        **extra: Additional fields to store with the entry.
+    """
+    entry = make_result(question, method, steps, time_complexity, space_complexity,
+                        found, **extra)
+    save_results([entry])
+
 
-    # Save back to file
+def save_results(entries):
+    """
+    Append many result entries to the results log with a single write.
+    
+    Args:
+        entries (iterable): Entries built with ``make_result``.
+        
+    Returns:
+        int: Number of entries written.
+    """
     try:
-        with open(RESULTS_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        return get_store().append_many(entries)
     except Exception as e:
-        print(f"Warning: Could not write to results.json: {e}")
+        print(f"Warning: Could not write to {RESULTS_FILE}: {e}")
+        return 0
+
+
+def _normalize_found(found):
+    """Map a found filter ("yes", "no", True, "Not Found", ...) to the stored label."""
+    if found is None:
+        return None
+    if isinstance(found, bool):
+        return "Found" if found else "Not Found"
+    value = str(found).strip().lower()
+    if value in ("yes", "y", "true", "1", "found"):
+        return "Found"
+    if value in ("no", "n", "false", "0", "not found", "notfound"):
+        return "Not Found"
+    raise ValueError(f"Invalid found filter: {found}")
 
 
-def show_history():
-    """Display the history of all searches from results.json"""
+def iter_history(method=None, question=None, found=None, reverse=False):
+    """
+    Lazily yield ``(position, entry)`` pairs from the results log.
+
+    Entries are read one line at a time, so memory use stays constant no
+    matter how large the history is.
+    
+    Args:
+        method (str): Keep entries whose method contains this text, or a
+            registry key such as "binary" (case-insensitive).
+        question (str): Keep entries for this question label (case-insensitive).
+        found (bool or str): Keep only found (True/"yes") or missed (False/"no") searches.
+        reverse (bool): Yield newest entries first, read from the end of the log.
+        
+    Yields:
+        tuple: (position, entry dict). Positions are 1-based from the start of
+            the log, or -1, -2, ... from its end when ``reverse`` is set, so a
+            tail read never has to count the whole log.
+    """
+    if method:
+        # Accept registry keys such as "binary" as well as display names
+        from ..core.registry import get_algorithm
+        algorithm = get_algorithm(method)
+        method = (algorithm.name if algorithm else method).lower()
+    question = question.lower() if question else None
+    found = _normalize_found(found)
+
+    store = get_store()
+    if reverse:
+        position = 0
+        entries = store.iter_reversed()
+        step = -1
+    else:
+        position = 0
+        entries = iter(store)
+        step = 1
+
+    for entry in entries:
+        position += step
+        if method and method not in str(entry.get("method", "")).lower():
+            continue
+        if question and question != str(entry.get("question", "")).lower():
+            continue
+        if found and entry.get("found") != found:
+            continue
+        yield position, entry
+
+
+def show_history(limit=None, offset=0, tail=None, method=None, question=None, found=None):
+    """
+    Display search history from the results log, streaming entries lazily.
+    
+    Args:
+        limit (int): Maximum number of entries to show (None for all).
+        offset (int): Number of matching entries to skip first.
+        tail (int): Show only the last N matching entries (read from the end of the file).
+        method (str): Filter by method (case-insensitive substring).
+        question (str): Filter by question label.
+        found (bool or str): Filter by result ("yes"/"no").
+    """
     
     print("\n" + "="*60)
     print(" SEARCH HISTORY")
     print("="*60)
     
-    if not os.path.exists(RESULTS_FILE):
+    store = get_store()
+    if not store.exists():
         print("No history found. The results file doesn't exist yet.")
         print("="*60)
         return
     
     try:
-        with open(RESULTS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            
-            if not isinstance(data, list) or len(data) == 0:
-                print("No search results found in history.")
-                print("="*60)
-                return
-            
-            for idx, entry in enumerate(data, 1):
-                print(f"\n[{idx}] Question: {entry.get('question', 'N/A')}")
-                print(f"    Method: {entry.get('method', 'N/A')}")
-                print(f"    Result: {entry.get('found', 'N/A')}")
-                print(f"    Steps: {entry.get('steps', 'N/A')}")
-                print(f"    Time Complexity: {entry.get('time_complexity', 'N/A')}")
-                print(f"    Space Complexity: {entry.get('space_complexity', 'N/A')}")
-            
-            print("\n" + "="*60)
-            print(f"Total entries: {len(data)}")
+        matches = iter_history(method=method, question=question, found=found,
+                               reverse=tail is not None)
+        if tail is not None:
+            # Newest-first, so only `tail` entries are ever held in memory
+            page = list(islice(matches, offset or 0, (offset or 0) + tail))
+            page.reverse()
+            if limit is not None:
+                page = page[:limit]
+            matches = iter(page)
+        else:
+            stop = None if limit is None else (offset or 0) + limit
+            matches = islice(matches, offset or 0, stop)
+
+        shown = 0
+        for idx, entry in matches:
+            shown += 1
+            print(f"\n[{idx}] Question: {entry.get('question', 'N/A')}")
+            if "id" in entry:
+                trace = "  (trace recorded)" if entry.get("trace") else ""
+                print(f"    ID: {entry['id']}{trace}")
+            print(f"    Method: {entry.get('method', 'N/A')}")
+            print(f"    Result: {entry.get('found', 'N/A')}")
+            print(f"    Steps: {entry.get('steps', 'N/A')}")
+            if "bloom" in entry:
+                outcome = "miss, search skipped" if entry["bloom"] == "miss" else "pass"
+                print(f"    Bloom Filter: {outcome} ({entry.get('bloom_hits', 0)} hits, "
+                      f"{entry.get('bloom_misses', 0)} misses so far)")
+            print(f"    Time Complexity: {entry.get('time_complexity', 'N/A')}")
+            print(f"    Space Complexity: {entry.get('space_complexity', 'N/A')}")
+
+        if shown == 0:
+            print("No search results found in history.")
             print("="*60)
+            return
+        
+        print("\n" + "="*60)
+        print(f"Entries shown: {shown}")
+        print("="*60)
             
     except Exception as e:
         print(f"Error reading history: {e}")
         print("="*60)
 
 
+def show_stats(by="both", method=None, question=None, found=None):
+    """
+    Display step statistics and found-rate per question and/or method.
+    
+    The results log is mirrored into an indexed SQLite database and the
+    figures are computed there with SQL aggregation.
+    
+    Args:
+        by (str): Group by "question", "method" or "both".
+        method (str): Filter by method (registry key or text).
+        question (str): Filter by question label.
+        found (bool or str): Filter by result ("yes"/"no").
+    """
+    from .history_db import get_history_index, GROUPINGS
+    
+    print("\n" + "="*60)
+    print(" SEARCH STATISTICS")
+    print("="*60)
+    
+    if not get_store().exists():
+        print("No history found. The results file doesn't exist yet.")
+        print("="*60)
+        return
+    
+    try:
+        rows = get_history_index().stats(by=by, method=method, question=question, found=found)
+    except Exception as e:
+        print(f"Error computing statistics: {e}")
+        print("="*60)
+        return
+    
+    if not rows:
+        print("No search results match these filters.")
+        print("="*60)
+        return
+    
+    columns = GROUPINGS[by]
+    widths = {"question": 14, "method": 32}
+    header = " ".join(f"{c.capitalize():<{widths[c]}}" for c in columns)
+    print(f"{header} {'Count':>6} {'Mean':>9} {'Min':>7} {'Max':>9} {'p95':>9} {'Found':>7}")
+    for row in rows:
+        labels = " ".join(f"{str(v)[:widths[c]]:<{widths[c]}}" for c, v in zip(columns, row))
+        count, mean, low, high, p95, found_rate = row[len(columns):]
+        print(f"{labels} {count:>6} {mean:>9.2f} {low:>7} {high:>9} {p95:>9} "
+              f"{found_rate:>7.1%}")
+    
+    print("="*60)
+    print(f"Groups: {len(rows)}")
+    print("="*60)
+
+
 def clear_last_result():
-    """Remove the last entry from results.json"""
+    """Remove the last entry from the results log by truncating its tail."""
     
-    if not os.path.exists(RESULTS_FILE):
+    store = get_store()
+    if not store.exists():
         print("\n❌ No results file found. Nothing to clear.")
         return
     
     try:
-        with open(RESULTS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            
-            if not isinstance(data, list) or len(data) == 0:
-                print("\n❌ No results found in history. Nothing to clear.")
-                return
-            
-            # Get the last entry before removing
-            last_entry = data[-1]
-            
-            # Remove the last entry
-            data = data[:-1]
-            
-            # Save back
-            with open(RESULTS_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-            
-            print("\n✓ Last result cleared successfully!")
-            print(f"  Removed: Question '{last_entry.get('question', 'N/A')}' - Method '{last_entry.get('method', 'N/A')}'")
-            print(f"  Remaining entries: {len(data)}")
+        last_entry = store.pop_last()
+        if last_entry is None:
+            print("\n❌ No results found in history. Nothing to clear.")
+            return
+        
+        print("\n✓ Last result cleared successfully!")
+        print(f"  Removed: Question '{last_entry.get('question', 'N/A')}' - Method '{last_entry.get('method', 'N/A')}'")
+        print(f"  Remaining entries: {store.count()}")
             
     except Exception as e:
-        print(f"\n❌ Error clearing last result: {e}")
\ No newline at end of file
+        print(f"\n❌ Error clearing last result: {e}")
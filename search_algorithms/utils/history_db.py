@@ -0,0 +1,228 @@
+"""
+SQLite index over the results log for filtered queries and statistics.
+
+The JSON Lines log stays the record of truth (appends are cheap and
+crash-safe). ``HistoryIndex`` mirrors it into a local SQLite database in WAL
+mode, indexed on question, method and found, so questions such as "average
+steps for Binary Search on Q11" are answered by SQL aggregation instead of
+parsing every record in Python.
+
+The mirror is brought up to date incrementally before each query: each row
+remembers the byte offset and length of its line, so only lines appended
+since the last sync are read, and rows past a truncation (``/clearresult``)
+are dropped.
+"""
+
+import os
+import sqlite3
+
+from .results_store import get_store
+
+HISTORY_DB = "results.db"
+
+# Rows inserted per executemany batch while syncing
+_SYNC_BATCH = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    offset   INTEGER PRIMARY KEY,
+    length   INTEGER NOT NULL,
+    id       TEXT,
+    question TEXT COLLATE NOCASE,
+    method   TEXT COLLATE NOCASE,
+    found    INTEGER NOT NULL,
+    steps    INTEGER,
+    target   INTEGER
+);
+CREATE INDEX IF NOT EXISTS results_question ON results (question, method);
+CREATE INDEX IF NOT EXISTS results_method ON results (method);
+CREATE INDEX IF NOT EXISTS results_found ON results (found);
+"""
+
+# Columns /stats can group by
+GROUPINGS = {
+    "question": ("question",),
+    "method": ("method",),
+    "both": ("question", "method"),
+}
+
+_INSERT_SQL = "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+# p95 is the nearest-rank percentile: the ceil(0.95 * n)-th smallest value
+_STATS_SQL = """
+WITH ranked AS (
+    SELECT {columns}, steps, found,
+           ROW_NUMBER() OVER (PARTITION BY {columns} ORDER BY steps) AS rank,
+           COUNT(*) OVER (PARTITION BY {columns}) AS total
+    FROM results
+    WHERE steps IS NOT NULL{where}
+)
+SELECT {columns},
+       COUNT(*), AVG(steps), MIN(steps), MAX(steps),
+       MAX(CASE WHEN rank = (total * 95 + 99) / 100 THEN steps END),
+       AVG(found)
+FROM ranked
+GROUP BY {columns}
+ORDER BY {columns}
+"""
+
+
+class HistoryIndex:
+    """
+    SQLite mirror of a ``ResultsStore`` with aggregate queries.
+    """
+
+    def __init__(self, db_path=HISTORY_DB, store=None):
+        """
+        Args:
+            db_path (str): Path of the SQLite database file.
+            store (ResultsStore): Log to mirror (default: the process-wide store).
+        """
+        self.db_path = db_path
+        self.store = store if store is not None else get_store()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def sync(self):
+        """
+        Bring the database up to date with the results log.
+
+        Returns:
+            int: Number of rows added.
+        """
+        conn = self._connect()
+        size = self.store.size()
+
+        with conn:
+            # Drop rows whose lines were truncated away or rewritten
+            conn.execute("DELETE FROM results WHERE offset + length > ?", (size,))
+            while True:
+                row = conn.execute(
+                    "SELECT offset, length, id FROM results ORDER BY offset DESC LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    start = 0
+                    break
+                offset, length, result_id = row
+                entry = self.store.read_at(offset, length)
+                if entry is not None and entry.get("id") == result_id:
+                    start = offset + length
+                    break
+                conn.execute("DELETE FROM results WHERE offset >= ?", (offset,))
+
+            added = 0
+            batch = []
+            for offset, length, entry in self.store.iter_from(start):
+                batch.append(_row(offset, length, entry))
+                if len(batch) >= _SYNC_BATCH:
+                    conn.executemany(_INSERT_SQL, batch)
+                    added += len(batch)
+                    batch = []
+            if batch:
+                conn.executemany(_INSERT_SQL, batch)
+                added += len(batch)
+        return added
+
+    def stats(self, by="both", method=None, question=None, found=None):
+        """
+        Aggregate step counts and found-rate per group.
+
+        Args:
+            by (str): "question", "method" or "both".
+            method (str): Registry key, display name or method text to filter on.
+            question (str): Question label to filter on (case-insensitive).
+            found (bool or str): Keep only found or missed searches.
+
+        Returns:
+            list: Tuples of the group columns followed by
+                (count, mean, min, max, p95, found_rate).
+        """
+        if by not in GROUPINGS:
+            raise ValueError(f"Unknown grouping: {by}")
+        self.sync()
+
+        clauses = []
+        params = []
+        if method:
+            clauses.append("method LIKE ? ESCAPE '\\'")
+            params.append(_method_pattern(method))
+        if question:
+            clauses.append("question = ?")
+            params.append(question)
+        if found is not None:
+            from .data_handler import _normalize_found
+            clauses.append("found = ?")
+            params.append(1 if _normalize_found(found) == "Found" else 0)
+
+        where = "".join(f" AND {clause}" for clause in clauses)
+        sql = _STATS_SQL.format(columns=", ".join(GROUPINGS[by]), where=where)
+        return self._connect().execute(sql, params).fetchall()
+
+
+def _row(offset, length, entry):
+    """Turn one log record into a database row."""
+    steps = entry.get("steps")
+    target = entry.get("target")
+    return (
+        offset,
+        length,
+        entry.get("id"),
+        str(entry.get("question", "")),
+        str(entry.get("method", "")),
+        1 if entry.get("found") == "Found" else 0,
+        steps if isinstance(steps, int) else None,
+        target if isinstance(target, int) and -(1 << 63) <= target < (1 << 63) else None,
+    )
+
+
+def _method_pattern(method):
+    """
+    LIKE pattern for a method filter.
+
+    Registry keys and display names match by prefix, which also covers the
+    "(Compare Mode)" and "(Auto)" variants and can use the method index;
+    other text matches anywhere in the method.
+    """
+    from ..core.registry import get_algorithm
+    algorithm = get_algorithm(method)
+    if algorithm is not None:
+        return _escape_like(algorithm.name) + "%"
+    return "%" + _escape_like(method) + "%"
+
+
+def _escape_like(text):
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+_default_index = None
+
+
+def get_history_index():
+    """
+    Return the process-wide history index, creating it on first use.
+
+    The database is kept next to the results log.
+
+    Returns:
+        HistoryIndex: Index over the default results store.
+    """
+    global _default_index
+    if _default_index is None:
+        store = get_store()
+        directory = os.path.dirname(store.path)
+        _default_index = HistoryIndex(os.path.join(directory, HISTORY_DB), store)
+    return _default_index
@@ -2,6 +2,8 @@
 Input handling utilities for user interactions.
 """
 
+import sys
+
 
 def take_list_input():
     """
@@ -51,6 +53,38 @@ def convert_num(s):
     return nums if len(nums) > 0 else None
 
 
+def read_targets(path):
+    """
+    Read integer targets from a file (or stdin when path is "-").
+    
+    Numbers may be separated by commas, spaces or newlines.
+    
+    Args:
+        path (str): File to read, or "-" for standard input.
+        
+    Returns:
+        list or None: List of integers, or None if the input is invalid or empty.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    handle = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    nums = []
+    try:
+        for line in handle:
+            if line.strip() == "":
+                continue
+            parsed = convert_num(line)
+            if parsed is None:
+                return None
+            nums.extend(parsed)
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+    return nums if len(nums) > 0 else None
+
+
 def take_target_input():
     """
     Ask the user to enter the target number and validate it.
@@ -66,12 +100,52 @@ def take_target_input():
             print("Please enter a valid integer.")
 
 
-def print_list_plain(arr):
+def take_range_input():
+    """
+    Ask the user for a value range "a b" and validate it.
+    
+    Returns:
+        tuple: (low, high) with low <= high.
+    """
+    while True:
+        nums = convert_num(input("Enter value range as: low high  "))
+        if nums is None or len(nums) != 2:
+            print("Please enter exactly two integers.")
+            continue
+        return min(nums), max(nums)
+
+
+# Lists longer than twice this are printed as a head ... tail preview
+PREVIEW_ITEMS = 25
+
+
+def format_list_plain(arr, preview=PREVIEW_ITEMS):
+    """
+    Format a list on one line, eliding the middle of long lists.
+    
+    Args:
+        arr (list): List to format.
+        preview (int): Items kept at each end of a long list (None for all).
+        
+    Returns:
+        str: e.g. "List contents: 1 2 3 ... (999,994 more) ... 8 9 10"
+    """
+    n = len(arr)
+    if preview is None or n <= 2 * preview:
+        output = " ".join(str(x) for x in arr)
+    else:
+        head = " ".join(str(arr[i]) for i in range(preview))
+        tail = " ".join(str(arr[i]) for i in range(n - preview, n))
+        output = f"{head} ... ({n - 2 * preview:,} more) ... {tail}"
+    return f"List contents: {output}"
+
+
+def print_list_plain(arr, preview=PREVIEW_ITEMS):
     """
     Print the list in a simple, single-line format.
     
     Args:
         arr (list): List to print.
+        preview (int): Items shown at each end of a long list (None for all).
     """
-    output = " ".join(str(x) for x in arr)
-    print(f"List contents: {output}")
+    print(format_list_plain(arr, preview))
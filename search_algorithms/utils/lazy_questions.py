@@ -0,0 +1,194 @@
+"""
+Lazy loading of large questions.json files.
+
+Instead of parsing every array at startup, the file is scanned once for the
+byte range of each top-level value and only the key index is kept. The index
+is cached in a sidecar file (``<name>.idx``) keyed on the file's size and
+modification time, so later startups read just the sidecar. A question's
+array is parsed from its byte range the first time it is selected.
+"""
+
+import json
+import mmap
+import os
+import re
+from collections.abc import Mapping
+
+# Files smaller than this are simply parsed with json.load
+LAZY_THRESHOLD = 256 * 1024
+
+SIDECAR_SUFFIX = ".idx"
+
+_WS = re.compile(rb"[ \t\r\n]*")
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_STRUCTURE = re.compile(rb'["\[\]{}]')
+_SCALAR = re.compile(rb"[^,}\]\s]+")
+
+
+class LazyJsonQuestions(Mapping):
+    """
+    Read-only mapping of question key -> list, parsed one question at a time.
+
+    Only the key index is built when the mapping is created; ``questions[key]``
+    reads and parses that key's byte range on first access and caches it.
+    """
+
+    def __init__(self, filename, index=None):
+        """
+        Args:
+            filename (str): Path of the JSON questions file.
+            index (dict): Precomputed key -> (start, end) byte ranges (optional).
+
+        Raises:
+            ValueError: If the file is not a JSON object.
+        """
+        self.filename = filename
+        self._index = index if index is not None else load_key_index(filename)
+        self._parsed = {}
+
+    def __getitem__(self, key):
+        if key in self._parsed:
+            return self._parsed[key]
+        start, end = self._index[key]
+        with open(self.filename, "rb") as f:
+            f.seek(start)
+            value = json.loads(f.read(end - start))
+        self._parsed[key] = value
+        return value
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+
+def load_key_index(filename):
+    """
+    Return key -> (start, end) byte ranges, using the sidecar index when current.
+
+    Args:
+        filename (str): Path of the JSON questions file.
+
+    Returns:
+        dict: Byte range of every top-level value, in file order.
+    """
+    stat = os.stat(filename)
+    signature = [stat.st_size, stat.st_mtime_ns]
+    sidecar = filename + SIDECAR_SUFFIX
+
+    try:
+        with open(sidecar, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("signature") == signature:
+            return {key: tuple(span) for key, span in cached["keys"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    index = scan_key_index(filename)
+
+    try:
+        with open(sidecar + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"signature": signature, "keys": [[k, list(v)] for k, v in index.items()]}, f)
+        os.replace(sidecar + ".tmp", sidecar)
+    except OSError:
+        pass  # read-only location; the scan simply runs again next time
+
+    return index
+
+
+def scan_key_index(filename):
+    """
+    Find the byte range of every top-level value without parsing the values.
+
+    Args:
+        filename (str): Path of the JSON questions file.
+
+    Returns:
+        dict: Key -> (start, end) byte offsets, in file order.
+
+    Raises:
+        ValueError: If the top level is not a well-formed JSON object.
+    """
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError("JSON must contain key-value pairs.")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _scan(data)
+
+
+def _scan(data):
+    index = {}
+    pos = _skip_ws(data, 0)
+    if data[pos:pos + 1] == b"\xef":
+        pos = _skip_ws(data, pos + 3)  # UTF-8 BOM
+    if data[pos:pos + 1] != b"{":
+        raise ValueError("JSON must contain key-value pairs.")
+    pos = _skip_ws(data, pos + 1)
+
+    if data[pos:pos + 1] == b"}":
+        return index
+
+    while True:
+        match = _STRING.match(data, pos)
+        if match is None:
+            raise ValueError(f"Expected a key at byte {pos}")
+        key = json.loads(match.group())
+        pos = _skip_ws(data, match.end())
+        if data[pos:pos + 1] != b":":
+            raise ValueError(f"Expected ':' at byte {pos}")
+        start = _skip_ws(data, pos + 1)
+        end = _value_end(data, start)
+        index[key] = (start, end)
+
+        pos = _skip_ws(data, end)
+        token = data[pos:pos + 1]
+        if token == b"}":
+            return index
+        if token != b",":
+            raise ValueError(f"Expected ',' or '}}' at byte {pos}")
+        pos = _skip_ws(data, pos + 1)
+
+
+def _skip_ws(data, pos):
+    return _WS.match(data, pos).end()
+
+
+def _value_end(data, start):
+    """Return the offset just past the JSON value starting at ``start``."""
+    first = data[start:start + 1]
+    if first == b'"':
+        match = _STRING.match(data, start)
+        if match is None:
+            raise ValueError(f"Unterminated string at byte {start}")
+        return match.end()
+
+    if first not in (b"[", b"{"):
+        match = _SCALAR.match(data, start)
+        if match is None:
+            raise ValueError(f"Expected a value at byte {start}")
+        return match.end()
+
+    depth = 0
+    pos = start
+    while True:
+        match = _STRUCTURE.search(data, pos)
+        if match is None:
+            raise ValueError(f"Unterminated value starting at byte {start}")
+        token = match.group()
+        if token == b'"':
+            string = _STRING.match(data, match.start())
+            if string is None:
+                raise ValueError(f"Unterminated string at byte {match.start()}")
+            pos = string.end()
+            continue
+        pos = match.end()
+        if token in (b"[", b"{"):
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return pos
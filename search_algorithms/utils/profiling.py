@@ -0,0 +1,156 @@
+"""
+Phase timings and opt-in profiling.
+
+Every search run through the CLI is split into phases timed with
+``time.perf_counter_ns``:
+
+    sort     building (or fetching) the sorted index
+    build    building (or fetching) the hash index
+    search   the search itself, including trace recording
+    render   formatting and writing the step explanation
+    persist  writing the trace file and the result record
+
+A ``PhaseTimer`` collects the phases of one result and turns them into
+record fields (``timings_ns``, plus ``peak_memory_bytes`` while tracemalloc
+is on). Every phase is also added to process-wide totals, which
+``--profile`` prints at exit together with the top cProfile entries.
+"""
+
+import atexit
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+PHASES = ("sort", "build", "search", "render", "persist")
+
+# Number of cProfile rows printed by --profile
+PROFILE_ROWS = 25
+
+# phase -> [calls, total nanoseconds]
+_totals = {}
+_profiler = None
+
+
+class PhaseTimer:
+    """
+    Per-result phase timings.
+
+    Attributes:
+        timings (dict): Phase name -> nanoseconds.
+    """
+
+    __slots__ = ("timings",)
+
+    def __init__(self):
+        self.timings = {}
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+    @contextmanager
+    def phase(self, name):
+        """Time the body of a ``with`` block as phase ``name``."""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter_ns() - start)
+
+    def add(self, name, nanoseconds):
+        """Add an externally measured duration to phase ``name``."""
+        self.timings[name] = self.timings.get(name, 0) + nanoseconds
+        record_phase(name, nanoseconds)
+
+    def fields(self):
+        """
+        Result-record fields for the phases timed so far.
+
+        Returns:
+            dict: ``timings_ns`` and, while tracemalloc is tracing,
+                ``peak_memory_bytes`` since the timer was created.
+        """
+        fields = {"timings_ns": dict(self.timings)}
+        if tracemalloc.is_tracing():
+            fields["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        return fields
+
+
+def record_phase(name, nanoseconds):
+    """Add one timed phase to the process-wide totals."""
+    entry = _totals.get(name)
+    if entry is None:
+        _totals[name] = [1, nanoseconds]
+    else:
+        entry[0] += 1
+        entry[1] += nanoseconds
+
+
+def phase_totals():
+    """
+    Return the process-wide phase totals.
+
+    Returns:
+        dict: Phase name -> (calls, total nanoseconds).
+    """
+    return {name: tuple(entry) for name, entry in _totals.items()}
+
+
+def start_profiling(memory=False, report=True):
+    """
+    Turn on cProfile (and optionally tracemalloc) for the rest of the run.
+
+    Args:
+        memory (bool): Also trace allocations, so results record peak memory.
+        report (bool): Print ``print_profile`` when the process exits.
+    """
+    global _profiler
+    import cProfile
+
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if _profiler is None:
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+        if report:
+            atexit.register(print_profile)
+
+
+def print_profile(file=None, rows=PROFILE_ROWS):
+    """
+    Print the per-phase breakdown and the top cProfile entries.
+
+    Args:
+        file: Stream to write to (default: stdout).
+        rows (int): Number of cProfile rows (by cumulative time).
+    """
+    global _profiler
+    out = file or sys.stdout
+    if _profiler is not None:
+        _profiler.disable()
+    import pstats
+
+    out.write("\n" + "-"*60 + "\n")
+    out.write(" PROFILE: TIME PER PHASE\n")
+    out.write("-"*60 + "\n")
+    if not _totals:
+        out.write("  No searches were timed.\n")
+    else:
+        grand = sum(total for _, total in _totals.values()) or 1
+        out.write(f"  {'Phase':<10} {'Calls':>7} {'Total ms':>11} {'Mean us':>11} {'Share':>7}\n")
+        ordered = sorted(_totals, key=lambda p: PHASES.index(p) if p in PHASES else len(PHASES))
+        for name in ordered:
+            calls, total = _totals[name]
+            out.write(f"  {name:<10} {calls:>7} {total / 1e6:>11.3f} "
+                      f"{total / calls / 1e3:>11.2f} {total / grand:>7.1%}\n")
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        out.write(f"  Traced memory: {current / 1024:.1f} KiB now, {peak / 1024:.1f} KiB peak\n")
+
+    if _profiler is not None:
+        out.write("-"*60 + "\n")
+        out.write(f" PROFILE: cProfile (top {rows} by cumulative time)\n")
+        out.write("-"*60 + "\n")
+        stats = pstats.Stats(_profiler, stream=out)
+        stats.strip_dirs().sort_stats("cumulative").print_stats(rows)
+        _profiler = None
+    out.flush()
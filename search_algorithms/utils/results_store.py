@@ -0,0 +1,368 @@
+"""
+Append-only JSON Lines store for search results.
+
+Each search result is one JSON object on its own line, so logging a run is a
+single append instead of a read-modify-write of the whole history.
+"""
+
+import atexit
+import json
+import os
+
+# Default paths
+RESULTS_FILE = "results.jsonl"
+LEGACY_RESULTS_FILE = "results.json"
+
+# fsync the log after this many appended records (and always on close)
+FSYNC_EVERY = 32
+
+# Block size used when scanning the file backwards from the end
+_TAIL_BLOCK = 64 * 1024
+
+
+class ResultsStore:
+    """
+    Append-only results log stored as JSON Lines.
+
+    Appends go through one long-lived file handle. Every write is flushed to
+    the OS straight away, but ``os.fsync`` is only issued every
+    ``fsync_every`` records and when the store is closed.
+    """
+
+    def __init__(self, path=RESULTS_FILE, legacy_path=LEGACY_RESULTS_FILE,
+                 fsync_every=FSYNC_EVERY):
+        """
+        Args:
+            path (str): Path of the JSON Lines results file.
+            legacy_path (str): Path of the old list-format results.json to
+                migrate from, or None to skip migration.
+            fsync_every (int): Number of appends between fsyncs.
+        """
+        self.path = path
+        self.legacy_path = legacy_path
+        self.fsync_every = max(1, int(fsync_every))
+        self._handle = None
+        self._unsynced = 0
+        self._migrated = False
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, entry):
+        """
+        Append one result entry to the log.
+
+        Args:
+            entry (dict): JSON-serialisable result record.
+        """
+        self.append_many([entry])
+
+    def append_many(self, entries):
+        """
+        Append several result entries with a single write.
+
+        Args:
+            entries (iterable): JSON-serialisable result records.
+
+        Returns:
+            int: Number of entries written.
+        """
+        lines = [_encode(entry) for entry in entries]
+        if not lines:
+            return 0
+
+        handle = self._open()
+        handle.write(b"".join(lines))
+        handle.flush()
+
+        self._unsynced += len(lines)
+        if self._unsynced >= self.fsync_every:
+            self.sync()
+        return len(lines)
+
+    def flush(self):
+        """Hand buffered appends to the OS so other readers can see them."""
+        if self._handle is not None and not self._handle.closed:
+            self._handle.flush()
+
+    def sync(self):
+        """Force buffered appends to disk."""
+        if self._handle is not None and not self._handle.closed:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        """Sync and close the append handle (it is reopened on demand)."""
+        if self._handle is not None and not self._handle.closed:
+            self.sync()
+            self._handle.close()
+        self._handle = None
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def exists(self):
+        """Return True if there is a results log (or a legacy one to migrate)."""
+        self.migrate_legacy()
+        return os.path.exists(self.path)
+
+    def __iter__(self):
+        """Yield result entries from oldest to newest without loading the file."""
+        self.migrate_legacy()
+        if self._handle is not None:
+            self._handle.flush()
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "rb") as f:
+            for line in f:
+                entry = _decode(line)
+                if entry is not None:
+                    yield entry
+
+    def iter_reversed(self):
+        """
+        Yield result entries from newest to oldest.
+
+        The file is read backwards in fixed-size blocks, so memory use does
+        not depend on the size of the history.
+        """
+        self.migrate_legacy()
+        if self._handle is not None:
+            self._handle.flush()
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "rb") as f:
+            end = f.seek(0, os.SEEK_END)
+            while end > 0:
+                start = _line_start(f, end)
+                f.seek(start)
+                entry = _decode(f.read(end - start))
+                end = start
+                if entry is not None:
+                    yield entry
+
+    def iter_from(self, offset=0):
+        """
+        Yield records starting at a byte offset, with their positions.
+
+        Args:
+            offset (int): Offset of the first line to read (a line start).
+
+        Yields:
+            tuple: (line start offset, line length in bytes, entry dict)
+        """
+        self.migrate_legacy()
+        self.flush()
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                entry = _decode(line)
+                if entry is not None:
+                    yield offset, len(line), entry
+                offset += len(line)
+
+    def read_at(self, offset, length):
+        """
+        Decode the record stored at a known position.
+
+        Returns:
+            dict or None: The entry, or None if the bytes are not a record.
+        """
+        self.flush()
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                return _decode(f.read(length))
+        except OSError:
+            return None
+
+    def size(self):
+        """Return the size of the log in bytes (0 if it does not exist)."""
+        self.migrate_legacy()
+        self.flush()
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def count(self):
+        """
+        Count entries by counting line terminators block by block.
+
+        Returns:
+            int: Number of records in the log.
+        """
+        self.migrate_legacy()
+        if self._handle is not None:
+            self._handle.flush()
+        if not os.path.exists(self.path):
+            return 0
+
+        total = 0
+        last = b"\n"
+        with open(self.path, "rb") as f:
+            while True:
+                block = f.read(_TAIL_BLOCK)
+                if not block:
+                    break
+                total += block.count(b"\n")
+                last = block[-1:]
+        # A final record without a trailing newline still counts
+        if last != b"\n":
+            total += 1
+        return total
+
+    # ------------------------------------------------------------------
+    # Tail truncation
+    # ------------------------------------------------------------------
+
+    def pop_last(self):
+        """
+        Remove the newest entry by truncating the file at the start of its line.
+
+        Only the tail of the file is read; nothing is rewritten.
+
+        Returns:
+            dict or None: The removed entry, or None if the log is empty.
+        """
+        self.migrate_legacy()
+        self.close()
+        if not os.path.exists(self.path):
+            return None
+
+        with open(self.path, "rb+") as f:
+            end = f.seek(0, os.SEEK_END)
+            while end > 0:
+                start = _line_start(f, end)
+                f.seek(start)
+                line = f.read(end - start)
+                f.seek(start)
+                f.truncate()
+                end = start
+                entry = _decode(line)
+                if entry is not None:
+                    f.flush()
+                    os.fsync(f.fileno())
+                    return entry
+        return None
+
+    # ------------------------------------------------------------------
+    # Legacy migration
+    # ------------------------------------------------------------------
+
+    def migrate_legacy(self):
+        """
+        Convert an old list-format results.json into the JSON Lines log once.
+
+        The legacy file is renamed to ``<name>.migrated`` afterwards so the
+        conversion never runs twice.
+
+        Returns:
+            int: Number of entries migrated (0 if nothing to do).
+        """
+        if self._migrated:
+            return 0
+        self._migrated = True
+
+        legacy = self.legacy_path
+        if not legacy or os.path.exists(self.path) or not os.path.exists(legacy):
+            return 0
+
+        try:
+            with open(legacy, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Warning: Could not migrate '{legacy}': {e}")
+            return 0
+
+        if not isinstance(data, list):
+            return 0
+
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(b"".join(_encode(entry) for entry in data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        os.replace(legacy, legacy + ".migrated")
+        return len(data)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _open(self):
+        if self._handle is None or self._handle.closed:
+            self.migrate_legacy()
+            self._handle = open(self.path, "ab")
+        return self._handle
+
+
+def _encode(entry):
+    """Serialise one entry as a compact JSON line."""
+    return (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _decode(line):
+    """Parse one JSON line, skipping blanks and torn writes."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _line_start(f, end):
+    """
+    Find the offset where the line ending at ``end`` starts.
+
+    Args:
+        f: Binary file opened for reading.
+        end (int): Offset just past the line (a trailing newline is ignored).
+
+    Returns:
+        int: Offset of the first byte of that line.
+    """
+    pos = end
+    # Skip the line's own terminator
+    f.seek(pos - 1)
+    if f.read(1) == b"\n":
+        pos -= 1
+
+    while pos > 0:
+        block_start = max(0, pos - _TAIL_BLOCK)
+        f.seek(block_start)
+        block = f.read(pos - block_start)
+        nl = block.rfind(b"\n")
+        if nl != -1:
+            return block_start + nl + 1
+        pos = block_start
+    return 0
+
+
+_default_store = None
+
+
+def get_store():
+    """
+    Return the process-wide results store, creating it on first use.
+
+    Returns:
+        ResultsStore: Store for the default results file.
+    """
+    global _default_store
+    if _default_store is None:
+        _default_store = ResultsStore()
+        atexit.register(_default_store.close)
+    return _default_store
@@ -0,0 +1,57 @@
+"""
+On-disk storage for recorded step traces.
+
+Each trace is one small binary file named after the result id it belongs to,
+so the results log only stores the id and the file name.
+"""
+
+import os
+
+# Default location (relative to the working directory)
+TRACE_DIR = "traces"
+TRACE_SUFFIX = ".trace"
+
+
+def trace_path(result_id, trace_dir=TRACE_DIR):
+    """Return the file path used for a result's trace."""
+    return os.path.join(trace_dir, f"{result_id}{TRACE_SUFFIX}")
+
+
+def save_trace(result_id, data, trace_dir=TRACE_DIR):
+    """
+    Write a serialised trace for a result.
+    
+    Args:
+        result_id (str): Id of the result record.
+        data (bytes): Serialised trace (``TraceRecorder.to_bytes()``).
+        trace_dir (str): Directory for trace files.
+        
+    Returns:
+        str or None: Path written, or None if the write failed.
+    """
+    path = trace_path(result_id, trace_dir)
+    try:
+        os.makedirs(trace_dir, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+    except OSError as e:
+        print(f"Warning: Could not save trace: {e}")
+        return None
+    return path
+
+
+def load_trace(path):
+    """
+    Read a serialised trace.
+    
+    Args:
+        path (str): Trace file path (as stored in the result record).
+        
+    Returns:
+        bytes or None: The trace, or None if it is missing.
+    """
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None